@@ -3,6 +3,14 @@ let is_translation_enabled = false;
 let last_highlighted_element = null;
 let translating = false;
 
+const MAX_CONCURRENT_TRANSLATIONS = 6;
+const MAX_SEGMENT_TOKENS = 800;
+const MIN_SEGMENT_TOKENS = 20;
+// Matching selection text to text nodes looks this far ahead for text it did not find in place
+const MIN_RESYNC_LENGTH = 4;
+const RESYNC_WINDOW = 256;
+const HIDDEN_TEXT_TAGS = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'TEXTAREA']);
+
 const LANGUAGES = {
   ko: '한국어',
   en: 'English',
@@ -34,7 +42,7 @@ chrome.runtime.onMessage.addListener((message) => {
   }
 });
 
-const translateText = async function (text, api_key, target_lang) {
+const translateText = async function (text, api_key, target_lang, on_progress) {
   const response = await fetch('https://api.openai.com/v1/chat/completions', {
     method: 'POST',
     headers: {
@@ -53,13 +61,49 @@ const translateText = async function (text, api_key, target_lang) {
           content: text,
         },
       ],
+      stream: !!on_progress,
     }),
   });
-  const data = await response.json();
-  if (!response.ok) {
-    throw new Error(data.error?.message || 'Translation failed');
+  if (!response.ok || !on_progress) {
+    const data = await response.json();
+    if (!response.ok) {
+      throw new Error(data.error?.message || 'Translation failed');
+    }
+    const translated_text = data.choices[0].message.content.trim();
+    return translated_text;
+  }
+
+  // Server-sent events, one "data: <json>" line per chunk
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+  let translated_text = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) {
+      break;
+    }
+    buffer += value;
+    const lines = buffer.split('\n');
+    buffer = lines.pop();
+    for (const line of lines) {
+      if (!line.startsWith('data:')) {
+        continue;
+      }
+      const payload = line.slice(5).trim();
+      if (payload === '[DONE]') {
+        continue;
+      }
+      const delta = JSON.parse(payload).choices[0]?.delta?.content;
+      if (delta) {
+        translated_text += delta;
+        on_progress(translated_text);
+      }
+    }
+  }
+  translated_text = translated_text.trim();
+  if (!translated_text) {
+    throw new Error('Translation failed');
   }
-  const translated_text = data.choices[0].message.content.trim();
   return translated_text;
 };
 
@@ -131,6 +175,297 @@ document.addEventListener('mouseup', (event) => {
   }
 });
 
+async function runWithConcurrency(items, limit, task) {
+  let next_index = 0;
+  const runNext = async () => {
+    while (next_index < items.length) {
+      const index = next_index++;
+      await task(items[index], index);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, runNext));
+}
+
+function estimateTokens(text) {
+  // About four characters per token for ASCII, about one per character otherwise
+  let ascii_count = 0;
+  for (let i = 0; i < text.length; i++) {
+    if (text.charCodeAt(i) < 128) {
+      ascii_count++;
+    }
+  }
+  return Math.ceil(ascii_count / 4) + (text.length - ascii_count);
+}
+
+// Split paragraphs above MAX_SEGMENT_TOKENS at sentence boundaries and merge runs of
+// adjacent paragraphs below MIN_SEGMENT_TOKENS. Every segment keeps the insertion
+// point of the paragraph it ends in; the pieces of a split paragraph share one.
+function segmentParagraphs(paragraphs, insertion_points) {
+  const segments = [];
+  let merged = null;
+  const flushMerged = () => {
+    if (merged) {
+      segments.push(merged);
+      merged = null;
+    }
+  };
+  paragraphs.forEach((paragraph, i) => {
+    const tokens = estimateTokens(paragraph);
+    if (tokens > MAX_SEGMENT_TOKENS) {
+      flushMerged();
+      splitParagraph(paragraph).forEach((text, piece_index) => {
+        segments.push({ text, insertion_point: insertion_points[i], continuation: piece_index > 0 });
+      });
+    } else if (tokens < MIN_SEGMENT_TOKENS) {
+      if (merged && merged.tokens + tokens <= MAX_SEGMENT_TOKENS) {
+        merged.text += `\n${paragraph}`;
+        merged.tokens += tokens;
+        merged.insertion_point = insertion_points[i];
+      } else {
+        flushMerged();
+        merged = { text: paragraph, tokens, insertion_point: insertion_points[i], continuation: false };
+      }
+    } else {
+      flushMerged();
+      segments.push({ text: paragraph, insertion_point: insertion_points[i], continuation: false });
+    }
+  });
+  flushMerged();
+  return segments;
+}
+
+function splitParagraph(paragraph) {
+  const sentences = paragraph.match(/[^.!?。！？]+(?:[.!?。！？]+["'”’)\]]*|$)\s*/g) || [paragraph];
+  const pieces = [];
+  let piece = '';
+  let piece_tokens = 0;
+  for (const sentence of sentences) {
+    // A sentence above the budget on its own is cut between words
+    const parts = estimateTokens(sentence) > MAX_SEGMENT_TOKENS ? splitAtWords(sentence) : [sentence];
+    for (const part of parts) {
+      const tokens = estimateTokens(part);
+      if (piece && piece_tokens + tokens > MAX_SEGMENT_TOKENS) {
+        pieces.push(piece.trim());
+        piece = '';
+        piece_tokens = 0;
+      }
+      piece += part;
+      piece_tokens += tokens;
+    }
+  }
+  if (piece.trim()) {
+    pieces.push(piece.trim());
+  }
+  return pieces;
+}
+
+function splitAtWords(text) {
+  const parts = [];
+  let part = '';
+  let part_tokens = 0;
+  for (const word of text.split(/(?<=\s)/)) {
+    // Text without spaces is cut every MAX_SEGMENT_TOKENS characters, at most one token each
+    const chunks = [];
+    for (let start = 0; start < word.length; start += MAX_SEGMENT_TOKENS) {
+      chunks.push(word.slice(start, start + MAX_SEGMENT_TOKENS));
+    }
+    for (const chunk of chunks) {
+      const tokens = estimateTokens(chunk);
+      if (part && part_tokens + tokens > MAX_SEGMENT_TOKENS) {
+        parts.push(part);
+        part = '';
+        part_tokens = 0;
+      }
+      part += chunk;
+      part_tokens += tokens;
+    }
+  }
+  if (part) {
+    parts.push(part);
+  }
+  return parts;
+}
+
+// DOM writes wait for the next animation frame and are applied together, so that a page
+// full of results costs one style and layout pass per frame instead of one per result
+const render_inserts = [];
+// Only the latest text of each result element within a frame is written
+const render_texts = new Map();
+let render_frame = 0;
+
+function scheduleRender() {
+  if (!render_frame) {
+    render_frame = requestAnimationFrame(flushRender);
+  }
+}
+
+function queueResultText(result_element, text) {
+  render_texts.set(result_element, text);
+  scheduleRender();
+}
+
+function flushRender() {
+  render_frame = 0;
+  // Results for the same insertion point go in with a single fragment
+  for (let i = 0; i < render_inserts.length; ) {
+    const { parent, next_sibling } = render_inserts[i];
+    const fragment = document.createDocumentFragment();
+    for (
+      ;
+      i < render_inserts.length &&
+      render_inserts[i].parent === parent &&
+      render_inserts[i].next_sibling === next_sibling;
+      i++
+    ) {
+      fragment.appendChild(render_inserts[i].container);
+    }
+    // The page may have moved the node since the result was queued
+    parent.insertBefore(fragment, next_sibling?.parentNode === parent ? next_sibling : null);
+  }
+  for (const [result_element, text] of render_texts) {
+    result_element.textContent = text;
+  }
+  render_inserts.length = 0;
+  render_texts.clear();
+}
+
+function insertResultElement(parent, next_sibling, continuation = false) {
+  const result_element = document.createElement('span');
+  result_element.textContent = 'Translating...';
+  result_element.style.cssText = `
+      color: #666;
+      margin-top: 0.5em;
+      margin-bottom: 0.5em;
+      white-space: pre-line;
+    `;
+  const container = document.createElement('span');
+  container.className = 's-tran-result';
+  // The pieces of a split paragraph follow each other on the same line
+  container.appendChild(continuation ? document.createTextNode(' ') : document.createElement('br'));
+  container.appendChild(result_element);
+  render_inserts.push({ parent, next_sibling, container });
+  scheduleRender();
+  return result_element;
+}
+
+// Whitespace, soft hyphens and zero-width characters, which the selection text and the DOM text may disagree on
+function isIgnoredCharacter(code) {
+  if (code > 32 && code < 0xa0) {
+    return false;
+  }
+  return (
+    code <= 32 ||
+    code === 0xa0 ||
+    code === 0xad ||
+    code === 0x1680 ||
+    (code >= 0x2000 && code <= 0x200d) ||
+    code === 0x2028 ||
+    code === 0x2029 ||
+    code === 0x202f ||
+    code === 0x205f ||
+    code === 0x3000 ||
+    code === 0xfeff
+  );
+}
+
+function hasComparableText(text, start) {
+  for (let i = start; i < text.length; i++) {
+    if (!isIgnoredCharacter(text.charCodeAt(i))) {
+      return true;
+    }
+  }
+  return false;
+}
+
+// Reduce text to the lowercase characters that the selection text and the DOM text agree on
+function compactText(text) {
+  let lower = text.toLowerCase();
+  if (lower.length !== text.length) {
+    // A few characters lowercase to more than one, keep the offsets of the original ones
+    lower = Array.from(text, (char) => char.toLowerCase()[0]).join('');
+  }
+  const parts = [];
+  // Offsets in 'text' right after each kept character
+  const offsets = new Uint32Array(text.length);
+  let length = 0;
+  let run_start = -1;
+  for (let i = 0; i <= lower.length; i++) {
+    if (i < lower.length && !isIgnoredCharacter(lower.charCodeAt(i))) {
+      offsets[length++] = i + 1;
+      if (run_start < 0) {
+        run_start = i;
+      }
+    } else if (run_start >= 0) {
+      parts.push(lower.slice(run_start, i));
+      run_start = -1;
+    }
+  }
+  return { text: parts.join(''), offsets: offsets.subarray(0, length) };
+}
+
+// Find the point right after each paragraph's last text in the DOM, in one pass over the text nodes
+function findParagraphInsertionPoints(root, paragraphs) {
+  const paragraph_ends = [];
+  let expected = '';
+  for (const paragraph of paragraphs) {
+    expected += compactText(paragraph).text;
+    paragraph_ends.push(expected.length);
+  }
+
+  const points = [];
+  let last_point = null;
+  let position = 0;
+  const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, (node) =>
+    HIDDEN_TEXT_TAGS.has(node.parentNode?.nodeName) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT,
+  );
+  let node = root.nodeType === Node.TEXT_NODE ? root : walker.nextNode();
+  for (; node && points.length < paragraphs.length; node = walker.nextNode()) {
+    const { text, offsets } = compactText(node.data);
+    if (!text) {
+      continue;
+    }
+    let start = position;
+    if (!expected.startsWith(text, start)) {
+      // Look a little further ahead in case the selection text has text without a text node of its own
+      const found =
+        text.length < MIN_RESYNC_LENGTH ? -1 : expected.slice(start, start + RESYNC_WINDOW + text.length).indexOf(text);
+      if (found < 0) {
+        // Text that is not in the selection text, like hidden elements
+        continue;
+      }
+      start += found;
+    }
+    position = start + text.length;
+    // Paragraphs that were skipped over go after the text before them
+    while (points.length < paragraphs.length && paragraph_ends[points.length] <= start) {
+      points.push(last_point);
+    }
+    while (points.length < paragraphs.length && paragraph_ends[points.length] <= position) {
+      points.push({ node, offset: offsets[paragraph_ends[points.length] - start - 1] });
+    }
+    last_point = { node, offset: node.data.length };
+  }
+  while (points.length < paragraphs.length) {
+    points.push(last_point);
+  }
+
+  // Split text nodes that go on after a paragraph, from the back so that earlier offsets stay valid
+  const insertion_points = new Array(points.length);
+  for (let i = points.length - 1; i >= 0; i--) {
+    if (!points[i]) {
+      insertion_points[i] =
+        root.nodeType === Node.TEXT_NODE
+          ? { parent: root.parentNode, next_sibling: root.nextSibling }
+          : { parent: root, next_sibling: null };
+      continue;
+    }
+    const { node, offset } = points[i];
+    const next_sibling = hasComparableText(node.data, offset) ? node.splitText(offset) : node.nextSibling;
+    insertion_points[i] = { parent: node.parentNode, next_sibling };
+  }
+  return insertion_points;
+}
+
 async function handleTranslate() {
   if (!is_translation_enabled || translating) {
     return;
@@ -160,63 +495,25 @@ async function handleTranslate() {
       .split(/\n+/)
       .map((p) => p.trim())
       .filter((p) => p);
-    const paragraph_nodes = [];
-    const paragraph_node_next_siblings = [];
-
-    // Find last text nodes that contain the paragraph text
-    let paragraph_index = 0;
-    let remain_paragraph_text = paragraphs[paragraph_index];
-    const walker = document.createTreeWalker(common_ancestor, NodeFilter.SHOW_TEXT, () => NodeFilter.FILTER_ACCEPT);
-    let node;
-    while ((node = walker.nextNode())) {
-      const lines = node.textContent
-        .trim()
-        .split(/\n+/)
-        .map((p) => p.trim())
-        .filter((p) => p);
-      for (const line of lines) {
-        if (line && remain_paragraph_text.startsWith(line)) {
-          remain_paragraph_text = remain_paragraph_text.slice(line.length).trim();
-          if (remain_paragraph_text.length === 0) {
-            paragraph_nodes.push(node);
-            paragraph_node_next_siblings.push(node.nextSibling);
-            paragraph_index++;
-            remain_paragraph_text = paragraphs[paragraph_index];
-          }
-        }
-      }
-    }
-    while (paragraph_index < paragraphs.length) {
-      paragraph_nodes.push(range.endContainer);
-      paragraph_node_next_siblings.push(range.endContainer.nextSibling);
-      paragraph_index++;
-    }
     selection.removeAllRanges();
 
-    for (let i = 0; i < paragraphs.length; i++) {
-      let result_element;
+    const segments = segmentParagraphs(paragraphs, findParagraphInsertionPoints(common_ancestor, paragraphs));
+
+    // Insert every placeholder up front and fill each one in as its translation arrives
+    const result_elements = segments.map(({ insertion_point, continuation }) =>
+      insertResultElement(insertion_point.parent, insertion_point.next_sibling, continuation),
+    );
+
+    await runWithConcurrency(segments, MAX_CONCURRENT_TRANSLATIONS, async ({ text }, i) => {
       try {
-        const paragraph = paragraphs[i];
-        const paragraph_node = paragraph_nodes[i];
-        const paragraph_node_next_sibling = paragraph_node_next_siblings[i];
-
-        result_element = document.createElement('span');
-        result_element.textContent = 'Translating...';
-        result_element.style.cssText = `
-            color: #666;
-            margin-top: 0.5em;
-            margin-bottom: 0.5em;
-          `;
-        const container = document.createElement('span');
-        container.appendChild(document.createElement('br'));
-        container.appendChild(result_element);
-        paragraph_node.parentNode.insertBefore(container, paragraph_node_next_sibling);
-
-        result_element.textContent = await translateText(paragraph, api_key, target_lang);
+        const translated_text = await translateText(text, api_key, target_lang, (partial_text) =>
+          queueResultText(result_elements[i], partial_text),
+        );
+        queueResultText(result_elements[i], translated_text);
       } catch (error) {
-        result_element.textContent = `Translation error: ${error.message}`;
+        queueResultText(result_elements[i], `Translation error: ${error.message}`);
       }
-    }
+    });
   } catch (error) {
     alert(`Translation error: ${error.message}`);
   } finally {
@@ -240,31 +537,73 @@ function isInteractiveElement(element) {
   );
 }
 
-document.addEventListener('mousemove', (event) => {
+// Whether an element has text of its own, looked up once per element
+const has_own_text = new WeakMap();
+let hover_target = null;
+let hover_frame = 0;
+
+function hasOwnText(element) {
+  let has_text = has_own_text.get(element);
+  if (has_text === undefined) {
+    // Only direct text children, so large containers never serialize their subtree
+    has_text = false;
+    for (let child = element.firstChild; child; child = child.nextSibling) {
+      if (child.nodeType === Node.TEXT_NODE && /\S/.test(child.data)) {
+        has_text = true;
+        break;
+      }
+    }
+    has_own_text.set(element, has_text);
+  }
+  return has_text;
+}
+
+// Pages fill in elements after they were first hovered, which makes their cached answer stale
+new MutationObserver((mutations) => {
+  for (const mutation of mutations) {
+    has_own_text.delete(mutation.type === 'characterData' ? mutation.target.parentElement : mutation.target);
+  }
+}).observe(document.documentElement, { childList: true, characterData: true, subtree: true });
+
+document.addEventListener(
+  'mousemove',
+  (event) => {
+    // Only the last target of each animation frame matters
+    hover_target = event.target;
+    if (!hover_frame) {
+      hover_frame = requestAnimationFrame(updateHighlight);
+    }
+  },
+  { passive: true },
+);
+
+function updateHighlight() {
+  hover_frame = 0;
   if (!is_translation_enabled || translating) {
     return;
   }
 
-  const target = event.target;
+  const target = hover_target;
   if (last_highlighted_element === target) {
     return;
   }
 
-  removeHighlight();
-
-  // Skip if hovering over the popup or interactive elements
-  if (popup?.contains(target) || isInteractiveElement(target)) {
-    return;
-  }
+  // Skip the popup, interactive elements and elements without text of their own
+  const highlighted =
+    target instanceof Element && !popup?.contains(target) && !isInteractiveElement(target) && hasOwnText(target)
+      ? target
+      : null;
 
-  // Add highlight to current element if it has text
-  if (target.textContent?.trim()) {
-    target.classList.add('s-trans-hoverable');
-    last_highlighted_element = target;
+  // At most one class removal and one addition per frame
+  removeHighlight();
+  if (highlighted) {
+    highlighted.classList.add('s-trans-hoverable');
+    last_highlighted_element = highlighted;
   }
-});
+}
 
 document.addEventListener('mouseleave', () => {
+  hover_target = null;
   removeHighlight();
 });
 
@@ -0,0 +1,524 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QEventLoop
+from PySide6.QtCore import QStandardPaths
+from PySide6.QtCore import QTimer
+import PySide6
+
+WORDS = (
+    "the quick brown fox jumps over lazy dog while translation engines stream"
+    " tokens across pooled connections under realistic page loads and many"
+    " open tabs with paragraphs of varying length"
+).split()
+WORKLOADS = {
+    "1": (1, 1),
+    "50": (1, 50),
+    "1000": (1, 1000),
+    "tabs": (20, 50),
+}
+SAMPLE_INTERVAL_MS = 50
+# pseudo words, so that memory segments have a realistic vocabulary
+MEMORY_WORDS = [
+    a + b + c
+    for a in ("ka", "to", "mi", "re", "su", "no", "bi", "le", "da", "po", "an", "ex")
+    for b in ("ra", "ti", "mo", "ne", "lu", "si", "ko", "pa", "de", "vi", "", "gu")
+    for c in ("n", "s", "t", "", "r", "l", "ng", "x")
+]
+MEMORY_LOOKUPS = 2000
+MEMORY_SCOPE = "ko:benchmark"
+
+
+@dataclass
+class ServerConfig:
+    latency_ms: float = 300.0
+    # sigma of the log-normal latency distribution, 0 for a fixed latency
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    # words per second of every streamed reply, which batches of whole pages make long;
+    # slow enough rates time requests out and measure the fake server instead of us
+    stream_tokens_per_second: float = 2000.0
+    # added to the first response on every connection, like a TLS handshake
+    handshake_ms: float = 0.0
+
+
+class FakeCompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeCompletionServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        time.sleep(self.server.config.handshake_ms / 1000)
+
+    def do_HEAD(self):
+        # what connection warm-ups get, the default error reply would close the connection
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        config = self.server.config
+        time.sleep(self.server.sample_latency())
+
+        if random.random() < config.error_rate:
+            # half throttling, half server errors, both retried by the engine
+            if random.random() < 0.5:
+                self._send_json(
+                    429, {"error": "rate limited"}, {"retry-after-ms": "100"}
+                )
+            else:
+                self._send_json(500, {"error": "server error"})
+            return
+
+        content = body["messages"][-1]["content"]
+        if body.get("response_format", {}).get("type") == "json_object":
+            segments = json.loads(content)["segments"]
+            for segment in segments:
+                segment["text"] = f"T({segment['text']})"
+            content = json.dumps({"segments": segments}, ensure_ascii=False)
+        else:
+            content = f"T({content})"
+        usage = {
+            "prompt_tokens": len(body["messages"][-1]["content"]) // 4,
+            "completion_tokens": len(content) // 4,
+        }
+
+        if body.get("stream"):
+            self._send_stream(content, usage)
+        else:
+            message = {"role": "assistant", "content": content}
+            self._send_json(200, {"choices": [{"message": message}], "usage": usage})
+
+    def _send_json(
+        self, status: int, data: dict, headers: dict[str, str] | None = None
+    ):
+        payload = json.dumps(data, ensure_ascii=False).encode("utf8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_stream(self, content: str, usage: dict):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        delay = 1 / self.server.config.stream_tokens_per_second
+        words = content.split(" ")
+        for i, word in enumerate(words):
+            delta = word if i == len(words) - 1 else word + " "
+            event = {"choices": [{"delta": {"content": delta}}]}
+            self._send_chunk(f"data: {json.dumps(event, ensure_ascii=False)}\n\n")
+            time.sleep(delay)
+        self._send_chunk(f"data: {json.dumps({'choices': [], 'usage': usage})}\n\n")
+        self._send_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_chunk(self, text: str):
+        data = text.encode("utf8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+
+class FakeCompletionServer(ThreadingHTTPServer):
+    daemon_threads = True
+    config: ServerConfig
+
+    def __init__(self, config: ServerConfig):
+        super().__init__(("127.0.0.1", 0), FakeCompletionHandler)
+        self.config = config
+
+    def sample_latency(self) -> float:
+        median = self.config.latency_ms / 1000
+        if self.config.latency_sigma <= 0:
+            return median
+        return random.lognormvariate(0, self.config.latency_sigma) * median
+
+
+def serve(config: ServerConfig, port_queue: multiprocessing.Queue):
+    server = FakeCompletionServer(config)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+def start_server(config: ServerConfig) -> tuple[multiprocessing.Process, int]:
+    # a separate process, so that its threads and memory don't count as ours
+    port_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=serve, args=(config, port_queue), daemon=True
+    )
+    process.start()
+    return process, port_queue.get(timeout=10)
+
+
+def make_paragraphs(count: int, seed: str) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 120)))
+        + f" ({seed} {i})"
+        for i in range(count)
+    ]
+
+
+def make_memory_segment(
+    index: int, variant: int = 0, changed_word: bool = False
+) -> str:
+    # the words depend on 'index' only, the version and date on 'variant' too
+    rng = random.Random(index)
+    words = [rng.choice(MEMORY_WORDS) for _ in range(rng.randint(8, 30))]
+    if changed_word:
+        words[rng.randrange(len(words))] = "changed"
+    numbers = random.Random(f"{index}:{variant}")
+    version = ".".join(str(numbers.randint(0, 20)) for _ in range(3))
+    date = f"2024-{numbers.randint(1, 12):02}-{numbers.randint(1, 28):02}"
+    half = len(words) // 2
+    return (
+        f"{' '.join(words[:half])} version {version} released on {date}"
+        f" {' '.join(words[half:])}"
+    )
+
+
+def run_memory_benchmark(segments: int) -> dict:
+    from translationmemory import TranslationMemory
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "memory.sqlite3")
+        # no eviction, every segment stays to be looked up
+        memory = TranslationMemory(path, max_bytes=sys.maxsize)
+        start = time.perf_counter()
+        for chunk_start in range(0, segments, 10000):
+            memory.add_many(
+                (
+                    (text, f"T({text})")
+                    for text in map(
+                        make_memory_segment,
+                        range(chunk_start, min(segments, chunk_start + 10000)),
+                    )
+                ),
+                MEMORY_SCOPE,
+            )
+        build_time = time.perf_counter() - start
+        size = sum(
+            os.path.getsize(os.path.join(directory, name))
+            for name in os.listdir(directory)
+        )
+
+        rng = random.Random("lookups")
+        queries = {
+            # stored text with another version and date
+            "reuse": lambda: make_memory_segment(rng.randrange(segments), 1),
+            # stored text with one word changed as well
+            "reference": lambda: make_memory_segment(rng.randrange(segments), 1, True),
+            "miss": lambda: make_memory_segment(segments + rng.randrange(segments)),
+        }
+        lookups = {}
+        for kind, make_query in queries.items():
+            texts = [make_query() for _ in range(MEMORY_LOOKUPS)]
+            durations = []
+            found = {"reused": 0, "referenced": 0}
+            for text in texts:
+                start = time.perf_counter()
+                match = memory.lookup(text, MEMORY_SCOPE)
+                durations.append(time.perf_counter() - start)
+                if match is not None:
+                    found["reused" if match.reused_text else "referenced"] += 1
+            lookups[kind] = {
+                **found,
+                "mean": statistics.fmean(durations),
+                "p50": percentile(durations, 0.5),
+                "p99": percentile(durations, 0.99),
+                "max": max(durations),
+            }
+    return {
+        "segments": segments,
+        "build_s": build_time,
+        "size_bytes": size,
+        "lookups": lookups,
+    }
+
+
+def print_memory_results(result: dict):
+    print(
+        f"{result['segments']} segments in {result['build_s']:.1f} s,"
+        f" {result['size_bytes'] / 2**20:.1f} MiB"
+    )
+    print(
+        f"{'lookup':>10} {'reused':>7} {'refs':>7} {'mean us':>8}"
+        f" {'p50 us':>8} {'p99 us':>8} {'max us':>8}"
+    )
+    for kind, lookup in result["lookups"].items():
+        print(
+            f"{kind:>10} {lookup['reused']:>7} {lookup['referenced']:>7}"
+            f" {lookup['mean'] * 1e6:>8.0f} {lookup['p50'] * 1e6:>8.0f}"
+            f" {lookup['p99'] * 1e6:>8.0f} {lookup['max'] * 1e6:>8.0f}"
+        )
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def read_process_status() -> tuple[int, int]:
+    # thread count and resident set size in bytes
+    try:
+        with open("/proc/self/status") as file:
+            fields = dict(line.split(":", 1) for line in file)
+        return int(fields["Threads"]), int(fields["VmRSS"].split()[0]) * 1024
+    except (OSError, KeyError, ValueError):
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return threading.active_count(), rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_workload(name: str, tabs: int, paragraphs: int, run_id: str) -> dict:
+    from translator import TranslatorBridge
+
+    bridges = [TranslatorBridge() for _ in range(tabs)]
+    for bridge in bridges:
+        bridge.set_enabled(True)
+    submitted: dict[tuple[int, int], float] = {}
+    latencies: list[float] = []
+    errors: list[str] = []
+    remaining = tabs * paragraphs
+    loop = QEventLoop()
+    peak_threads, peak_rss = read_process_status()
+
+    def finish(latency: float, error: str):
+        nonlocal remaining
+        latencies.append(latency)
+        if error:
+            errors.append(error)
+        remaining -= 1
+        if remaining == 0:
+            loop.quit()
+
+    def on_results(tab: int, results: list[dict]):
+        for result in results:
+            if "partial_text" in result:
+                continue
+            start = submitted.pop((tab, result["request"]), None)
+            if start is not None:
+                finish(time.perf_counter() - start, result.get("error", ""))
+
+    def sample():
+        nonlocal peak_threads, peak_rss
+        threads, rss = read_process_status()
+        peak_threads = max(peak_threads, threads)
+        peak_rss = max(peak_rss, rss)
+
+    sampler = QTimer()
+    sampler.timeout.connect(sample)
+    sampler.start(SAMPLE_INTERVAL_MS)
+
+    start = time.perf_counter()
+    for tab, bridge in enumerate(bridges):
+        bridge.translationResults.connect(partial(on_results, tab))
+        texts = make_paragraphs(paragraphs, f"{run_id} {name} {tab}")
+        # the first screenful is visible, the rest of the page is further down
+        priorities = [0 if i < 10 else 2 for i in range(len(texts))]
+        submit_time = time.perf_counter()
+        response = bridge.translateBatch(texts, priorities)
+        for result in response.get("results", []):
+            if "request" in result:
+                submitted[(tab, result["request"])] = submit_time
+            else:
+                finish(0.0, result.get("error", ""))
+    if remaining:
+        loop.exec()
+    elapsed = time.perf_counter() - start
+    sampler.stop()
+    sample()
+
+    return {
+        "workload": name,
+        "tabs": tabs,
+        "paragraphs": tabs * paragraphs,
+        "errors": len(errors),
+        "elapsed_s": elapsed,
+        "throughput_per_s": tabs * paragraphs / elapsed,
+        "latency_s": {
+            "mean": statistics.fmean(latencies),
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "max": max(latencies),
+        },
+        "peak_threads": peak_threads,
+        "peak_rss_bytes": peak_rss,
+    }
+
+
+def configure(port: int, args: argparse.Namespace):
+    from settings import (
+        get_settings,
+        API_KEY,
+        BACKENDS,
+        LANGUAGE_BACKENDS,
+        MAX_CONCURRENT_REQUESTS,
+        STREAM_TRANSLATION,
+        TARGET_LANG,
+    )
+
+    settings = get_settings()
+    settings.setValue(API_KEY, "benchmark")
+    settings.setValue(TARGET_LANG, "ko")
+    settings.setValue(MAX_CONCURRENT_REQUESTS, args.concurrency)
+    settings.setValue(STREAM_TRANSLATION, args.stream)
+    backend = {
+        "name": "Benchmark",
+        "type": "openai",
+        "base_url": f"http://127.0.0.1:{port}/v1",
+        "model": "benchmark",
+        "headers": {},
+        "connect_timeout": 10.0,
+        "read_timeout": 60.0,
+    }
+    settings.setValue(BACKENDS, json.dumps([backend]))
+    settings.setValue(LANGUAGE_BACKENDS, json.dumps({"ko": "Benchmark"}))
+
+
+def print_results(config: ServerConfig, results: list[dict]):
+    print(
+        f"fake server: {config.latency_ms:.0f} ms latency (sigma {config.latency_sigma}),"
+        f" {config.stream_tokens_per_second:.0f} words/s streamed,"
+        f" {config.error_rate:.0%} errors, {config.handshake_ms:.0f} ms handshake"
+    )
+    print(
+        f"{'workload':>10} {'items':>6} {'errors':>6} {'items/s':>9}"
+        f" {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'threads':>7} {'rss MiB':>8}"
+    )
+    for result in results:
+        latency = result["latency_s"]
+        print(
+            f"{result['workload']:>10} {result['paragraphs']:>6} {result['errors']:>6}"
+            f" {result['throughput_per_s']:>9.1f} {latency['p50'] * 1000:>8.0f}"
+            f" {latency['p95'] * 1000:>8.0f} {latency['p99'] * 1000:>8.0f}"
+            f" {result['peak_threads']:>7} {result['peak_rss_bytes'] / 2**20:>8.1f}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the translation engine against a local fake server."
+    )
+    parser.add_argument(
+        "--workloads",
+        default=",".join(WORKLOADS),
+        help=f"comma separated subset of {', '.join(WORKLOADS)}",
+    )
+    parser.add_argument("--tabs", type=int, default=WORKLOADS["tabs"][0])
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--stream", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument(
+        "--tokens-per-second",
+        type=float,
+        default=ServerConfig.stream_tokens_per_second,
+        help="streaming rate of the fake server, in words per second of every reply",
+    )
+    parser.add_argument("--handshake-ms", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=6)
+    parser.add_argument(
+        "--memory-segments",
+        type=int,
+        help="time translation memory lookups with this many stored segments"
+        " instead of running the workloads",
+    )
+    parser.add_argument(
+        "--output", help="write the results as JSON to this file, e.g. to compare runs"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.memory_segments:
+        result = run_memory_benchmark(args.memory_segments)
+        print_memory_results(result)
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(result, file, indent=2)
+        return
+
+    names = [name.strip() for name in args.workloads.split(",") if name.strip()]
+    unknown = [name for name in names if name not in WORKLOADS]
+    if unknown:
+        sys.exit(f"Unknown workloads: {', '.join(unknown)}")
+
+    config = ServerConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        stream_tokens_per_second=args.tokens_per_second,
+        handshake_ms=args.handshake_ms,
+    )
+    server, port = start_server(config)
+
+    # keep the user's settings and translation cache out of it
+    QStandardPaths.setTestModeEnabled(True)
+    app = QCoreApplication([])
+    app.setOrganizationName("sixmen")
+    app.setApplicationName("S-Tran Benchmark")
+    configure(port, args)
+    # paragraphs of earlier runs would be sent along as references of similar text
+    from translationmemory import get_translation_memory
+
+    get_translation_memory().clear()
+
+    run_id = f"{time.time():.0f}"
+    results = []
+    try:
+        for name in names:
+            tabs, paragraphs = WORKLOADS[name]
+            if name == "tabs":
+                tabs = args.tabs
+            results.append(run_workload(name, tabs, paragraphs, run_id))
+    finally:
+        server.terminate()
+    print_results(config, results)
+
+    if args.output:
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "pyside": PySide6.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "server": asdict(config),
+            "concurrency": args.concurrency,
+            "stream": args.stream,
+            "results": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,80 @@
 from __future__ import annotations
+import json
 
 from PySide6.QtWebEngineCore import QWebEngineProfile
-from PySide6.QtWebEngineCore import QWebEngineScript
 from PySide6.QtCore import QObject
 
 from browserwindow import BrowserWindow
-from translator import qwebchannel_script, translator_script
+from browserwebview import BrowserWebView
+from settings import get_settings, SESSION
+from tablifecyclemanager import TabLifecycleManager
 
 
 class Browser(QObject):
     _windows: list[BrowserWindow]
     _profile: QWebEngineProfile | None
+    _tab_lifecycle_manager: TabLifecycleManager
 
     def __init__(self):
         super().__init__()
         self._windows = []
         self._profile = None
+        self._tab_lifecycle_manager = TabLifecycleManager(self)
 
-    def create_window(self):
-        profile = self._profile
+    def profile(self) -> QWebEngineProfile:
+        # creating the first profile starts the web engine, so it waits for the first tab
         if not self._profile:
-            profile = self._profile = self._create_profile()
+            self._profile = self._create_profile()
+        return self._profile
 
-        new_window = BrowserWindow(self, profile)
-        self._windows.append(new_window)
-        new_window.about_to_close.connect(self._remove_window)
-        new_window.show()
+    def create_window(self, open_tab=True):
+        new_window = BrowserWindow(self, open_tab)
+        self._add_window(new_window)
         return new_window
 
-    def _create_profile(self):
-        profile = QWebEngineProfile("stran")
+    def restore_session(self) -> list[BrowserWindow]:
+        # the tabs are placeholders, so this does not start the web engine
+        try:
+            session = json.loads(get_settings().value(SESSION, "[]"))
+        except (TypeError, ValueError):
+            session = []
+
+        windows = []
+        for state in session:
+            if not state.get("tabs"):
+                continue
+            window = BrowserWindow(self, open_tab=False)
+            window.restore_session_state(state)
+            self._add_window(window)
+            windows.append(window)
+        return windows
+
+    def _add_window(self, window: BrowserWindow):
+        self._windows.append(window)
+        window.about_to_close.connect(self._remove_window)
+        window.show()
 
-        script = QWebEngineScript()
-        script.setSourceCode(qwebchannel_script + translator_script)
-        script.setName("translator.js")
-        script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
-        script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
-        profile.scripts().insert(script)
+    def _save_session(self, windows: list[BrowserWindow]):
+        session = [window.session_state() for window in windows]
+        get_settings().setValue(SESSION, json.dumps(session))
+
+    def _create_profile(self):
+        # translator.js is injected by each BrowserWebView when translation is enabled
+        return QWebEngineProfile("stran")
 
-        return profile
+    def web_views(self) -> list[BrowserWebView]:
+        return [
+            web_view
+            for window in self._windows
+            for web_view in window.tab_widget().web_views()
+        ]
 
     def _remove_window(self):
         w = self.sender()
         if w in self._windows:
+            # closing the last window quits, so its tabs are what gets restored
+            if len(self._windows) == 1:
+                self._save_session(self._windows)
             del self._windows[self._windows.index(w)]
+            if self._windows:
+                self._save_session(self._windows)
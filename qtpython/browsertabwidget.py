@@ -3,8 +3,8 @@ from typing import TYPE_CHECKING, cast
 from functools import partial
 
 from PySide6.QtWebEngineCore import QWebEnginePage
-from PySide6.QtWebEngineCore import QWebEngineProfile
 from PySide6.QtWidgets import QTabWidget
+from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import QUrl
 from PySide6.QtCore import Qt
 from PySide6.QtCore import Signal
@@ -12,21 +12,34 @@ from PySide6.QtCore import Signal
 from browserwebview import BrowserWebView
 
 if TYPE_CHECKING:
+    from browser import Browser
     from browserwindow import BrowserWindow
 
 
+class TabPlaceholder(QWidget):
+    # a restored tab, its web view is created when the tab is first activated
+    url: QUrl
+    title: str
+
+    def __init__(self, url: QUrl, title: str):
+        super().__init__()
+        self.url = url
+        self.title = title
+
+
 class BrowserTabWidget(QTabWidget):
-    _profile: QWebEngineProfile
+    _browser: Browser
     title_changed = Signal(str)
     url_changed = Signal(QUrl)
     close_window = Signal()
     web_action_enabled_changed = Signal(QWebEnginePage.WebAction, bool)
     translation_enabled_changed = Signal(bool)
+    page_translation_progress = Signal(int, int, int)
 
-    def __init__(self, parent: BrowserWindow, profile: QWebEngineProfile):
+    def __init__(self, parent: BrowserWindow, browser: Browser):
         super().__init__(parent)
 
-        self._profile = profile
+        self._browser = browser
 
         tab_bar = self.tabBar()
         tab_bar.setTabsClosable(True)
@@ -38,7 +51,44 @@ class BrowserTabWidget(QTabWidget):
         self.currentChanged.connect(self._handle_current_changed)
 
     def create_tab(self, background=False):
-        web_view = BrowserWebView(self._profile)
+        web_view = self._create_web_view()
+        self.addTab(web_view, "New Tab")
+        if not background:
+            self.setCurrentWidget(web_view)
+        return web_view
+
+    def restore_session_state(self, state: dict):
+        # every tab starts as a placeholder, see load_current_tab()
+        self.blockSignals(True)
+        for tab in state.get("tabs", []):
+            url = QUrl(tab.get("url", ""))
+            title = tab.get("title") or url.toDisplayString() or "New Tab"
+            index = self.addTab(TabPlaceholder(url, title), title)
+            self.setTabToolTip(index, title)
+        self.setCurrentIndex(min(state.get("current", 0), self.count() - 1))
+        self.blockSignals(False)
+
+        current = self.currentWidget()
+        if isinstance(current, TabPlaceholder):
+            self.title_changed.emit(current.title)
+            self.url_changed.emit(current.url)
+
+    def load_current_tab(self):
+        # restored windows leave the current tab unloaded until this is called
+        self._handle_current_changed(self.currentIndex())
+
+    def session_state(self) -> dict:
+        tabs = []
+        for index in range(self.count()):
+            widget = self.widget(index)
+            if isinstance(widget, TabPlaceholder):
+                tabs.append({"url": widget.url.toString(), "title": widget.title})
+            elif isinstance(widget, BrowserWebView):
+                tabs.append({"url": widget.url().toString(), "title": widget.title()})
+        return {"current": self.currentIndex(), "tabs": tabs}
+
+    def _create_web_view(self) -> BrowserWebView:
+        web_view = BrowserWebView(self._browser.profile())
         web_view.titleChanged.connect(partial(self._title_changed, web_view))
         web_view.urlChanged.connect(partial(self._url_changed, web_view))
         web_view.web_action_enabled_changed.connect(
@@ -47,26 +97,54 @@ class BrowserTabWidget(QTabWidget):
         web_view.translation_enabled_changed.connect(
             partial(self._handle_translation_enabled_changed, web_view)
         )
+        web_view.page_translation_progress.connect(
+            partial(self._handle_page_translation_progress, web_view)
+        )
         web_page = web_view.page()
         web_page.windowCloseRequested.connect(
             partial(self._window_close_requested, web_view)
         )
+        return web_view
 
-        self.addTab(web_view, "New Tab")
-        if not background:
-            self.setCurrentWidget(web_view)
+    def _load_placeholder(self, index: int) -> BrowserWebView:
+        placeholder = cast(TabPlaceholder, self.widget(index))
+        web_view = self._create_web_view()
+
+        # swap the placeholder without reporting the intermediate tabs
+        self.blockSignals(True)
+        self.insertTab(index, web_view, self.tabText(index))
+        self.setTabToolTip(index, self.tabToolTip(index + 1))
+        self.removeTab(index + 1)
+        self.setCurrentIndex(index)
+        self.blockSignals(False)
+
+        placeholder.deleteLater()
+        if not placeholder.url.isEmpty():
+            web_view.setUrl(placeholder.url)
         return web_view
 
     def current_web_view(self) -> BrowserWebView | None:
         return self._web_view(self.currentIndex())
 
     def close_tab(self, index: int):
-        web_view = self._web_view(index)
-        if web_view:
+        widget = self.widget(index)
+        if widget:
+            if isinstance(widget, BrowserWebView):
+                widget.cancel_translations()
             self.removeTab(index)
             if self.count() == 0:
                 self.close_window.emit()
-            web_view.deleteLater()
+            widget.deleteLater()
+
+    def web_views(self) -> list[BrowserWebView]:
+        web_views = [self._web_view(index) for index in range(self.count())]
+        return [web_view for web_view in web_views if web_view is not None]
+
+    def cancel_translations(self):
+        for index in range(self.count()):
+            web_view = self._web_view(index)
+            if web_view:
+                web_view.cancel_translations()
 
     def set_url(self, url: str):
         current_web_view = self.current_web_view()
@@ -79,7 +157,10 @@ class BrowserTabWidget(QTabWidget):
             current_web_view.triggerPageAction(action)
 
     def _web_view(self, index: int) -> BrowserWebView | None:
-        return cast(BrowserWebView, self.widget(index))
+        widget = self.widget(index)
+        if isinstance(widget, BrowserWebView):
+            return widget
+        return None
 
     def _title_changed(self, web_view: BrowserWebView, title: str):
         index = self.indexOf(web_view)
@@ -114,6 +195,13 @@ class BrowserTabWidget(QTabWidget):
         if self.currentIndex() == index:
             self.translation_enabled_changed.emit(enabled)
 
+    def _handle_page_translation_progress(
+        self, web_view: BrowserWebView, done: int, total: int, elapsed: int
+    ):
+        index = self.indexOf(web_view)
+        if self.currentIndex() == index:
+            self.page_translation_progress.emit(done, total, elapsed)
+
     def _window_close_requested(self, web_view: BrowserWebView):
         index = self.indexOf(web_view)
         if index >= 0:
@@ -121,6 +209,8 @@ class BrowserTabWidget(QTabWidget):
 
     def _handle_current_changed(self, index: int):
         if index >= 0:
+            if isinstance(self.widget(index), TabPlaceholder):
+                self._load_placeholder(index)
             current_web_view = self._web_view(index)
             if current_web_view is not None:
                 self.title_changed.emit(current_web_view.title())
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, cast
 from functools import partial
+import json
+import time
 
 from PySide6.QtCore import Signal
 from PySide6.QtWebEngineCore import QWebEnginePage
@@ -9,29 +11,52 @@ from PySide6.QtWebChannel import QWebChannel
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWidgets import QMessageBox
 
-from settings import get_api_key
-from translator import TranslatorBridge
+from settings import (
+    get_api_key,
+    get_hover_dwell_ms,
+    get_settings,
+    is_auto_translate_url,
+    TARGET_LANG,
+)
 
 if TYPE_CHECKING:
     from PySide6.QtGui import QAction
     from browserwindow import BrowserWindow
+    from translator import TranslatorBridge
 
 
 class BrowserWebView(QWebEngineView):
     web_action_enabled_changed = Signal(QWebEnginePage.WebAction, bool)
     translation_enabled_changed = Signal(bool)
+    page_translation_progress = Signal(int, int, int)
+    # emitted once for every suspend() call, with whether the page reached the state
+    suspend_finished = Signal(bool)
     _translation_enabled: bool = False
+    # translator.js only runs in pages that translation has been enabled for
+    _scripts_injected: bool = False
+    # created with the scripts, the translation engine is not loaded before it is needed
+    _translator: TranslatorBridge | None = None
+    _channel: QWebChannel | None = None
+    _loading: bool = False
+    _page_translation_pending: bool = False
+    # monotonic time the tab went to the background, None while it is shown
+    _background_since: float | None = None
+    # scroll position and inserted translations, taken before the page is frozen
+    _saved_state: dict | None = None
+    _suspending: bool = False
+    _discarded: bool = False
+    _restore_pending: bool = False
 
     def __init__(self, profile: QWebEngineProfile):
         super().__init__(profile)
+        # a tab opened in the background never gets a hide event, showEvent() clears it
+        self._background_since = time.monotonic()
 
         self._connect_webaction_changed(self.page(), QWebEnginePage.WebAction.Forward)
         self._connect_webaction_changed(self.page(), QWebEnginePage.WebAction.Back)
+        self.loadStarted.connect(self._on_load_started)
         self.loadFinished.connect(self._on_load_finished)
-
-        self._channel = QWebChannel(self)
-        self._channel.registerObject("translator", TranslatorBridge(self))
-        self.page().setWebChannel(self._channel)
+        self.page().lifecycleStateChanged.connect(self._on_lifecycle_state_changed)
 
     def _connect_webaction_changed(
         self, page: QWebEnginePage, web_action: QWebEnginePage.WebAction
@@ -46,29 +71,177 @@ class BrowserWebView(QWebEngineView):
     ):
         self.web_action_enabled_changed.emit(web_action, action.isEnabled())
 
+    def _on_load_started(self):
+        # the requests belong to the page that is going away
+        self.cancel_translations()
+        self._scripts_injected = False
+        self._loading = True
+        self._page_translation_pending = False
+
     def _on_load_finished(self):
+        self._loading = False
+        if (
+            not self._translation_enabled
+            and is_auto_translate_url(self.url())
+            and self._can_translate()
+        ):
+            self._translation_enabled = True
+            self._warm_up_translation()
+            self.translation_enabled_changed.emit(True)
+        if self._translation_enabled:
+            self._inject_scripts()
         self._send_translation_state_changed()
+        if self._page_translation_pending:
+            self._page_translation_pending = False
+            self.translate_page()
+        if self._restore_pending:
+            self._restore_pending = False
+            self._restore_page_state()
+
+    def _inject_scripts(self):
+        # a page that is still loading gets the scripts when it finishes
+        if self._scripts_injected or self._loading:
+            return
+        from translator import TranslatorBridge, injected_script
+
+        if self._channel is None:
+            self._translator = TranslatorBridge(self)
+            self._translator.page_translation_progress.connect(
+                self.page_translation_progress
+            )
+            self._channel = QWebChannel(self)
+            self._channel.registerObject("translator", self._translator)
+            self.page().setWebChannel(self._channel)
+        self.page().runJavaScript(injected_script())
+        self._scripts_injected = True
+
+    def _can_translate(self):
+        from translationengine import get_translation_engine
+
+        target_lang = get_settings().value(TARGET_LANG, "ko")
+        backend = get_translation_engine().backend(target_lang)
+        return bool(get_api_key()) or not backend.requires_api_key()
+
+    def _warm_up_translation(self):
+        from translationengine import get_translation_engine
+
+        target_lang = get_settings().value(TARGET_LANG, "ko")
+        get_translation_engine().warm_up(target_lang)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._background_since = None
+        # a page has to be active while it is visible, a discarded one reloads
+        if self.page().lifecycleState() != QWebEnginePage.LifecycleState.Active:
+            self.page().setLifecycleState(QWebEnginePage.LifecycleState.Active)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._background_since = time.monotonic()
+
+    def background_since(self) -> float | None:
+        return self._background_since
+
+    def has_pending_translations(self) -> bool:
+        return self._translator is not None and self._translator.has_pending()
+
+    def suspend(self, state: QWebEnginePage.LifecycleState):
+        # frozen pages no longer run scripts, so the page state is taken first
+        if self._suspending or self.isVisible():
+            self.suspend_finished.emit(False)
+            return
+        if self.page().lifecycleState() != QWebEnginePage.LifecycleState.Active:
+            self.page().setLifecycleState(state)
+            self.suspend_finished.emit(self.page().lifecycleState() == state)
+            return
+        if self._scripts_injected:
+            script = "snapshotPageState()"
+        else:
+            script = "({ scroll_x: window.scrollX, scroll_y: window.scrollY, translations: [] })"
+        self._suspending = True
+        self.page().runJavaScript(script, 0, partial(self._finish_suspend, state))
+
+    def _finish_suspend(self, state: QWebEnginePage.LifecycleState, page_state):
+        self._suspending = False
+        # the tab may have been shown again while the script ran
+        if self.isVisible() or self.page().isLoading():
+            self.suspend_finished.emit(False)
+            return
+        self._saved_state = page_state
+        self.page().setLifecycleState(state)
+        self.suspend_finished.emit(self.page().lifecycleState() == state)
+
+    def is_suspending(self) -> bool:
+        return self._suspending
+
+    def _on_lifecycle_state_changed(self, state: QWebEnginePage.LifecycleState):
+        if state == QWebEnginePage.LifecycleState.Discarded:
+            self._discarded = True
+        elif state == QWebEnginePage.LifecycleState.Active:
+            # a frozen page kept its document, a discarded one is loaded again
+            self._restore_pending = self._discarded and self._saved_state is not None
+            self._discarded = False
+            if not self._restore_pending:
+                self._saved_state = None
+
+    def _restore_page_state(self):
+        state = self._saved_state
+        self._saved_state = None
+        if state.get("translations") and self._scripts_injected:
+            self.page().runJavaScript(f"restorePageState({json.dumps(state)});")
+        else:
+            self.page().runJavaScript(
+                f"window.scrollTo({state.get('scroll_x', 0)}, {state.get('scroll_y', 0)});"
+            )
 
     def is_web_action_enabled(self, web_action: QWebEnginePage.WebAction):
         return self.page().action(web_action).isEnabled()
 
     def toggle_translation(self):
-        api_key = get_api_key()
-        if not api_key:
+        if not self._can_translate():
             QMessageBox.warning(self, "Warning", "Please enter an API key")
             return
         self._translation_enabled = not self._translation_enabled
+        if self._translation_enabled:
+            self._warm_up_translation()
+            self._inject_scripts()
+        else:
+            self.cancel_translations()
         self._send_translation_state_changed()
         self.translation_enabled_changed.emit(self._translation_enabled)
 
+    def translate_page(self):
+        if not self._translation_enabled:
+            self.toggle_translation()
+            if not self._translation_enabled:
+                return
+        if not self._scripts_injected:
+            self._page_translation_pending = True
+            return
+        self.page().runJavaScript(
+            "window.dispatchEvent(new CustomEvent('translatePage'));"
+        )
+
     def _send_translation_state_changed(self):
+        if self._translator is not None:
+            self._translator.set_enabled(self._translation_enabled)
+        if not self._scripts_injected:
+            return
+        detail = {
+            "enabled": self._translation_enabled,
+            "hover_dwell": get_hover_dwell_ms(),
+        }
         self.page().runJavaScript(
-            f"window.dispatchEvent(new CustomEvent('translationStateChanged', {{ detail: {{ enabled: {str(self._translation_enabled).lower()} }} }}));"
+            f"window.dispatchEvent(new CustomEvent('translationStateChanged', {{ detail: {json.dumps(detail)} }}));"
         )
 
     def is_translation_enabled(self):
         return self._translation_enabled
 
+    def cancel_translations(self):
+        if self._translator is not None:
+            self._translator.cancel_all()
+
     def createWindow(self, type: QWebEnginePage.WebWindowType) -> QWebEngineView | None:  # type: ignore
         main_window = cast(BrowserWindow, self.window())
         if not main_window:
@@ -10,6 +10,7 @@ from PySide6.QtWidgets import QToolBar
 from PySide6.QtGui import QKeySequence
 from PySide6.QtGui import QIcon
 from PySide6.QtGui import QAction
+from PySide6.QtCore import QByteArray
 from PySide6.QtCore import QUrl
 from PySide6.QtCore import Qt
 from PySide6.QtCore import Signal
@@ -18,29 +19,30 @@ from browsertabwidget import BrowserTabWidget
 from settings import SettingsDialog
 
 if TYPE_CHECKING:
-    from PySide6.QtWebEngineCore import QWebEngineProfile
     from browser import Browser
+    from diagnosticsdialog import DiagnosticsDialog
 
 
 class BrowserWindow(QMainWindow):
     about_to_close = Signal()
 
     _browser: Browser
-    _profile: QWebEngineProfile
 
     _toolbar: QToolBar
     _history_back_action: QAction
     _history_forward_action: QAction
     _url_line_edit: QLineEdit
     _translation_action: QAction
+    _translate_page_action: QAction
 
     _tab_widget: BrowserTabWidget
+    _diagnostics_dialog: DiagnosticsDialog | None
 
-    def __init__(self, browser: Browser, profile: QWebEngineProfile):
+    def __init__(self, browser: Browser, open_tab=True):
         super().__init__()
 
         self._browser = browser
-        self._profile = profile
+        self._diagnostics_dialog = None
 
         menu_bar = self.menuBar()
         menu_bar.addMenu(self._create_file_menu())
@@ -52,15 +54,17 @@ class BrowserWindow(QMainWindow):
             self._history_forward_action,
             self._url_line_edit,
             self._translation_action,
+            self._translate_page_action,
         ] = self._create_tool_bar()
         self.addToolBar(self._toolbar)
         self.addToolBarBreak()
 
-        self._tab_widget = self._create_tab_widget(profile)
+        self._tab_widget = self._create_tab_widget()
         self.setCentralWidget(self._tab_widget)
 
         self._handle_web_view_title_changed("")
-        self._tab_widget.create_tab()
+        if open_tab:
+            self._tab_widget.create_tab()
 
         self.setGeometry(100, 100, 800, 600)
 
@@ -96,12 +100,18 @@ class BrowserWindow(QMainWindow):
         translation_action.triggered.connect(self._toggle_translation)
         navigation_bar.addAction(translation_action)
 
+        translate_page_action = QAction("Translate Page", self)
+        translate_page_action.setToolTip("Translate the whole page")
+        translate_page_action.triggered.connect(self._translate_page)
+        navigation_bar.addAction(translate_page_action)
+
         return [
             navigation_bar,
             history_back_action,
             history_forward_action,
             url_line_edit,
             translation_action,
+            translate_page_action,
         ]
 
     def _go_back(self):
@@ -118,10 +128,17 @@ class BrowserWindow(QMainWindow):
         self._url_line_edit.setFocus(Qt.FocusReason.ShortcutFocusReason)
 
     def _toggle_translation(self):
-        self._tab_widget.current_web_view().toggle_translation()
+        current_web_view = self._tab_widget.current_web_view()
+        if current_web_view:
+            current_web_view.toggle_translation()
+
+    def _translate_page(self):
+        current_web_view = self._tab_widget.current_web_view()
+        if current_web_view:
+            current_web_view.translate_page()
 
-    def _create_tab_widget(self, profile: QWebEngineProfile) -> BrowserTabWidget:
-        tab_widget = BrowserTabWidget(self, profile)
+    def _create_tab_widget(self) -> BrowserTabWidget:
+        tab_widget = BrowserTabWidget(self, self._browser)
 
         tab_widget.title_changed.connect(self._handle_web_view_title_changed)
         tab_widget.url_changed.connect(self._url_changed)
@@ -131,6 +148,9 @@ class BrowserWindow(QMainWindow):
         tab_widget.translation_enabled_changed.connect(
             self._handle_translation_enabled_changed
         )
+        tab_widget.page_translation_progress.connect(
+            self._handle_page_translation_progress
+        )
         tab_widget.close_window.connect(self.close)
 
         return tab_widget
@@ -170,11 +190,28 @@ class BrowserWindow(QMainWindow):
         preferences_action.triggered.connect(self._open_settings_dialog)
         settings_menu.addAction(preferences_action)
 
+        diagnostics_action = QAction("Diagnostics", self)
+        diagnostics_action.triggered.connect(self._open_diagnostics_dialog)
+        settings_menu.addAction(diagnostics_action)
+
         return settings_menu
 
     def _open_settings_dialog(self):
         settings_dialog = SettingsDialog(self)
-        settings_dialog.exec()
+        if settings_dialog.exec():
+            from translationengine import get_translation_engine
+
+            get_translation_engine().apply_settings()
+
+    def _open_diagnostics_dialog(self):
+        # not modal, so it can stay open while browsing
+        if self._diagnostics_dialog is None:
+            from diagnosticsdialog import DiagnosticsDialog
+
+            self._diagnostics_dialog = DiagnosticsDialog(self)
+        self._diagnostics_dialog.show()
+        self._diagnostics_dialog.raise_()
+        self._diagnostics_dialog.activateWindow()
 
     def _new_window(self):
         window = self._browser.create_window()
@@ -207,6 +244,16 @@ class BrowserWindow(QMainWindow):
         else:
             self._translation_action.setIcon(QIcon(":icon-disabled"))
 
+    def _handle_page_translation_progress(self, done: int, total: int, elapsed: int):
+        if total == 0:
+            self.statusBar().showMessage("Nothing to translate on this page", 5000)
+        elif done < total:
+            self.statusBar().showMessage(f"Translating page: {done}/{total}")
+        else:
+            self.statusBar().showMessage(
+                f"Translated {total} paragraphs in {elapsed / 1000:.1f} s", 10000
+            )
+
     def _handle_web_view_title_changed(self, title):
         suffix = "S-Tran"
         if title:
@@ -229,9 +276,22 @@ class BrowserWindow(QMainWindow):
                 return
 
         event.accept()
+        self._tab_widget.cancel_translations()
         self.about_to_close.emit()
         self.deleteLater()
 
+    def session_state(self) -> dict:
+        return {
+            "geometry": bytes(self.saveGeometry().toBase64().data()).decode("ascii"),
+            **self._tab_widget.session_state(),
+        }
+
+    def restore_session_state(self, state: dict):
+        geometry = state.get("geometry")
+        if geometry:
+            self.restoreGeometry(QByteArray.fromBase64(geometry.encode("ascii")))
+        self._tab_widget.restore_session_state(state)
+
     def tab_widget(self):
         return self._tab_widget
 
@@ -0,0 +1,205 @@
+from __future__ import annotations
+import json
+import time
+
+from PySide6.QtWidgets import QDialog
+from PySide6.QtWidgets import QVBoxLayout
+from PySide6.QtWidgets import QHBoxLayout
+from PySide6.QtWidgets import QLabel
+from PySide6.QtWidgets import QTableWidget
+from PySide6.QtWidgets import QTableWidgetItem
+from PySide6.QtWidgets import QHeaderView
+from PySide6.QtWidgets import QPushButton
+from PySide6.QtWidgets import QFileDialog
+from PySide6.QtWidgets import QMessageBox
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QTimer
+from PySide6.QtCore import Qt
+
+from translationengine import get_translation_engine
+from translationmetrics import CONNECTION_TIMINGS, TIMINGS, WINDOW_SECONDS
+
+REFRESH_INTERVAL_MS = 1000
+TIMING_LABELS = {
+    "queue_wait": "Queue wait",
+    "connect": "Connect",
+    "ttfb": "Time to first byte",
+    "request": "Request",
+    "total": "Total",
+    "ttfb_new_connection": "First byte, new connection",
+    "ttfb_reused_connection": "First byte, warm connection",
+}
+RECENT_COLUMNS = [
+    "Time",
+    "Cache",
+    "Queue",
+    "Connect",
+    "TTFB",
+    "Total",
+    "Tokens in/out",
+    "Batch",
+    "Retries",
+    "Error",
+]
+
+
+class DiagnosticsDialog(QDialog):
+    _summary_label: QLabel
+    _timings_table: QTableWidget
+    _recent_table: QTableWidget
+    _export_button: QPushButton
+    _reset_button: QPushButton
+    _close_button: QPushButton
+    _refresh_timer: QTimer
+
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        self.setWindowTitle("S-Tran Diagnostics")
+        self.resize(760, 560)
+
+        self._setup_ui()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self._refresh)
+        self._refresh()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        self._summary_label = QLabel()
+        self._summary_label.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
+        )
+        layout.addWidget(self._summary_label)
+
+        timings_label = QLabel(
+            f"Translation timings over the last {WINDOW_SECONDS // 60} minutes (ms):"
+        )
+        layout.addWidget(timings_label)
+        self._timings_table = QTableWidget(len(TIMINGS + CONNECTION_TIMINGS), 5)
+        self._timings_table.setHorizontalHeaderLabels(
+            ["Count", "Mean", "p50", "p95", "p99"]
+        )
+        self._timings_table.setVerticalHeaderLabels(
+            [TIMING_LABELS[name] for name in TIMINGS + CONNECTION_TIMINGS]
+        )
+        self._timings_table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+        self._timings_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self._timings_table)
+
+        recent_label = QLabel("Recent translations (ms):")
+        layout.addWidget(recent_label)
+        self._recent_table = QTableWidget(0, len(RECENT_COLUMNS))
+        self._recent_table.setHorizontalHeaderLabels(RECENT_COLUMNS)
+        self._recent_table.horizontalHeader().setStretchLastSection(True)
+        self._recent_table.verticalHeader().setVisible(False)
+        self._recent_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self._recent_table, 1)
+
+        button_layout = QHBoxLayout()
+        self._export_button = QPushButton("Export JSON...")
+        self._reset_button = QPushButton("Reset")
+        self._close_button = QPushButton("Close")
+        button_layout.addWidget(self._export_button)
+        button_layout.addWidget(self._reset_button)
+        button_layout.addStretch()
+        button_layout.addWidget(self._close_button)
+        layout.addLayout(button_layout)
+
+        self._export_button.clicked.connect(self._export)
+        self._reset_button.clicked.connect(self._reset)
+        self._close_button.clicked.connect(self.close)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._refresh()
+        self._refresh_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._refresh_timer.stop()
+
+    def _refresh(self):
+        engine = get_translation_engine()
+        metrics = engine.metrics()
+        counters = metrics.counters()
+        lookups = (
+            counters["memory_hits"]
+            + counters["disk_hits"]
+            + counters["reuse_hits"]
+            + counters["misses"]
+        )
+        hit_rate = (lookups - counters["misses"]) / lookups if lookups else 0.0
+        self._summary_label.setText(
+            f"Queued: {engine.queue_depth()}   Active: {engine.active_count()}"
+            f"   Concurrency: {engine.concurrency_limit()}/{engine.max_workers()}\n"
+            f"Cache hits: {counters['memory_hits']} memory, {counters['disk_hits']} disk"
+            f", {counters['reuse_hits']} reused, {counters['misses']} misses"
+            f" ({hit_rate:.0%})"
+            f"   Requests: {counters['requests']}   Retries: {counters['retries']}"
+            f"   Errors: {counters['errors']}   Warm-ups: {counters['warm_ups']}"
+            f"   Prefetches: {counters['prefetches']}\n"
+            f"Tokens: {counters['prompt_tokens']} in, {counters['completion_tokens']} out"
+            f"   References: {counters['references']}"
+        )
+
+        histograms = metrics.histograms()
+        for row, name in enumerate(TIMINGS + CONNECTION_TIMINGS):
+            histogram = histograms[name]
+            values = [
+                str(histogram["count"]),
+                f"{histogram['mean_ms']:.0f}",
+                f"{histogram['p50_ms']:.0f}",
+                f"{histogram['p95_ms']:.0f}",
+                f"{histogram['p99_ms']:.0f}",
+            ]
+            for column, value in enumerate(values):
+                self._timings_table.setItem(row, column, QTableWidgetItem(value))
+
+        records = list(reversed(metrics.recent()))
+        self._recent_table.setRowCount(len(records))
+        for row, record in enumerate(records):
+            values = [
+                time.strftime("%H:%M:%S", time.localtime(record.finished_at)),
+                record.cache,
+                f"{record.queue_wait * 1000:.0f}",
+                f"{record.connect * 1000:.0f}",
+                f"{record.ttfb * 1000:.0f}",
+                f"{record.total * 1000:.0f}",
+                f"{record.prompt_tokens}/{record.completion_tokens}",
+                str(record.batch_size),
+                str(record.retries),
+                record.error,
+            ]
+            for column, value in enumerate(values):
+                self._recent_table.setItem(row, column, QTableWidgetItem(value))
+
+    def _export(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Diagnostics", "s-tran-diagnostics.json", "JSON (*.json)"
+        )
+        if not path:
+            return
+
+        engine = get_translation_engine()
+        report = {
+            "exported_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "engine": {
+                "queue_depth": engine.queue_depth(),
+                "active": engine.active_count(),
+                "concurrency_limit": engine.concurrency_limit(),
+                "max_workers": engine.max_workers(),
+            },
+            **engine.metrics().snapshot(),
+        }
+        try:
+            with open(path, "w") as file:
+                json.dump(report, file, indent=2)
+        except OSError as e:
+            QMessageBox.warning(self, "Warning", f"Could not export diagnostics: {e}")
+
+    def _reset(self):
+        get_translation_engine().metrics().reset()
+        self._refresh()
@@ -1,14 +1,86 @@
 from __future__ import annotations
+import time
 
+# taken before the imports so that their cost shows up in the startup timing
+started = time.perf_counter()
+
+import argparse
 import sys
+import threading
 
 from PySide6.QtWidgets import QApplication
 
 from browser import Browser
+from startuptiming import FirstPaintWatcher, StartupTiming
 import resources.icons
 
-if __name__ == "__main__":
-    app = QApplication([])
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="S-Tran browser")
+    parser.add_argument(
+        "--startup-timing",
+        action="store_true",
+        help="print how long each startup phase took",
+    )
+    parser.add_argument(
+        "--startup-budget-ms",
+        type=float,
+        help="quit once started, with an error if the first window took longer",
+    )
+    # the rest is left for Qt
+    return parser.parse_known_args()
+
+
+def preload_translation_engine():
+    # imports requests, which the first window does not need
+    import translationengine
+
+
+def main():
+    args, qt_args = parse_args()
+    timing = StartupTiming(started)
+    timing.mark("imports")
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    app.setOrganizationName("sixmen")
+    app.setApplicationName("S-Tran")
+    timing.mark("QApplication")
+
+    # the web engine starts with the first tab, after the windows have been shown
     browser = Browser()
-    browser.create_window()
-    sys.exit(app.exec())
+    windows = browser.restore_session() or [browser.create_window(open_tab=False)]
+    first_paint_watcher = FirstPaintWatcher(windows[0])
+
+    def finish_startup():
+        timing.mark("first window")
+        first_window = timing.elapsed()
+        browser.profile()
+        timing.mark("web engine profile")
+        # only the current tab of each window loads, the others wait to be activated
+        for window in windows:
+            tab_widget = window.tab_widget()
+            if tab_widget.count():
+                tab_widget.load_current_tab()
+            else:
+                tab_widget.create_tab()
+        timing.mark("first tab")
+        threading.Thread(target=preload_translation_engine, daemon=True).start()
+
+        if args.startup_timing or args.startup_budget_ms is not None:
+            print(timing.report(), file=sys.stderr)
+        if args.startup_budget_ms is not None:
+            within_budget = first_window * 1000 <= args.startup_budget_ms
+            print(
+                f"first window in {first_window * 1000:.1f} ms,"
+                f" budget {args.startup_budget_ms:.0f} ms:"
+                f" {'ok' if within_budget else 'exceeded'}",
+                file=sys.stderr,
+            )
+            app.exit(0 if within_budget else 1)
+
+    first_paint_watcher.painted.connect(finish_startup)
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
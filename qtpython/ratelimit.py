@@ -0,0 +1,194 @@
+from __future__ import annotations
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Mapping
+import random
+import re
+import time
+
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+# additive increase happens while latency stays below this multiple of the best seen
+LATENCY_DEGRADED_FACTOR = 2.0
+LATENCY_SAMPLES = 100
+DECREASE_COOLDOWN = 2.0
+TOKEN_BUDGET_WINDOW = 60.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: str) -> float | None:
+    # "20ms", "1s", "6m0s" as sent in x-ratelimit-reset-* headers
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    # full jitter exponential backoff, never shorter than what the server asked for
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class _Bucket:
+    limit: int | None
+    remaining: float | None
+    reset_at: float
+
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.reset_at = 0.0
+
+    def update(self, limit: str | None, remaining: str | None, reset: str | None):
+        now = time.monotonic()
+        try:
+            if limit is not None:
+                self.limit = int(limit)
+            if remaining is not None:
+                self.remaining = float(remaining)
+        except ValueError:
+            return
+        reset_after = parse_duration(reset) if reset else None
+        if reset_after is not None:
+            self.reset_at = now + reset_after
+
+    def delay(self, amount: float, now: float) -> float:
+        if now >= self.reset_at and self.limit is not None:
+            self.remaining = self.limit
+        if self.remaining is None or self.remaining >= amount:
+            return 0.0
+        # an empty bucket is refilled when the server says it resets
+        return max(0.0, self.reset_at - now)
+
+    def consume(self, amount: float):
+        if self.remaining is not None:
+            self.remaining -= amount
+
+
+class RateLimiter:
+    _requests: _Bucket
+    _tokens: _Bucket
+    _blocked_until: float
+
+    def __init__(self):
+        self._requests = _Bucket()
+        self._tokens = _Bucket()
+        self._blocked_until = 0.0
+
+    def update(self, headers: Mapping[str, str]):
+        self._requests.update(
+            headers.get("x-ratelimit-limit-requests"),
+            headers.get("x-ratelimit-remaining-requests"),
+            headers.get("x-ratelimit-reset-requests"),
+        )
+        self._tokens.update(
+            headers.get("x-ratelimit-limit-tokens"),
+            headers.get("x-ratelimit-remaining-tokens"),
+            headers.get("x-ratelimit-reset-tokens"),
+        )
+        retry_after = parse_retry_after(headers)
+        if retry_after is not None:
+            self.block(retry_after)
+
+    def block(self, seconds: float):
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def delay(self, tokens: float) -> float:
+        # seconds to wait before a request of about 'tokens' tokens may be sent
+        now = time.monotonic()
+        return max(
+            self._blocked_until - now,
+            self._requests.delay(1, now),
+            self._tokens.delay(tokens, now),
+            0.0,
+        )
+
+    def consume(self, tokens: float):
+        self._requests.consume(1)
+        self._tokens.consume(tokens)
+
+
+class TokenBudget:
+    # tokens spent over the last TOKEN_BUDGET_WINDOW seconds, up to a per minute limit
+    _tokens_per_minute: int
+    _spent: deque[tuple[float, int]]
+    _spent_tokens: int
+
+    def __init__(self, tokens_per_minute: int = 0):
+        self._tokens_per_minute = tokens_per_minute
+        self._spent = deque()
+        self._spent_tokens = 0
+
+    def set_tokens_per_minute(self, tokens_per_minute: int):
+        self._tokens_per_minute = tokens_per_minute
+
+    def allows(self, tokens: int) -> bool:
+        expired = time.monotonic() - TOKEN_BUDGET_WINDOW
+        while self._spent and self._spent[0][0] <= expired:
+            self._spent_tokens -= self._spent.popleft()[1]
+        return self._spent_tokens + tokens <= self._tokens_per_minute
+
+    def consume(self, tokens: int):
+        self._spent.append((time.monotonic(), tokens))
+        self._spent_tokens += tokens
+
+
+class AimdController:
+    _limit: float
+    _max_limit: int
+    _latencies: deque[float]
+    _last_decrease: float
+
+    def __init__(self, max_limit: int):
+        self._max_limit = max_limit
+        self._limit = float(max_limit)
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._last_decrease = 0.0
+
+    def limit(self) -> int:
+        return max(1, int(self._limit))
+
+    def set_max_limit(self, max_limit: int):
+        self._max_limit = max_limit
+        self._limit = min(self._limit, max_limit)
+
+    def on_success(self, latency: float, tokens: int):
+        # latency per token, so that large batches are not mistaken for a slow server
+        normalized = latency / max(1, tokens)
+        self._latencies.append(normalized)
+        if normalized <= min(self._latencies) * LATENCY_DEGRADED_FACTOR:
+            # about one more request per round trip at the current limit
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+    def on_throttle(self):
+        now = time.monotonic()
+        # one cut per burst of failures from requests that were sent together
+        if now - self._last_decrease >= DECREASE_COOLDOWN:
+            self._last_decrease = now
+            self._limit = max(1.0, self._limit / 2)
@@ -6,155 +6,638 @@
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x09'\
+\x00\x00'_\
 \x00\
-\x00\x1f=x\xda\xb5Y_o\x1b\xc7\x11\x7f\xe7\xa7\xd8\
-\xc0Ax\x07\x91g\xd9M\x84V\xaa\x1a\xd0\x0a\x9d8\
-5d\xd7\xa2\xe1\x02\xaeA-\xef\x96\xbc\x8d\xee_o\
-\x97\x22i\x87\xcf\xfd\x04M_\x82\xbe\x15\x05\x8a\xe6\xa1\
-@\x0b\xf4=_\xa50\x8a\xa2\xfd\x0e\x9d\xfd{{\xc7\
-;J6\x12\x1b\xb6\xc4\xdd\x99\xd9\xf9\xf3\x9b\x99\x9de\
-B8*\xf2bY\xa0S\x94-\x93\xe4\xa4\x97\xc0\x0a\
-eS^\xe2\x8c%\x98\xd3<\x9b\x92\x0c\xcf\x12\x12\x01\
-\xc9\x1c'\x8c(\x9a\x043>\x8d\xe9\x22N\xe0\x1f'\
-\xd1\x94$$%\x19\xaf\x09\xb2R\xb2E\xc5\xdd\x0b\xf3\
-\x8cq\xf4xt\xfe\xf9\xf3\xd1\xe7\xe3\x0b\xd8y\xd3C\
-\xe8*?F\xfd\xff\xfd\xfe\xdb\xff\xfc\xe3\xbb\xff~\xf3\
-\xf7\xfe\x00\x96H\x06K\xe3l\x91P\x16\xcb\x85\xaf0\
-,\xbc\xfd\xc3\x9f\xde~\xfb\xd7\x7f\xff\xe5\x8fr\xe9u\
-\x0cK\xff\xfa\xe7wo\xbf\xf9\x9d\xe2a\x82\x87\x15\xf8\
-\xfb\xbf\xe5\x89\x5c\x99\x97\xb0\xf2\x104\xf9\xfe\xcf\x982\
-\xb9\x14\x11X\xfa\x8c,9\x0b\x85\xe0\xadU\x8a\xf1M\
-B@\xa1(\x0f\x97\xc2\x9a ,\x09\xe6d\xacl\xf3\
-\xfar\xbf\xef\x9f\xf4\xe4/\x01'k~\x96g\x5c\xd9\
-}\x09\x92\x036\x94F\x0f\xe3\xfc\x9a\x94\xc2o\xd28\
-\x84f8\xbcZ\x94\xf92\x8b\x86a\x9e\xe4\xa0S\xb9\
-\x98a\xefp\x80~v4@\xf7\xef\xffd\x80\x0e\x83\
-{>\xfa\x80\xa6E^r\x9c\xf1\x13\xc9\x17.K&\
-\xa8\x8b\x9c\xc29ec\x7f\xdb\xbb<\xe9Yec\x82\
-\xa3\x00\x17\x05\xc9\xa2\xb3\x98&\x91'\xb5\xf4\xadu\xab\
-\xbc\xbc\x22\xe5t\x85\xa9\x90\x04n\x17\x86gd\x85~\
-\xf5\x82\xcc\xceb\x9ce$\xf1~\xcb\x83\x95\xfd4\x11\
-\xb6\x88\xf3\x06h\xbe\xccB\x01\x07\xe4\x85j\xcf\x97\x96\
-\xadh\x16\xe5\xab\xc0D:\x17r5A\x90\xcf\xbe\x22\
-!g\xce\xe6I\x1bG\xe0\x80\xed,O\x0b@\x0e\x09\
-@\xe3\x0c\x98=\xaf$l\x99p\x1f\x9d\xfeB{R\
-\xd9\xf2F[3@\xa4,s\xf8a\x84\x00\x14EX\
-\xd0\x16\x14\xf9\xf2\xe2\xc9yP\xe0\x92\x11#\xe6\xc4\x11\
-a\xfdP\xf3\xcbK\xf5\xe9\x95\xa2\xa4s\xe4\xa9u_\
-\x1f/\xd0#4\xdc\xc7\xa5\xf8\xa4b\x15\x1b\xd2\x07\x06\
-%\x11n\xf1\x84\xe3\xc7\x82D\x13\xfa\x86w\x8b\x08$\
-J\x1b\x1f\xcb\x93k\xe25,\xad\xf8z\xe6\xff-\xac\
-\x89\x7f=\xedk\x1cE\xe3k@\xc8c\xca\x00\xab\xa4\
-\xf4\xfa\x8e\xcb/8\x88\x12\xf1^\x90\xa8?\x00\xb5\x05\
-\xa5\xf5wg-\x90dAD8\xa6I\xa0\x97\x85&\
-\xc2\xf2\x0f\xda\xb9\x8c/b\x1a\x91\xa7\xa2\xeax\xbe\x02\
-\xf1\xb6\xc2\xa85n\x22\x82x\x8a0\xdbd\xa1\x03>\
-i\xb1\x94\xa3\xe8U\x5c\xeb\xb1\xc6\xc2a{pF\x94\
-\x14\xdf\xa8\xabd\x04\xb5x\xf1\xb8\xccW\xa8\x8aQ\x8d\
-Fi\x8d\xe0p\xbe,3I\xf5\xb4\xccS\x0ag{\
-:J\x03\xa4\xc2\xec\x00\xb7\x0e\x18-P\xe3Fd#\
-j\xb0\xa2\xad\x8a,#|BS\x92/!\x1b\x1cq\
-\x1a\x9c{\x84\xba\xd8k\x05m\x9d\xfc\xc4\x12\xef \xb4\
-?\xa9\xa2\x89\xb8R\xa6\xef7\x917@G\x87\xf0G\
-\xb9G@\x10\xa2j#\xa7*\xa9\x0e\xbb\x13@\xd3~\
-\xbaJnD\xaf\xfbR\xa2$\x0cT\xe1\x0d\x19\xd3\xf8\
-\xb8\x94G\x179\xa3\xe2\x94c4\xa7k\x85C\xb7\xe4\
-\x1e\xa3U\x0c\x06\xeb\xe5\xbc\x8c\x08T\xd4{\xc5\x1a\x81\
-\xbfi\x84\xee\x84a\xe8\xee\x0dK\x1c\xd1%4\x92\x8f\
-\x8b\xb5Z/ \x83\xa0\x89\x1d\xa3\x9f\x9a\x95Y\xbe\x1e\
-\xb2\x18\x03\xc2\x8e\xd1!\xba\x0f\xb2\x80\xd8\xd4t\xf97\
-\xb8\xaf\xfd\xf3z\x08H$k8QxG\xad\xcd\xa1\
-k\x0c\xe78\xa5\xc9\xe6\x18\xb1\x0d\xa4e:\x5c\xd2\x01\
-\x1aB\xf9N\xc8P\xad\x0c\x10\x13\xad\x84\x91\x92\xce\x1d\
-6F_C\xff\xbag\x95\x8b(+\x12\x0cr\xb2<\
-\x936BO\xb0\xee\xb5\x98\x9f\xce\x96\x9cC\x1c\xba=\
-\xad\x08\x94\xb3\x9bl\x8dVg\xf1@\xfa\xad\xd4\xedQ\
-r\x03r\xe7\xf0\xf0\xe80\x9a\x9bz,;bK\x90\
-\x8cIN\x08\x84\x9f\x9d0\xb4\x07\xac\xd16+\xaf\xec\
-\xa8\xba[\x1b\xc3\x84\x86WP\x09\xa1$F\x09\xb1\x96\
-: t{lS\xa0$\xb3.\x9e\xe5\xd1\xa6F.\
-\x05H\x1a]<\xe4\x02\xe4\x8a\x93*,\xceW*Q\
-\xd6\x03\xb4Q\xc9r\x8b\xb2\xaa\x04\xaa\xdad8\xd4q\
-\x9a\xc0\xa4Z-\x15-\xbd\x9b_\x1aR\x22\xd2\xb3$\
-\x07o4\x130!s\x19\xd7\x0f\xdf\xac\xb7\xc5\xfa\xb2\
-\xb9\xcd\xf3B\xedn\xd4\xaek\x9dS\xfd\xade\xbbj\
-\xee*\x22\xa0\xd0\xd7\xfd\xa2W]zv\xe3\x97\xe6K\
-F\x96EK/\xeb\xf6!\xfa\xfak\xf7\xb6\xda\xe1R\
-}I\x84R\xaaL95MfA\xf8\x85YU.\
-uI\xcd\x95\xe4\xb4b\x05\x0f]\xf0\x12N\xf2|h\
-K4\xf5l3\xaa\xb1\xf8\xb5;O)ztM\x0a\
-\x9c\xfbL,\x8e\xb8wX\xbb\xdb\x94\xa2\x7f\x9c*\x0e\
-A\xf5@d\x1d\x1cw\x96P\xf0\xc83Q\xdd5}\
-\x056\xc1#\x03;\x90\xec\x80]\xc0s\x8a\x0e\xd0'\
-\x0a$\xee\xb5\xa4\xbd\x857\x9au#\x81<\xff\x87\x89\
-B\xedl\x99\xd2\x1b\xd3\xb4k\xf3\x06/\x97D\x12\xbc\
-S\xe0\x0cq\x98\xa7)h\x86\xb3\x900u\xad\xedp\
-{\xa0(G\x9aP\x14IL3Us\x90\xc3T\x92\
-\x14f\x82Q\x92HVV?\xcd\x84\xb6Q\x9b%\xa9\
-\xa1T\xc1T\x02\xcf\xf3\x88\xe8r\xcc\xbc\x86\xaa~\xf3\
-dH\x11%HJ\xa8\x9d\xfb\x8e\x00\xb5M\x1b\x97x\
-Q\xe2\x22f\x96G\xcb\xd07\x82\x00\xd2\x96r\xef\xee\
-o\xb2\x83\xbb\xbeYKq\xe1y\x85L\xc7B\x0b\xb5\
-{s\x9a@\x9d\xb6\xdb\xed\xa7M30[\x1c\xf9\xf2\
-U\xf7\xfe4\x035\xa6\x8c\xce\x12\xd0\xde\x10K\xea\xbb\
-w\xd1C\x08\xbb\x9c]\x914X\xc9\xe31\x16\xf1\x96\
-q\x83\x0f\xa4\x12\x88\xacIb\x9c\xad\xce\x91\x0d\x1dD\
-\xebn.6!\xbc\xc0>\xadh\xb4G+W\xbdl\
-\xf0\xbf\xaa\x0f#\xc9\x95\x1cF\x1a\x08\x98\x94\x84\xbc\x90\
-{\xcd0\x0f\x90\x00\xc1C\xe9\xb7\xe0\xe2\x8b'/\xa6\
-\x93\xf1\xaf'P\xf4\xa4\x07\x9d\xbd\x87\x8f\x1eO\xc6\xcf\
-\xa6\xa3\xb3\xb3\xf1\xd3\x89_i,\x8cW\x9f\xa0\xf1\xc2\
-\xa0\xeaybE\xe4\x86</\x10~\x14b J\xd5\
-MRi\x0b\xae\x95q\x10\x0c\xee\xd5\xc0\xde ux\
-\xab\xcf-x\xd8\x8f\x88NL\x88[P\x09S\xa8U\
-\x04\xe5s\xa5\x90{\xdf\x15UFn~\xf4Q{h\
-\xa0\xc1\xe0\x92\xb3\x17\x94\xc7\x92\xd0w\xb9Qg8;\
-d\xc1\x95\x81H1P@\xb3\x05\x8f\xebIS\xa9\xd4\
-\xce\xaex\xd0\xe9) \xaa\xae\x06j\x82?(\x96,\
-\x96\x81\xaa\xc9F{\x93\xa0b\x92A\xbdP\xcb\x9d\x02\
-$:\x0f\x0e\xea\xdb\xef\x8dowDp\x7f\xab\xc6U\
-\x0b\xc0f\x82\xfd\xdc\x91n\x1ck\xdd\xd3\xea\x18U#\
-\xc5m\xcb\x94ak\xe5\xcd\x0e\xdaenuW\x87\xa3\
-\xb67\xd7\xfb\x9eE\xaf|f\x93\x05\x04~\xb4\x98\x09\
-\xcb\x07\x07\x95\xad\xaa\xc0\x88a\xcd\xbc\xb3\x19e\xaa\xe6\
-\xd7R\x0f\xeb\xe1\xa1N@\xda\x0a\xa7K\xad|z#\
-K\xcd\x8b;\xfcu\x1fKa\xce\x88\xe9Z\xb3\xef\xc9\
-\xad\xc0z&ic\xec\x9aK\xe0\xc0 \x08\xfa\x9dl\
-\xed\x03Je\xaa\x9cG\xee\x1c\x1d\x1d\xd5\x93 \xc5\xe5\
-\x82fC\xb8\xde\xc2\xd4\x17|B\xd2\xd6muqj\
-\xa1\xb8lz34@{\x07\x07X\x9e\xda\x5c\xd19\
-\xd4\x95\xce\x9c\xde\xc5\x5cw\x8eC^\x8f\xa7x^\x81\
-}\xd1\x13\x02\x9a\xc1X\xca\x1f\x10@3\xf1\xac\xd4\xc1\
->\x04\xf8\x9d\xe1oDQ\xbd\xdf\xd4^\x82\xaa\xd2\xe0\
-<\x93\x85\x98\x87q\xcb;\xdb^\xe1\x97\xeeS\x86d\
-=F\x1f\xbe\x91\xbf\x04)a\x0c/\xc8\xf6\xb2\xe5I\
-\xad\xf54\x9c\x80\x13\xbc[\x89\xd4w\xe89\xcdp\x92\
-\xb4_X\xf5\x03\xf9-'\x1c\xb8\xbef\xed3\x8e\x9a\
-\xf3\xa0\xf1\xa9\xf1/\xd0\xe1a\x8a4\x80\xbe\x07\x17X\
-\x7f\xffk\x9c\xbd\xc4S\xf6HL\xd0\x18>][X\
-\x19\xa4H\x11z\x90\xf5\xa44\xebt\xbc8\xc7)\x91\
-=\xad\xff\xe8\xfc\xe9\xf3I\x1fn\xf7\xdd$\xe2\xee2\
-z6\x1e\xed\xa7\xba\x18?\x1e\x9f\xdd \xe9\xc1\xf3\xc9\
-\xe4\xc9\xf9~\x9aQ\x1f\xf6\xfc\x93\xdb\xb8Y\x14\xf1\x1f\
-m\x94T\xa1\xb0\xaf\xa9\xea\xa3\x99\x04\xbb\xbfb\x01\x13\
-t\x10\xdb\x85\xab\xd6\xf3\x85a\xd5\xad\x07\xae\xbf\x17W\
-\xb4\x10\xb2\xe5\xb7\x13\x02t\xe2\xa7\xba\xf2J\xcc@k\
-\xa2U\xb4\x8d\xef\x98\x8b\xabO+8\x19\x1d\xc0\xe0V\
-\x944\x80\xd6P\x12\xd4\x19E\x11\xb2\x06\x22\x9e\x8bg\
-\x1bQa\xcc\xc1\xe2T\xa8\x041f\xe6\x22.\xd4P\
-b\xdd\xb4\xfe\xd4\xdc\x1dMZ)\x8a\x10<\xc8D8\
-El\xa1\x906\xbf\x9a1Uu\xcfwYUDt\
-^\xdc\x04\x97\x84`\x85\x17\x0b\x95\x96`\xdc$\xc9\xbc\
-@\xfd\xd0\xa0k\xc7\x85nE\xe2\xcc\x9a\xeduL\xd6\
-\x01$\xa9%\x80\xb2\x06|\xe6U\xf0\x98\x0b\xa6\x0e\x0c\
-5\x8e\xed\x06S\x93p\x7f^\xa9\xae\xde\xe0i\x83\x8c\
-\xfd\xca\xc2}ny\xffg\x9f\x1b\xc6\xfd\xdb\x0e\xfb\xdd\
-\xa3~\xc3\x0b\xf53w\x06}m\x9c\x8ad\xc8\xcb\xe4\
-\x97d#<\xac\x16R\xc21,\xd8F\xd0|\xae\xd9\
-y\xf5\xf9\xf1\xde\x96\x1aMg\x07\xa8\x16\xff]\xb9j\
-\x8c\xe8\xdaw\x8a\x81\x12\xfe~\xf5@}\xb7\xad:\xf4\
-\xff\x01\xc667=\
+\x00\x89_x\x9c\xb5}\xdbn\x1bI\x96\xe0\xbb\xbf\x22\
+\xbd\xdd[$G\x14-\xbb\xba\x0a5\x92U\x82,\xd3\
+\xb6\xb6lI-\xc9\xe5.\xa8\xb4t\x8a\x0c\x8a\xd9J\
+fr2\x93\x96Y*\x01\xbd\xfb\xb2_\xb03\x18`\
+.O\x83\x01\x063\x0f\x03\xcc\x00\xfb0o\xf3'\xb3\
+\x8b\xc6b\xb1\x8b\xf9\x85=\x97\xb8\x9c\x88LRru\
+\xb7\xba\xcb$#\xe3r\xe2\xc4\x89s\x8f\xc8TU\xd1\
+,\x9f\xcdg\xd1v\x94\xcd\xd3t\xebA\x0a%I9\
+\xa8\x8a8+\xd3\xb8J\xf2l\xa0\xb2\xf8\x22U#\xa8\
+2\x8e\xd3Rq\x9d4.\xab\xc1$\xb9\x9c\xa4\xf0_\
+\xa5F\x03\x95\xaa\xa9\xca*\xaf#\xdbKv\xe9Z?\
+z\x14=\x9bOg\xd0\xe1\xf5De\x91\x18\x09\x06\x8e\
+FII\xa3u\xa32\x8f\xaaI\x5cE\xc5<\xcb\xb0\
+\x03Q\xb1\x8c\xca*\x9f\xc1?qA}\x17\xeaO\xe6\
+\xaa\xacJ\x1at\x18gC\x95\x0e.U\xa6\x0a\xeev\
+;\xda\xa0a\xdf$i\x9a\x94j\x98g\xa3\x12\xfaV\
+0\xf5$\xabT\x01\xed\xa1q\x045\xe3,2\xf3\xb8\
+P\xe3\xbcPQ\x02\x0f*\xf5\x11\x91b!\x00\xd0\x13\
+\xa8;\xfa\x80#u\xb1\xe7\x0d\x9eK9S\xc3\xb9\x9b\
+K>\x1e\x13D\x93\xfc\x83*\x06\xa3k\x95\xa6\x0cK\
+P8\xa8\x92)@A\x8f\xb0\xb7S\x00\xed\xa2HF\
+\x97\xf0\x11W\xc3\x89*\x01\xb0Qt\x91\xcf\x11\xf0\xdd\
+\xa3};a\x04O\xa5cB\xd6\x95R\xb3He\xf9\
+\xfcr\x12\xcd\xe2\x22\xbe,\xe2\xd9\x04jd\xd8\xe5\x98\
+\x96)\xaa\xf2h\x0cH\xa0Y\xe9\xae\x1f\x00:\xca*\
+z\xb3\xfb\xab\xc1\xde\xe1\xc1\xde\xdb\xe3\xe3\xfe\xc1\xe9\xe0\
+\xf4x\xf7\xe0\xe4\xf5\xee\xe9\xfe\xe1\xc1\x09\x00\xf6\x05@\
+\xe6\xea\x9d\xf4_\xbe\xa1J\x87\xdf\xf4\xe9\xf1W\x1b\xee\
+\xf9\xfeA\xfd\xf9\x13\x8d\x7f\x1c\x11\xd7\x0b`VC\xc2\
+\x12\xa1\x16\xa0\xa2\xcf,\x1f\xc1T\xd3<\xbf\xc2\xe5\x01\
+\x04\x8e\xe3\x22\x8a'*\x1eE\xb0\x16z\x19* \x91\
+\x11T\xad`&\x19-\xc4,\x8d\x87J\x0c\x7f\xdc?\
+\xf9\xee`o\xf0\xba\x7f\xf0\xf2\xf4\x15\x8c\xfe\x0b\x03\x9b\
+~\xf0n\xff\xe0\xf9\xe1;\x04\xeb\x8b/\xcd\xa3W\xfb\
+\xcf\x9f\xf7\x0f\x06\xa7\xfd_\x01\xd8\xbb/\x11\xe8L]\
+G'\xaaj\x9f\xb5N\xf6\x8e\xf7\x8fN[\xdd\xa8u\
+r\xfa\xdd\xeb>~98t\x85\xa7\xfd7G\x80\xaa\
+>\x7f\xff\xd5\xe9\xeeq\x7f\xb7u\xde1]\x1f\xed\xbe\
+\xec\x0f\xf6^\xbd=\xf8\x86\x112x\xf6\xf6\xf9\xcb\xfe\
+)\x8c\xf0\xf8\x8b\x0d\x0f\xaf\x02\xff\xae\xd1\x89\x9c\x01\x15\
+?{}\xb8\xf7M\x0d\xca\x07Q\xd4:ju\xf1\xe3\
+\xf5>\x7f\xbez\xac?\x9f\xe8\xcf\xcf\xf5\xe7/\xf4\xe7\
+\x17\xfa\xf3K\xfe|~\xaa?\x9f\xf3\xe7\xa9\xf9|\xc5\
+\x9f4\xf0/\xdf\x1e\xe2T\xf1\xf7\x8b\xfd\x97{\xbbG\
+H#\xfc\xdb\xfbq\xf2\xf6\xcd\x9b\xdd\xe3\xef\xf8\xc7\xd1\
+16A\x9c\x00\x19\x9c\xa8K\xdaa\xb3\x22\xc9\x8b\xa4\
+J`\xcdK\xfc\x8dd`)\xbf\x0btp\x0d\x9b\xe2\
+C\x9c\xce\x91\xfea+\x8a\xed7N\x8a\xb2\xd28\xf9\
+v\xffd\xff\xd9\xeb\xbe\xa5\xba\xa3\xe3\xfd\xc3\xe3\xfd\xd3\
+\xefx?q\x9d\x83\xfe\xeeqS\x85\xc7\xa6\x02 \xfa\
+\xe0\xf0\xddAS\x9d'M\xa4/\xfbp\x8bhJ\x07\
+o\x8f\x9e\x03A\x0c\xf6\x0fN\xfb\xc7\xdf\xee\xbe\xa6-\
+\xb0\xe1-\xe2\xc97\xfbGG\xfd\xe7\xbf\x13\xb1\x9d|\
+\xfb\x12?\xf6v\x0f\xbe\xdd=\xc1o\xfb/\x8ew\xdf\
+\xd4\xe9P\x8f\xfbz\xf7\xe0\xe5[\x18\x1b\xc7\xbb\x81U\
+\xb9\xca7\xa3\xd6\xff\xfb\xef\x7f\xf1\x7f\xfe\xf9\x1f\xfe\xef\
+\x9f\xfe\x13-\x94\xca\xa0\xa8\x9f]\x02\x9b\x9cP\xc1\xaf\
+c(\xf8\xed\x9f\xfd\xcdo\xff\xe2\xef\xff\xf7\xdf\xfd\x15\
+\x15\xfd0\x81\xa2\xff\xf5?\xfe\xe1\xb7\x7f\xfa\xdf\xb8M\
+\x89m\xcaY\xfc\xaf\xff\x98\xa7T2.\xa0\xe4\x05\xac\
+\xd6\xbf\xfem\x9c\x94T4RP\xf4\x5c\xcd\xabr\x88\
+\x1d\xdfZ\xa0\xcaj\x91*\x00h\x94\x0f\xe7H\x15\xbd\
+a\xa1`\x89\xfb\xcc\x85\xdb-z\xde\x82I\xd0\x97\x1e\
+\xf2\x80\xbd\x1c\x986I\x9a\xf7\xd0s\xaf\x5c'\xc2X\
+'\x86\x8a\xb2\x83&\x17\x01\x7f\x1b^]\x16\xc83\xd7\
+\x87y\x9a\x03L\xc5\xe5E\xdc\xde\xe8F\x7f\xfce7\
+z\xf2\xe4\xf3n\xb4\xd1{\xdc\x89\x1e&\xd3Y^T\
+qVmQ\xbb\xe1\xbc(\xb1\xb6\x11\x0e\xfe\xf3\xdb\x07\
+\xef\xb7\x1eX`\x917\xf5\xe2\xd9Le\xa3\xbdI\x92\
+\x8e\xda\x04\xa5C\xb9\xe6\xd3\x83\xeb8\xa9\x88\xc3\xdf\xdc\
+\xd6X<\x0a\x8a,]DWY~\x0dRe\x8c\x15\
+\xe3\x88\x00\x07\x92Ofn_\xe4\xd7\xa5*\xba j\
+\x92\xe1\x84\x8a\xca!<G)\x90\xfd\x1a\xf8)J\xd4\
+\xa4\x9a`\xf7\x09\x89\xc1V\x15\xe1\xc0\xc8<IB(\
+@\xd0\x02\x1e\x80\x00\x80>\x13~Z2o\x05vK\
+b\x09Da\x9e~P\xa7z\xaf\xe5\x85\xa1\xda\xca\x96\
+\x0c`\x85F\x0bM\xb4GE>\x05\x99\xdan\xeb\x86\
+\x9dh\xfbkZ\x80ZG\xd0@\x97m=\xb8E\x14\
+a\xf3_\xbeS\x17{\x938\xcbT\xda\xfe\x93\xaaw\
+m\x7fQ;\xc4{7\x1a\xcf3\x16\x16\xed!?\xeb\
+\xd0\x00\xd7\xc0\xfe\xf3\xeb^%\x07\xd0\x15z\xf9\x05\x22\
+\xa4\x14\x0fq\xed|\xbc\x03\xcf\xd1j\x00\x805OQ\
+\x01\x18G*\x06\xd4\xc2'\xe2\x05\xd0\x05T\x06\xe2h\
+\x16\xe1\xeai\xcd\xa3\xca/\x154*\x9a \xe8\x09\x1d\
+\xe5\x98;\xed\x01\xf62\x80\x85\x10\x84\x05\x16A\x11!\
+\xbe\xcd\xd8\xbd1\xa4\xd2\x8dTQ\xe0z9n7@\
+\xa2\xef\xa2L\xaf\x928\xa5_\xd1-\x02i{\xe4\xee\
+\x80t\xa9/Kl>\xf5\x9d\xe9\x9f\xe7[\xbav2\
+\x8e\xda\x0f\xf9\x99\xeb\x82:\x01\xa5j\xaeL\xb5[Q\
+\xdd\x83\xe1\xe1\xf6v\x04D\xaa@\x0e\xab\x91\xec\x81\xfb\
+\xec\x81\xea8+\xf2K\x80\xb2\xdc\xe9yM;[w\
+\x8e6\x02\x15\xa1R\xf7\x99\x02\xe1\xaba\xf8B!\x0d\
+\xb4\x91\xca\xfaXEW\xb4c\xdf\x82\xaaW\xaa\xa6v\
+D\xa4\xed`\x01:>\x84\xf8\xef-\x95\xd5\x08\xbd]\
+\xa3\x8b\x8e\xa6x\xfd \x1e\x8d\xfaH[\xaf\x93\xb2B\
+-\xb5\xdd\xb2c\x1d\xc5\x97\x0a\xf8w\xdbR\x09\x10\xf4\
+(\xb5\x9d\xd3\xf3\xf6\xbd\xbb\x032<\xa9\xa0\x15\xee\xa9\
+K5\xc2\x8e\x89\xa8m\xefK5}\xaa\xd6\x1b\xa9*\
+N\xd2\x9e.\xc6\xc9\xfa\xaa\xacWK>\xda\xd9A\xd9\
+\xabI\xacy\x10\xb3b5u}m\x8d1=IF\
+\xea\x08m\x93\xb6F=\xd7<q:\xb6y\xe0\xef\xeb\
+I\x0c\xeaB\xca<jT\xe43\xb44p\x97\xe7 \
+|\x80\x8b\x8f\xa4\xc1\x80\xbb\x884\xcd\x19\xe05\xdc\x93\
+gvK2e\x9cc\xedC\xe2,\x80\x12`\xcd\xaa\
+l\xfb\xf4\xd9qdx?\xfa]F\xaa\xadSa\x15\
+\xf1\xbc\x01e-C\xbcD|L\x030\xf7]`e\
+\xacQ\x8d\xf3\x14\xb4&fj\xc6\x8e!\x03\xc6\xb7\xb1\
+\x0a\xe0|\xaa +\xa6\xca\x9d\xa1\x055\xb1;\xad\x96\
+\xa1\xa0\xc8\xc0\x0a\x8a\x0a\x90\xe1d\xac%)\x9aC,\
+\xafP\xf4(\x95\x91]B\x8a\x1a\xd4\x88\xd1\x1c\xc1\x07\
+\x00\x05,\xc1u\xbcp\xa2cx\x05\xdbH\x83Yj\
+\xd1\xf1&\xa6\xa5E\xa9\x83\x02\x14\xd6e TBi\
+G\x1a\x90\x06\xf3\xd9\x08\xc8\xd9\xdaK\x5cC\x8f\xf2!\
+)\x13 \xacA~\x01R\xf2\x03?\x87Q\xf6Q\x88\
+\x97ln\x1c\xeaG\xed\xb6^?\xda\x08\xdc\xa9\xd6J\
+\xbf\xc5^\x92\x14\x063u@\x9b\xd2]\x13\xfey\xb0\
+L\xc5\xc5\x1fb$\xec\xb7\xd5\xe9\xb2\x04\xcd\xf3\xeaM\
+\x5c\x5c&\xa8\x94\x81\x96\xf9\x1f\xa3\x8d\xd9GT\x9ep\
+\xdd\xadP$\xe4\xea.\xdbz\xd1\x99\x0c\xb5\x82\xa5i\
+c[\x93\xa6\xae\xd2\xa5\x1f\x06\xb1\x9bK\x15`\xae\xa7\
+\xe9v\x930\xceE\x1a'\x9bl\xd6s\x19B\xef\x15\
+\x80\x95\xee\xda\xdc\x22\xf1\x86\xb4\xd0+\x95\x05\xbbk\x80\
+%2\x0f\xd7\xb3\xa7\xbf\xd8Ib%o\x1d\x1ak\x14\
+\xaa\x9a\x17\x99\xe9\x198\xa7\xc0\xdd<\xf3\xb0gF'\
+L\xd5\x00\xe5\x1dm*\xf5\xe4\x185P\xe7\x99\x01\xa5\
+\xa9\xba\x0f\xf4\xaa\xba\x1e\xb0w\x11\xcf\x15\x88\x03\x86]\
+01|\xba \xcd\xc6\xd0\xa1f\xbb\x01q\xd4\xa6{\
+\x89\xeb\x82\x8d{\x15\xd0\xa02\xf2\x8f8\xba\x87\xa8\xba\
+\x14g\x09\xa9+\x9d!X\xe7(,\xa8\xb3\xa4t\xdb\
+$\xbb\xdc\x925{\xe8\xd31\xf5\xc8\xd9\x015\xf6\xd2\
+\x04\x0a\x8e\x91\xe7\xe2\xe35\xa3t1\x9b\xf9\xce\xef\xe0\
+\x22\xaf\xaa|\xba\xaa\x0f]cY7\x95F\xef\x91\xde\
+\x17fI,e\x86\x0f\x98#\xdfz\x0b\xb5\xac*K\
+\x5c\xc0\x9f\x01W\x93\x8dA\xa3\xa6\xd4e\xf6,\x0f\xe4\
+\xf7\x80\x94\x144o4u\x9b\xda\x12\xb6\xb7\x99\x89\x06\
+},c\x06\xa6\x1b\x90\x12\x87\x19h\xd0\x95\x9a\x01\xeb\
+.\x8c0\x00*\x1b%(c\x87\x0al@@3\xca\
+\xa1\x0f\x89\xbaF=\xde2$S0\xe0\xe5\xae/D\
+P\xcd.\xaa\xd7\xd0\xae`\x02\xeau\xf1J\xa1{\xcb\
+5\xb6`l{\xc4\xf5u\xad\xd7\x1d\xef\xf9z\xed\xf9\
+\xa6?\xeaz@j\x82\xc1\xbc\x89\xabIo\x9ad\xed\
+&7Aw\xb9\x83a\x8d[\x8e\xc1\xce(\xda\x16\xee\
+G\x0d\xd3\xeb\x04\x0ca\x15\xb9\x1a\xc6^':+\xde\
+q\xed\xfdjf.f\x99\xebMl\x83\xad\xa0W-\
+ \x96\x10\x94$\xbf\x87uYo*7j\x017\xb7\
+vs\x9e\x82\xd8\x07-\xae=N\xe7\xe5\xe4\x88+\x1f\
+\xd9\xba\xdd\xa5\xee\x97\x8e\x19\xbf>\xc0Y0\x81so\
+\x8e\x12\xdb\xcd\x83\xb6\xa5\xa8\xf5\xe0\xae\x8f\xb5\xd5\x08\x81\
+Uc\xa2\x9a\x89\xdd\x83\xfd\x93\xb5\xdb\xc2\x8e@%B\
+\x98\x9b\x852\xfd\xfc\xa0\xda\x02\x9fL(\xce\xd5V\x92\
+\xf2\x0b\xfa4+\xc2Z\xf2\x94-X\x1e\xb2w\xd1\xfd\
+\x00,\x9e\xb4\x18\x01\x19\xab|\xbc3\x01\xe8\xa5\xf6\x06\
+z\xf8\xb8\x16\xf9z\xda\xc2\xc4%\xa3\xb1Q{\xfb\xf1\
+\xc7\x06]\x00\xe6A$\xb4\xe1D\x8b\xa3 #X\x96\
+i\x83\x82B$\x08\xcb\x1b\x18\xbc\x07z\xbf\x11\x8ah\
+\x1b\x84\x10\xb2;\xb2\xdd\x91\xf6\xa6\x14\x89\x1eG\xe6\xbf\
+\x9f,U\xa4\xb9i\xcd\xce\xbb\xa8\x1c\x17\xe0\x06\xcc\x99\
+\xb2L>\x80rV\x15s\x85\x85\xa82\xa2&MN\
+\xff\x01\x90\xfa\x5c9\xfd\x19\xed'a!X\xe3h\x1a\
+\x03\xc5$\x19\xbb\x9a\xe2)PO2\xbc\x22Wl\xdd\
+_\x8b\xda\x7f\x9e\xe9\x80E\xe02R\xa7\xe8.\xd8\x16\
+\x8e\x1c\xf6h\x08\x07\x81S\xfd\xc4~\x92fK\xb3\xb7\
+\xa9\x1b\xb1\xe9\x14P\xdcC1M\xb7\x18\xfe\xdc\xcf\xac\
+\x11\x16r\x96gX\xef\x97X\xad\x0b\x84()O\xf4\
+\xd0\x9bA\xcd\xf6M\xb4|&\xdd(\x00R\xfb\x0b\xf8\
+_\xc1<\x0d\x84b\xba\xbdq\x92\xc5i\xba\xd0\x84\xbc\
+DO\xed\xf4\x86\x08\x90\xa1\xf6[\xcb\xe7\xb4H\x12\x1d\
+n\x91\xcb5.\x17\xd90\xf2Y\x9a\x9b\xad\xc7\xcb\xb4\
+\xba\x08\x88\x12\x93\xc6\xfe\x9b(\x08a_x\x8a\xa5\xe7\
+\x95\x8b\xc9\x0b\x19r\xb7-Q\x1d05\x83/\xaa\xa1\
+\xb2u\xa3(\x82\xb4\xad\x17M\xc3\xd7\x9b\x82\x11\xc9z\
+*!Ak\xac\xe8\xaf\xe9\xde\xa7\xa6F\xe5\x8e\x93q\
+;;Ke\xb5\xeeRh\xc2\x06\xee^\xe0\x84\xaa&\
+E~\x1d9{>\xa8'i\xca>\xd2\xde\xbc\x1ep\
+\xa2~\x8c\xab\xca\x05\xdd(\xf1\x98\x19\xb9\xbcxJg\
+\xc9\xb9\x99@\xf4\xd9g\xda\x1dh$\x99dB\xf5\xfa\
+N`\x07\xcdB?\x1c\xae\xc6\x8b\xbc\x10\xfc\xc1\xc2\xe5\
+z5\x13b\x02\x8c\x88*\x03\xc7\x9cY\x05;\xbbp\
+%\xb4\x0fD8\xe9|\xadz\x05 7\xfe\xfe\xabo\
+;\xab\x04\xe9\xb9z\x90\xd5\x9c/^%=\xb5\xba\x1e\
+\xa3k\x05^\xc2f\xa7\xa8q)6\xb7i\x1c\xa2\xe6\
+8\x92\x8b\x84Z\xca]\x93\xae;\xbcU\x06\xc8\x1f\xaa\
+\xd2\xf1\xf3\x11\xecC\x90\xec\x0a\x1d:\xe8'\xe2]\x8d\
+>\x9dW\xa7\xa7G\x14)x\x10-\x93\xab\x8c\x84U\
+P\xde\xed\x0d\xf3\xaa[\xa7X\xcd\xad\xce\x1e\xb0v@\
+\xe0\xa6\xfej\xefY\xc5\xa0\xfb\xbe\xb3\xae\xa1z\xfd4\
+\xd0\xac9\x06\xa5\x9d\x8fR\xc1\xd3\xa9\x12\xcb\x82U\xa3\
+\xe4C\x8b\x86\xa1\x8a=\x0eY\x0d\xcbR\xcb\xbf\xf7\xac\
+\xbe\xe4e\x82\xa3lF\xe3\xe4#{Ue\xb0j\x13\
+\xd5\xaeJ[\xd2\x17y1R\xc5f\xf4x\xf61\x82\
+\xf5MF\xd1\xcf\x86\xc3\xa1|\xb6^\xc4\xa3d^n\
+F\xbf\x98}\xe4\xf2\x19\xe8g\xa0\xadmF_\x99\x92\
+\x8b\xfc\xe3z9\x89\x01\xa9\x9b\xd1F\xf4\x04\xfa\x82\xca\
+&\x1aF\xff\xeb=\xd1\xd8\xf9a\x1d\x90\xaf>nb\
+Tsc\x83\xcb\xc6`\xdc\xaf\x8f\xe3i\x92.6\xa3\
+r\x01J\xdft}\x9et\xa3\xf5x6K\xd5:\x97\
+\x80\xd8\xc3 \x1ch\x96\xc9X4C\x8d\x0e:\xb3\xc0\
+\x81\x813Kc\xe8'\x03e\x01\x8b\xde\x83X\x0a\x85\
+\x86\x1a\x5c\xcc\xc1\xba\xcaV`\x9a+0\xb2\xc3fA\
+\x90\xd0R\x83j5\xd6n^%\xb9 ?\xdb\xd8\xf8\
+rc46\x02\x8bb\x89\x0d\x8bd\xa6$\x96\x00\xf1\
+,\x96\xa1y\xc1\x82\x80\xa3\xc3J\x0d\xd4\xba\xa7\x7f\x98\
+\x82J\xd6\xea\x86a\x02A\x842:\x19vH\xd5,\
+\x8a/r09du\xea@:\xd1\xa8 0B'\
+\xf95o\x94\x8f\xddH\x98\x9bwx\xfd%\xb3\xb3\x86\
+!\x0dglA\xbd\xd5\xbc\xadh\xeb\xcb\xfd\xa5I\x0a\
+W\xfa\x22\xcd\x01\x1b\xe1\x06L\xd5\x98\xd6\xf5\xe77\x1f\
+og\x1f\xdf\x87\x8f\xd9\x0d\x01O\x17\xfcT\xceN\xc4\
+ \xec\xcc\xea`\xd6\x01ARhY\x19f1\x5c_\
+\xbfi>/\xd5|\xd6\x10\x99Y\x8eCm:\x99\xcc\
+\xaa%(5\xb6\x8c\xc9\xb4\xb1\x9e\x96K\xb4Gt)\
+\xa3TV5rl\xdb5\x05\x0c\x9d\x80\xf0\xce.\xdb\
+\x1d`\xca\xc9\xb4-\x14X\xd1\xc4\xf7,\x16\x18q\xf2\
+z\x81q\x8f\xb1p\xb7j\x1b\xad\xda(\x7fC\xd2C\
+\xf0!\xd6zVs\xdb\x99@\x8f#6lC\x0b\xdb\
+\xa5\xe6\xce\xaf\xf7\x85\xd6ADl/\x08$\xb9\xc0\xc9\
+>\xf0-N-\xa1L2N\xeb\xa2M\x0a\x1a}\x11\
+Ms\x00n^\x5cRd\x05\x13N8\xc9\xab\x05 \
+\x1a\x83\xad\x85\xd1\x90K\xb0\xb4\xb2^t\x90W\x94\xdc\
+\x94P\x14\xc5\xf4\x98\xa37\xa7\x95\x94{6\x88\xa3\x17\
+\xaa$\xdbl\x8b\x841,L\x82\x82\x99\xa2Q\x18d\
+A\xb8\x88l1\xa6F\x10r#5\x0au\xf8b\x9e\
+\xbdK\xaa\x09\xb0;`#\x85\xca\x86\x8b65\xefF\
+i2M\x00=U\x5c^u#\x013(\x94\x0e\x1a\
+)\xdd\x0a5\x8d\x93\x8cs\xf5\xa8\x0fV\x99\x07\x09\xb1\
+w\xd6B\x13A0U|\xa5\x0e\x98VB\xbd\xe0\xa1\
+\x18/4\xe5\xdd8\xbdr\x92\x8c\xed\xe2\xb2\xc6IF\
+*+\xa6V\xfc\x80eNi\x89\x94\xb0\x03\x1fOE\
+\x17\xa9\xca.\xab\x09\x94\xae\xadu<\x1dY@\xc0\x18\
+9\xb3\x8d@c=\xefF\xf2g\x07\xfa\x5c\xd5\x00!\
+\xf2\xdbP\x89\xe7\x06\xd0P'\xbe\x06}\xfb\xa0y\xe6\
+3`\xdc\xaa}A\xe1\xc5\xc7\x9d\xb3\x0d\xd2~n\x1d\
+ra]5ny\xc1%\x86\xd9/\xd3\x0e\x91\x10}\
+\x0d\xd2\x1d\xec\x80\x87b}wz\xd2W\xc1]\x93\x84\
+G\x97\xbf^\xbf\xb6\xd5\xa4\xb4\xed\x05\x14\xa31@U\
+a\xde\xf4)\x15(\xfc\xca\xb5\xb5I\xde\x03]\xb1\xbd\
+[\x14\xf1\xa2\x87\xae_\xb0\x8c\x19\xa8M\xe7\x18\xd5\x04\
+\xc9\xa4\xc5O;\xa4\x8a\xf1T;R\xd2\xd8\xb9\xf9\xfc\
+X\xcc\xec$\x81/m\x176\xee\xe8\xac\x13j\xce\xd8\
+\x12)\xa0\xa8\x96\xd7\x22\xcd\xd6K\x06\x8bQ\xc9\x9c\xc9\
+\xf8\x02\xf6]S\xaac\x5c\x91\xebC\xe1\xa6\xa6\xe8B\
+LF2j\xccS\x05\x9c\x02\xe7\x82\xdb\x18{\x8dG\
+\xbf\x8e\x87\x94\xe7\xe6:\xbeP)\xd8\x85\xf5\x1c\xc9^\
+\xd4\xa7\xdc\x1cc\xcda.g\xa9Y\x03\xa8T\x08,\
+\x85fQC0\x5c\xc2v\x8bQW\xcaeI2f\
+'\xb3Din\x12G\xa5?7`\xa1\xc8M@<\
+\xf5\xea\x01\x0b\x0bg\xdb\x81\xdcu\x10\x0ch\xf8\xb2!\
+\xb8XZ\x7f\x0a\xeeS\xc2\xc4H8\x07\xb8.y\x1b\
+\xde\x98g!\xc7\xe0F\x8eT\xad\xc7\x8d\xfc,\xfa\xa9\
+\xa1\xd3\xda\x08\x82*\x1d\xe8\xce\xd6\xb4e\xbe1\xad\xd9\
+X~\xa52\x9c\x01\xec\xc5d\x8a\xde**p\x8d\x84\
+\xbd\xaf\xeb~\xdd@\x1b\x0et1Q\xb7\xb5h\x1d,\
+\x86E\xe7\x0eJ\x9d\xe6\x83\x8b7\xe0\x0d'\xed\xfe\x10\
+%\xc6\xf5\x14,\xcffm\xbd\x80\xbduM\x80.f\
+\xc3C\x8cAL\xe3\xd6%\xb7\x98M\xce\x02T\xcc\xf9\
+i\x03\xd9\xfa\x1cW\xaf\x0ap \xfe\xd6\xd3-\xd7\x0c\
+\x8a\x9fn\xaf\xc4[d\xdb!\xe3[\x03\x9d\xec\xfb\xec\
+\xe77\x16S\xb7\xef\xb7j\x15\xf5\x00\xdbz\x84Z\x85\
+\x00\x17\xc8\x9e\xeb\xd8\xb1s\x0f\x13\x82\x1a\x17RP\x1f\
+/\xc1f$\xc8\x8b\xe1\xf8i\xabBq\xf3\xe86\x90\
+\x1f>P\xcd\xb4\xd5@\x18\x1eT\xbf\x034\x92\xe9\xd3\
+\xf7\x1a\x04~\x80\xbd\x0c\xcc\x83ed\xef1\x11\xe6\xa8\
+\x1451\x15@\xf7@o\xdf\xa3\xb3\xff\xdc{\xb8\xf3\
+?\x7f\xf3_\xff\xfd_\xfe\xcb\xbf\xff\xcb_\x9f\xaf\xb5\
+w6\xcf\xfc\x92\xb3\xff\xd0\xfa\xb7\xdf\xfc\xe5\xbf\xfd\xe6\
+\xcf;\xdf\x9f\x9f\xff\xd1\x8f?\xef|_\xfe\xd1#\xd0\
+\x8aAK>\xb3\xdd\x9d;>\xa4\xb9\xa3\xe4XT\x84\
+z{\xcb+\x19X\xd6@\xaa\x88\x17\x22\xd0B\x00x\
+\xac\x05\xdfP\xb2N\xc9\xd15X\x96\x90\xa3|>\xc2\
+ \x8b\xf6\xb5`\xb2'(\x8f\xc39\xea;\xd55\xc6\
+O\xafA\xf7,\x05g\xc2\x94\xb9\x06\xc6d\xba\xee4\
+\xf2!\x0ci\x22\xd2w\xabw\xd8\x9d\xa8\xbd\x19\x9d\x99\
+\x1f\xe7B\xb5rc\xe1lh\xccPcX\xc1\x22\x9d\
+\x1b\x86l#B$p\x00\x0f\x7f\x96\x01\xac\xe6\x9b\x91\
+^\x1a&c\xfa\xae\xed\x0d\xb1\xf9\xfc\xa5\x12e\xc1b\
+\xb9\x1dd\xda\xac\x11uY\x07\xa7\x0f\xa1\xcfA8\xbf\
+JL\xc9\xc0a\xac\xbeUp\x0a\x07<\xd7k\xd8\x11\
+fq\x9c\xdd\xe4\xaf\xb8 M\x5c\x17\x8f2c\x8aE\
+/!L$!R\x10\xa0cR2\xab\xf6\xa3\xf6\xce\
+\xd3\xed\xef\xcb\xce\xa3\x8e P\xf2u`\xb6p\x0e\xf4\
+W\xceb\xdc\x11\x9a\x1a9K\xb8\x81\xb0\x86\xa0:\xc4\
+CL\xde\xe8\xa2\x22D\xe6\x11\x86|\x08\x18\xca\x9c\x15\
+\xb4;\x9c\xcc\xb3+7\x15\xa1\xc6\x93eD\xa0\xeb\xaf\
+O\x09j\xab\xc9s\xe1\xdajY\xc1\xdd\xf3\x0aP\xeb\
+\x92\xf4ij\xdb5]4\xf5\xe0\x19\x1b\x02q\xd4!\
+b\x8e{\xbe\xef\x0e\xa0\xda\xfe\x16\xc0\xa1q\x07\x88u\
+\xba\xff\x06\xc0\xf5\xd7t%\xf7V\xe4\xd3\x81+ZE\
+\xf5\x1a\x8d\x04\xe2\xd6\x83z\x9bUD\x8f\x83\x1bbo\
+\x80I\xd28>6\x9a\xf4\xf3\xc37\xd15XP\x18\
+<\xd6\x99\xe7\xc4\xfa2$\xb78C\xccQ\xe0\xa9@\
+\xef3j\xcd\xa8\x8c\xa2\x1b1\xc1$M\x9dY\xed2\
+\x12c\xce\xcb\xc4\xf3K\xa0\xe8\x89\x94gX\x15>\xb1\
+\xa5\xf4\x01\x02\xcaC\x8c\x17H\xcd\x18\xfb\xa4\xac\x14\x1e\
+\x05D]\x85'\x88\xa01V\x9f\xf1q/\xe8\xc4\xa6\
+\xe8c2\xe4\x80%\xa2!XJpI\x17\x04;\xfa\
+\xcb\x90\x02p\x0a&C\x9c{\xb09\x96\xb8\x91\xf0D\
+\x98\x19\xb2$$\x00\xa7\xf5\xc7\xc0.\x1a\x92\x1f\xf5S\
+n+\x0e\xad\xe8r fju\xc3\xa2\x17\x8f[l\
+t5\x96\xddW\x0aj\xd3OF\x83\xf9\x8d\xfa\x04%\
+\x02\x80\x98Y\xe8./@\x04L\xa6qq\xd5\x9bT\
+S:\x0b\x80\x95\xf5d\x09\x87\x84}\x93M\xca\x0c\x81\
+\x06\x7f\xc0\xfa}\x5c\xce\x0b5\xd0\xf0\xe9&\xf6|\x9f\
+`u\xc3\x89\x1a\xcdSuL\x15\x85\x0b\xed\xa1\x9c\xb2\
+\xf3_yh\xd0^\xfe]C4/\xb0\x9c\x03\xb4\xdc\
+_C\x8c\x88\xe2\x17\x9cx\x8f\x0cN\x07\x0c\x066\xbd\
+\xd0\xb1[\xb9\x22\x94\x82\xd8X\x15G\x08'\xd1\x90\x15\
+\xe2\xcd\xaf\xbe\x9aV\xcf\xd1\x8c\x0fH\x10\xf6\xc5\x14\xad\
+\xd1^\x96_\xb3\x16\x05k\xa4O\x0c\xd8MSj\xf2\
+eMM\x1b\x7f\x979:\xa9\x90\xe0\xd0\xb8\x03\x039\
+\xc5\x5c\xab\x98t\xaf\x07\x81\xb3d\xc38K$\x85[\
+>\xeb\xfb\xeb0g\xa0\xa0\x99\xe3^\x1d`b\x1az\
+\x82ni%d{\xab0k\xabN\x8f]\xf7\xd5?\
+\xd7?_\xe8\x1aF_%\x105;\xb2\x8cs\x19\x98\
+\xc0I\xad\xf3(\x80\xa2\xc7\x00s\x1e\x13\x7f]Q\xd9\
+\x9b\x15e)\x89\x02\x0b\xc6\xda\x1a}\x13\xb6\x9c\x06\xde\
+\xf3\x8b\xd7{G\xd59N2\xe5\x87vu\xf8\x0dy\
+X4\x8d\x17\xd1$\x06Mp\x0a\xea '\xa4\xe3q\
+G\x5c\xc2\xa1\x12\xa7P\x80o\xea8\xdc\xc8p_\x1c\
+\x9e\xc7zFgR\xdb\x06(\x7f\xadv4B\x0e\xb0\
+[\x81\x94\x1d\x7fE9\x1f\xd7rq?\xdf\xbd\xbe\x07\
+\xce\x99\xeb\xba\xdd\x22b\x9a\xa2r\x10s\xc1_NN\
+86\xd6\xd3,\x8cs\xfc\xbd'Zl\xac\x85\xf4f\
+\x08a-\xd8\xb3\xc9\x0fJ\xf4\x11T\xd6\xfb\xcek1\
+LU\x5cH\x87\xb7\xe6\xd1\xcbvd\x1d:\xe2\xa9\x08\
+\xa1i\xb9\xce{\xda\xb8\xc3\x1b\x19\xa3T\xba\xdc).\
+d\xb4\x94\x95\x15\x15t0\x97\x8f}\xd1Q\x04\x8c\xba\
+b\xf4\x09d\xda\xe2:^tq\x89\x86\xe4X\xae\x22\
+\x90\x8e\x8a\xd3\xb5\xa6\xf1\x95\xa2|{\x1e\x14\x03\x034\
+\xcc\x87<\x19\x05!\x9d|<\x06\x0e\xe7R$\x83\xa9\
+\x09yA:r\x88\x0b\x98\xa5\x9eo\x9d\xe12\xda\x99\
+q\x99\xd8\x5c\x13\x1f\xf1\x8dK#+|\xe7\xb3$\xa7\
+U\x07\x02g\xb1\x8e\xfb\xad\xa4@\x17\x03\xce.{\xbd\
+^\xab\xa1As\xe0\xcfF\xf8~\xf6\xe5\x97_Z\x87\
+\x13\xa5\xe1\xafS:\xfbF\xef\x0b5\x0d\x1ep\xf8!\
+xF!\xc2uR\xae\xc1\x1a/\xd4:\x86\xda\xf9\xe1\
+{G\x85\x96u\xdck\xce\xb66\x903\xe89\x07,\
+dZ|\x06r\x9d'\xd8\xd2\xf2\xe4\xf4\x0eW \xcb\
+w}\xe4\x0d\x15/4M\xad\xe0A`\xbd\x01%\x07\
+\xf4Vs'\x84\x1b\xf1\x89\x5c\xa8\xdd\x8aZhv.\
+\x0d\xe2\x16:*\xdf<\x88\xbf\x5c\x9d\x86\xdd\xae\xfd\x1d\
+\xcb)\x8e\x11{\xbbD\x90\x0bo\xb3\x1c\xc9(\xb3\xef\
+p\xfdh\xf9P#\x1d\xc3\xee[\xcc&\xa88\xa3\xb2\
+\xf9\x83*\xf2\xf5\xebd\x04\xccF\xdaE\xe2l\xa6\x7f\
+\xc6\x1d\xdb`1j\xc8T\x80\x02\x01/;\xb8,\x14\
+ni\xe9\xe3\xde\xbf\xcc\x80\xcd\x03\x16t\xbf\x80\xee\x91\
+r\xda\x13\xfe\x02K\xe2\xf3'hf\xd0\x8f\xa7\xd1\xc6\
+\xc7x\xc3qf\x9a\x94V\xc7<e\xbd\xad%7\xb6\
+\xd9\xc6\x1e~\xfc\xd1\x95P\xe2%\xf4\xd3T8j(\
+|\xfc\xe5W\xb6\xae\x06\x0a\x8b\x9flll8\xc8t\
+\xc9\xa8\xd3\xd0\xc1\x93\x8d'_5\x17\xffqs\xf1\xb8\
+\xb1\xf8\x8b\xa6\xe2\xcf\x11\x8az\xf1X\x8d\xc7\x0f(\x85\
+\xcb\x0b\xf3\xc6\xe5^>\xc5\x9d\x01l\x944G\xf6\xad\
+\x12w\x17G*\x8cb\xc5\x5c\x9f\xb4\x162\xb4\x1b\x82\
+P:~[[J\xaa\x8f\x14\xb3\x07@\xedV\xed\xa4\
+#\xe236oO\x9e\xa4\x10\xcb\xa7\x97\x94\xc9\xf3\x18\
+\xa8\x19U\x07s\x83\x02j\xefx\x12k\x18\x97J\xd0\
+$\xeb\xf2\xf7\xa1\xc8:)\x0e\x11)\xc3\xcab\x84!\
+\xa5\xeb?\xe8p>\x0b\xfa^\x95\xbf\xc6\x9f{0\xb0\
+\x8b\x0dS\x0d#\x8f1\xfc\x220\xe5y\xca\xc6`\x0d\
+\x09p\xdd\x1c`RS\xbc\x82\x03&\x90\xa1\xed\xd6\xe5\
++.(\x85\x99D\x9a\x0d\x98\xe6 D1a\x12k\
+\xb1\x03\xcd\xc0'\x22R\xbc\xa4x\x86\x98\xf3\xa8\xf1\x8b\
+\x0f\xfa\xd9\xc6y\xa7\xf7kP\xb3\xdb\xad\x96U\x90\x9a\
+\x1c3h\x1ej\x08@\x19oa\xcf-O\x90\x13O\
+\xbdR\xb3\xca\xcd\xccve`g;\xf0-(\xf5\x9f\
+?!0\xdb\x12C\xc6\xdd\xe3+4d.\xce\xb3\x81\
+1%\xd6\x1fo\x85\xb4\xc9J\xffv$\xf1_\xa3L\
+\xa4\x5co\x818lX\xa3V\xae\xb3\x8c\x5c\xf5L\xce\
+\xb8\x8f\xb55LKK@Q{,\xfd!\x0e\xdc\xa7\
+2\xad;\xf2\xe6\x11\x06M]\xf4\xc1\xd5\xfa\xdaK\x0b\
+\x17^\x09\x06\x92\x1d@\xb6:Fz\x5c\x86X\x0de\
+\xb5\xad%\xbc\xe6\xd0\xaf!\x82\xae\x99\xe3\xa6\xf9\xd2+\
+\xe7\x171\xad\x16\x9a\xda&\x88i\xf6\xe4\x8bDo*\
+6\xd6j$a\x85o\xab\xa4\x1bt\xf4\x9d&\x99\xd9\
+\x88]\xca@@7\x05:1(\xf8\x8fO\xdc\xed(\
+\xc2\xf2\x84\xa1\xacc}\xdfX\x89G\xe4\xceo\xe3\xd1\
+\xc1\xae\x08\x85\x05>F.\x1dP\xd0P:\x1b\xd5\xc7\
+\x19\xdf#`\x1cM\xbe\x83X\xeb\x0d\xec%\xf6z\x8e\
+\x5cS\xf48\x09\xb6!\x02]\xc6(\x88\x02\x10x\x15\
+M\x07r\x03\x88D\x16\x8eSx\xd0\xd2\x15D&\xae\
+c\x22\x81\xe4\x22\xd5\x19v\xbe\xf9}\x1d\xa7WMZ\
+\xd6)p\xbdw\xf4L\xa3\x0dU\x97\x17I\x8a\x07s\
+O^\x1d\xbe\xa3Ka\x80qd$\x84\xb7\xbf\xa6\x19\
+\x84\xf7\xc5\xf4@\x84P\x0da\x84\xed\xf4\xb0\xe0\x80\x5c\
+\x1c;\xb2\xd7\x17\xfb\xafO\xfb\xc7\x83\xe3\xfe\x7f\xea\xef\
+\x9d\x82~T\x7f\xb4\xbb\xb7\xd7?:\xed>\xd0\xc9\xc6\
+8)\xb2\x16\xb7\xe9P(\xf5{\xba\x98\xb1P\xc3\xd6\
+=\x02\xe4\xe0\xf0y\x1fF\xc2*\xd0+\xcf\x97\x0c_\
+R\xc6:vA\xb7\xb83tR\x12V\x0d\x13x*\
+\x83\xa7\x86s\xe8qk\xbd\x85\xee\x03\x9d\x08\xaf\x99\x1b\
+\xfa\x0d$\x19\x10jFq\x15\xcbc\x842k\xa8\xf9\
+\x0c\xa1\xf4\x17\x9bU\x15\x1dX\x9a\xa1:%&\xc2x\
+\x92\xdbu\x0e{\xf3u\x9e\x83M\x05zmU\xa1\xcf\
+d^\x90\xca\xcb\xd7\x0b%x\xca\xbaTMb\x12\x8f\
+\x93W\xd2[\x1e\xbb\xedhn\x8a\xc8\xaf37\x09t\
+\x8a\xd0\xe5\x1d\xdb\x96\xd5\x09\xc6\xae\xe3\xa8\xfe\x1dE;\
+\xc0\x95`\xc5\xdct\x9a\x9c\xd9\xfe\xedEk\x9e<\xed\
+Q,\xf7p\xdc\xf6n*@\x1c1(\x01\xeb5\x01\
+\x00>\xf6]\xd2mJ\xe6\x9c\x877{\xcc\x22\xbaR\
+\x98A5R\xf6j\xac\xd2\xf6\xb3\xec\xf2\x06\xeb\xc2\xa7\
+\xd1\xe5\x82\x8a\xadi\xe6%5(\xa3\x15\xb8T\x04\x86\
+\x11\x0f\x98G\xe5UB\x87\xf9\x89-^\xe6\xd6f\xd6\
+\xfcQ_\xd8\x05\xbf\xa7\xd4\x8d\xce\x92\xb9\x93\xc4\xb5\xb3\
+^0\xa43\xaf\xcd9JS\xa1\x09\xf24\x12\x1bo\
+ul\xc8s\xfe\xfc^\x877hk\x86\xe0\x86\x88\xd1\
+l>+\xaa\xceVw\xab\x9d\x17\xf0\xf9\xf8\xdc\x8b\xf3\
+F>g\x0d{\xb7[\xd9L\xe0\xd6\xa8J\xf7\x9d\xb2\
+K\x9e\x5c\x8aE\xe2\xfc65G\xdc\x0eF\xe4\x00\x8b\
+\x9f\xbb\xabrD\xa0\xdb\x9e:%\x07\x8a\x09#\xa8\xb8\
+H\x134o5s\x82y/\xf0b\xa9dd\x85C\
+\x18\x10\xd7\xda\x19\xebe\xde\x84\x1c\x1b5\x1a\x97?\xdf\
+u\xceQ\xfb\x9a5\xb1\xf5u\xcf \xb0\xd1v\x919\
+Q\x0f\xc5\x0b\xceq\x17\xbb\xb7\x15#`\x22\xc6\x12\xde\
+\xe4fN\x12\xf9\xa6\xb1~\x8cE'\xc6\xcd+\xfa\xd9\
+\x0c\xfa\x09\x1b\xa3\xa4uY\x0aM\x5c\xdb\x88\x04I7\
+$\x11\x82\x94\x0bs\x95\x82\xf4\xcc6\xd8b\x96\xe0L\
+_(N\xa9\x90<\x1aT\xc7<\xd0\xe4)\xe6\xa6\xc5\
+E\x13\x96\xc5D\x03\xd1\x1dz\xc1\x033:\xec\x8d\xd4\
+\xbf 13\xc8\xc8\x96\xd1\x8f\xdf%\xad\xd7Kf}\
+ \x0f^\xf9\x97-:\x1bR\x13\xb8\xcb\x9cC};\
+\xcc\xa3\xab\xe5\xc6q\xef\x9f\x94F\xec<Z\xd3)L\
+\x0b{,\xf9\x00\xd8\x92$\xe0\x1e\xd7\xdc\xd5\x15\xf7\x8c\
+\xc3\x86;s\x8d\x0a\x85N\xf3\xdd4\xa5\xa6\xa5?\x9a\
+I4\x0e\xb4:\xaajjrj1w\x88\xcb\xab\xdd\
+\x84e;\x00\xb5\x13\x8e\x1c\x8fF\xdc\x11\xf5\xe0\x8d\xfb\
+\x89\xe9\xd25\xed\xbb\xb4mt\x1fzC\x99\xa8\xfd\xf7\
+\xd9\xda\xa3\x8e)\xa3D\xdc\x19\x99\xad3\x93k`\x9e\
+\x8dIs\xb4\x8fksh\xc0\x9e7\x0d\x9b\xc1\xb7:\
+\x0dp\xa5\xbd\x11\xe0\xd13=\xccx\x98pM\xcdt\
+@\x91\xaem\x9c\xe4\xe9\x088\xf3|\x86\xac;c\xa7\
+\x04\xddP\xa9\x0f&\xd3\xf9S\xbaX\xc6\xbf\xc5\x06L\
+\xb0\xe4\x83\x92\xc92\xbe\x0fO\xccG\xa71\xdf\x84\xbb\
+6\xf0I\xdfZ\xdd>jtk\x07\xad{\xc6\xe9\x18\
+\x96/w{\xfb\xc7\x07\x83[\x0e\xc4:\x043a\xf0\
+\x03g\xa8>\x08\xee\xce\x84\x06\xcf\x83E\xd6\x9a\x939\
+]\xd9\x904n47\x0d\x869<\xb9\xe2ZPS\
+E\xe7'\xb3\x05\x80\xf9\xbcI\x90\xb7\xe8X\x94\x15\x19\
+\xf2\xb0\x8f\xddA\xfe\xc9O\xe6\xfd\xa2\x19\xab\xd1]\xaf\
+\xc4\xbfU\x0c\x87]\x1d\x02\xe6D7\xaf\x91\xdfam\
+=\xb0\x81\xa8!22\xa2{\x8d\xb5\xec\x16\xb1e\xe7\
+$\xef\xdf\xf3{y\xca\x8d\xfa\xd8\x8c~~C_z\
+SU\x96\xf1\xa5\xba}\xdft\x90\xdc\xcc\xa7=\xb0'\
+\x95y\xc9\x9a&o\x0f\xc6\x9aVBtx\xf4,\x5c\
+\x05\x09\xa5\xc51\xcd\xb9y\xddgN\xad\x869-\xb9\
+\x0aKxq\x1a\x11\x19\xa7\xb0-\xdb\xf7G\xd2m\xa4\
+\xcf\x5c7\x8aS\xe1L\x97\x8e\xe3 \x1b\xc8\x19\xb4\xe8\
+\xd9\xbc@k\x11,\xa0B\xba71\xff\x84\x13\xa6\x10\
+a\xbb'{\xfb\xfb]\xcc\x11\x9cW6=\xc5\xd6\xe6\
+\xa8\xccuR*\xed\x03\x88\xcba\x92\x0c\x86`T\xd9\
+\xf3\x11M\x01\xffU>\xe9\xba\xff\x19\x1a<~\xf2\x95\
+['1\x88\xb9\x8a-\xf0\x95QF\xffP%i[\
+\x02\xf4(\xfaE\x07\xcc9\xe9\xc5\x04eX\xd4\xb0\xb7\
+R\xa0\xb7\x85\xb4t#\xb3\xf9\x94\x0c\xf2\xfea\x9e\xa2\
+\xdc2\x17\xb6\xa9\x82\xb2\xcc\xe8\x5c\x975?Y\xa9\xa7\
+`:\xc9M\xe1\xae\xa6\xc6xG\xde3l\xe1\xdf\xce\
+A\x9d4x\x90\xb8\xf30[\xfd\x1e\xde\x22/\xcaZ\
+w\x1b\xf5_\xf71\xcb\x0bOv\x09\xa6\xedV\xc2\xec\
+B\x01\x04\x98\x82\xee\x97I*(m{\x1bC\x89\xea\
+w\xc8\x92\x03\xca\x86B\xe3Kt;\x81&\xf2\x16\xf6\
+\xa0\xf6n\x8b\xd6\xa6\x1e\xc5\x10\xf10\x9a\x1b+\x08%\
+\xd6\x1bqj\x01j\xa0\xbc\xfb\xc3\xe0\xc52?\x974\
+\x10t\xd5\xe06\xe3\xa6)4{\xce\xd8=\xd6\xe89\
+C\x9c\xd0>\xb5\x8e3\x1b\xd5\xb3\x06j\xdbN\xa5\xc1\
+\xade&\xe4\xd1\x86\xe8\x83\xcdR`n\x86\xa08S\
+M_88\x04\xc5d\x81.\x22\xc7v\xec\x82\x9b\xa9\
+\x01#,\x16\xac;\xe3a\xe5^\x80\xf1\xd5\x1e1-\
+<Yb6\x84\xbe\xf1N\x18T\xac@\x81,\xd7\x1e\
+\x81\x06\x821XO\x0f5\x5c@\x5c\x8cA\x131\xbe\
+\x04/\xfd\xc3O\x00w,\x80\x9b\x04\xa7\xa61\xd1\xf0\
+\xd9\x82x\xe13\xcauns\xb5\xaeN}\x96\xbb1\
+\xc8\x0f\xa5\x8b\xdb)\x05\xb3V\xb2<\xd9\x95W\x07d\
+\x0d\x0f\xe3{$\x97el\xf2\xde\x12\xb2\x98B\xaa8\
+Pp\x8c\xca\x1b\x5cdp\xca\xb9\xd0p\x22\x15\xd5O\
+\x07\xf5'dKj9\x9bze\x09\x06\xea\x86`4\
+z\xa2\x07\x86L\xd94\xc9\x9a!\xf0\x16\x0f\x8d\x80\x89\
+E\xe4\x0a\xf70^\xf9\xd6\xd1?\x80\x01\x8bO\xd1:\
+ye^$\xa0\xad\x13\x93\xbd\xe0L\x04\xc9\xf5\xb3\xdc\
+$K-\x14\xd0)f2\xea\xbb\x8f\xf9\xe6K\x94\xee\
+\xfa\xe5\x02&\xfdj\x1c'x'%\xfc\x1f\x1e\xe4\xa9\
+\xb2t8\xcf@\xec'\xe5\x84\x8f\x13\xe9[\xb8\xf5\xb1\
+\xf2?\x98e-\xa8\xf4>\xf7\xa4HM\xbe\xa2\x04\xde\
+\x84\xd2>\x1a\xd3\x968:\x89\xd7;%?\x00D\x9a\
+I\xd1!W4,q/\xa2\xd5\x87\x06Z\xa5\xe4\xe3\
+\x0c\xcd2s\xb8\xc5\xba\xce\xd0T3\xbdJ\x03\x0c}\
+h\x18\xfd\xa4[\xa5\xccy\x06\xeaM@kEn\x83\
+d\xee\x8d\xa1\xa77l\x99\x85,\xc7Yb\x8d\x0aV\
+S\x16\xb5Usw\xc23'\xd4F[\xd0\x98\x0dc\
+\xb4\xddp\x5c},*<\x07\x93\xe8\x13R\x1d;\xc2\
+ft\x164]rv\xe6\xbc\xc1\xe0\xab\x9b\xa9\x9a\xfb\
+N\x03T\xd4\x8d\xd3F\xb3\xd4\xd6\xa7[6}{\xd3\
+^,\xe2\xdb\x93\xc1\x053\x9eM\xe9\xb6\x03\xfa>\x1a\
+\xacJ\x12\x8d\xc0\x9aG\xa0\xad\xfa\x9a\xa8\xbc\xbf\x0c\xa5\
+\x10\x18\x12\xb8\xdeG\xfa\x8a\x12\x8c\x97\xea\xa92\xabr\
+\x97+\xa1\xb2,\xce\x13\x98KM\x22\xee\xc4\xe5rw\
+\xa3I~\xcdT\x1ag\x0bC]\x0c0\xfa\x09\x92\xca\
+\x82g\xfa\xf0\xf3p\xdd\x22\x10tf\x1c\xff4b\xb4\
+\xb4\xf1]3t8\xa9M\x95Tf\xbaN\xa2\xdd\x94\
+`\xe7\xb6\xb5=\xa0\xe0\xbc&\xb8XZ\x96\xd0\xe5\xbd\
+\x94\x17\xad\x0f\xabg\xfaR\xae\xd2\xbb\x8b\x0bo\xee\xc5\
+\xeb\xcd1?\xd0\xbb\x97\xcb\xa1\xc0\xca\xdf\x06\xa9\xed\xab\
+\x05D\x98\xf4\xdd\xed\x1c\xbb\x17z\xbd\x1e?\xb2%>\
+\xc9l\x86\xd4\xe7\xd9\xd3\xda\xce\xdc\x5c\xe5\xca o\xb9\
+i\x02\xdb\xd0|]\xf2Z\x8d\x86-w\x7f\xef\x07#\
+e\x89\xefC\xbc\x92\xc3Z\xd0,V\x1d\xbb\x8a\xbc\xe3\
+\xd0\xd2\xe7A2\x1aQ\xe9\xb9K\xba\x01z\xec\xe5a\
+z\xc7K\x9f@\xdd\x91\xe2\xa6\xf8\x13\x9c)\xd4a\xcd\
+\xa1B\xb3\xfaD\xa7\xcaJ\x87\x8aX\xe6\xf0\x81\xe7K\
+\xc1\xbf;\xd3\xf7\x97\xfaR\xf0o\x95?\xe5>\xbd\x7f\
+\xaa?\x85\xc6\xf4~\x09\xe6\xa9/\x0bnHat\x7f\
+\x8e]\x18;\xdb\xfcq\xac\xc8\xe3B\xf5\xf9\xd4\xb8T\
+\xf3\x89\x09\x9f\xd7\xad\x80\xffV\xac\x5c\xa7N\xe1\xee\x1c\
+?\xecyG\xce@\xc8>\xc9\x86\x97\x86\xba\x1d\xfb\x93\
+=G\xc1{\x12\xbcD\xe1[wf\xcb\x0b\xab\xdd\xbd\
+\xde\x9f\xeck\xfa\xc4%nZ^y'\x84\xd6q\xc9\
+\xebdD]\xa2_\x85\xa3\x13\x87(\xfd;6\xe1w\
+{\x8e\x00\xc3\xf5x\x924\xce8m\x97\x08\x80\x19\x1e\
+\xc1\x1cP@@HF)\x90d\xd1^qs\x9b\xc0\
+~\x80{\xc0\xbc\xc3\xc7}\x1d}\x9f\xb6\xd1\x18U\x7f\
+H_\x1e\xe5 \xd6.\xc8\x9f\xaa\xe9\x05]j\x7f\xb1\
+\xf0n\xd3\x9f\xc1&0Y\x1f\xfa|\x85\x8b9\xe7\xa3\
+\x059\xb1\xcc;\xc3\xb0o\x1d\xfd\xd4\x8a\xb2\xbe\xb7\x81\
+\xd0\xc0\xa9\xc2\x17\xb0\x84Q9/>$\x1f\xf0\x08H\
+\x9a\xc7\xf4\x82\x02k\xb8\x88$\x87\xf8\x82\x0e\x87\x8c\x92\
+r\x18\x17#5r\x967\xd6\xd4\x0aa\xa9\xf3\xef\xbd\
+\xeb08\x0b\x12\xe8\xa0\xca\xab\xc5L\xe9\x90Q\x0fO\
+\x1a\xe8\xea\xb0\xa3\x93t\x04\xdf(C\x12\xbe\xd2^~\
+H_\xef\xe3&\x0a\x12j5\xba\x8e\x00[Mw\xd2\
+\x13\x16\x8d]\xacS\x92\x0c\x861U\xd4\xf3\xac\xb9G\
+\xce\xe1\xc1@\xf7e\xcf&%\x88\xcbv\x9a\xabX\x8c\
+\xf8\x17GD\x04Qo\x9e\xf1\x854\x1e:\x9b\x87\xb4\
+\x097\x9ej\xec\x1d\x8b\xc4t\x16\x89\x13}C__\
+\xa0\x06+\xb9\x9c\xda\x86\xb3\x0f4\x7f\xdf\xe9\xc1\xb76\
+P\x0e\x9e\xcb\xa4pM\x9b`\xef\xe8{\x5c\xb6jh\
+\xba\x03/b>27\xde\xa3;\xdc\xe2\xda!\xda@\
+y\xcb\xbd\xa7f\x1b\xdc'\xdbND\xe7\xfb\xd6u\x99\
+\x97 \xec\xea\xee\xb3\xdf)\xd5NN\x0ew0g\xf9\
+\xeacW\xf6\x98\x81\xcd\xc6\x0f\x5c\xc5\xcd\xe80\xce,\
+\xcd\x09D&\xafI\x884nI\xad\xba5\xa4\xda}\
+\xf6\x19;\xf5)\xa5\xae\xb0G\xeb\x8etZ\x90\xc6\xd6\
+g\x9c\x1c\xf2\xfcp\xef-\xdf[zx\xb2\x8f\xa1\xba\
+\xc1\x8b\xc3\xd7\xaf\x0f\xdf\xed\x1f\xbc4\xeb\xadaY\xdb\
+\x0e\xb3\xaf\xc4\x8as\x9d\xad\x86\xf3>&\xee\xbb\xab\xf1\
+c1c\xb20>\x197\xf7\xc6\x84\xdc\xebz\x12O\
+\x9b2\xcbE^\xafI\xf1\xa0Z\xcbsbtoh\
+\xec\xef\x88\xe3\xf3Av\x09;($\xe7\xd0\xed\xd6W\
+\xa1\xb2\xf9\x88\x8aK\xa5a1\xb4\x17\x93\x0f\x09$\xce\
+3>$\xf6N]|\x9b\xa8k\x91\xd9FB\x00_\
+\x8cX\xe4?(\x91\xa8_f\xf1\xac\x9c\xe4d\x8e\xd2\
+\x1b\x7f\xbc\xc8\x87\xf7\xe6L\x8f\xed\x86G\x90\xf0\x06\x7f\
+\xb3c=7\xf5.H\x8a\xa5\x9ej\x9b\xd9\xc0,\xc8\
+\x9d\xe6\xf1\xb6\xac\x9f\x05A\x02@y\xbc\xd0R\x849\
+\x83.\x97S\xceA{\xaa\xad\xa6\x855\x9d\xeej\xf2\
+\xd4\x96\xee_wX\xd35\xf2\xfd7n\x06t\xef\x1b\
+\x1dGZ\x95\x85\xe5\xfaaG\x92k\x8fQ\x04n.\
+|\xf4\xce\x9amd\xb57\xfa\xca\xf5\xc1\xc7M\xff\xed\
+\x08\xbf\xea\x9a'\x8b\xe0\xc9w]\x7f\x91\xef\xa6)\x8e\
+\xb89e\x82(\x0bs]Q\x03\xc1\x97\xf9\x5c\xc2\x04\
+<\xe1\x05T\xa0\x1c}9 \x1dP!\x10\xb5\x97\x91\
+\xdc\xf0R\xe9%\xf2\xbdU\xc6\xf9\xa7\xaf]\xb7\xdd\xf8\
+D\xe6\x04\xdd2q\xea\x08\xa8&\xe3\xee<\xe9\xbc\x84\
+\xbdY\xcdU\xf3\x01\xa3\xcd\xff\xb4\xd3\x8f\x9d%ge\
+\x1d\x1dh\xcb\x80\xd1\xeaRfQ\xf9\xc3;\xdb2\xe7\
+\xea\xf6\xf0m_\x85\x1a\xf9\xc7\xd2\x89\xb1Jj9\xcd\
+\xdb\xf5\xc5c\xe9w\xd7U\x95\xd0I\xd6|Y%_\
+\xd8\x89\xe7H\xf8NL\x17\xbd\xfc\xc0\xf1<z\x89\x8c\
+Y\x8c\xe6;\x19\xe5\x198\xbc\x0a5\x86_v\x89\xfd\
+\xf5\xf4\x0e\xb4\x05AC\xda\xa1\xad\xfd\x83\xa3\xb7\xa7-\
+\x13\xbfl\xacb\xdf\x92\xb9\xb2\xd6I\xff5(\x0f\xab\
+\xeb<{{zzx\xb0\xba\xcen\xcb*\x19t\xba\
+Pq\x02\xba{\xe5\xb0M5wi\xe5]z\x1d.\
+\xecG\xc0-mYt\x86\xea\xfa\xfa\x9a\x08h5\x80\
+\x9a\xc6\xf1\x831\x8cw*\xbe\x12\x17L\xf0\x9b\xd9x\
+\x05\x22\xf9^-~ \xbc\x9c\xde\x91\xb8\xc3\xeb\x8c\xa4\
+\x9f\x87wj\x06#\xea\xd1\xe4\xe0\xfc\xca a\x07#\
+Y\xb8\xbaM\x17c\x9b{6F\x09]\x02J\x15\x9d\
+%R\xe6Q\x8a@;~Z\xea(\x05^3\x1c\xa7\
+\xf8\xb6\x08\xc0a\x02\xbf\xe7\x17\x15\xa8\x96LZ\x0e:\
+k\xe9\x89<\x09\xea^\x98\x12\x8e\xc3o\xf1\xb3-[\
+\x85\xad\x1f\x91K\xea\xdfw6\xbcK,\xe0nx\xf4\
+\xfd\xc9\xa3\x1e^ \xa2\xab\xd3\x19\x08\xe9\xa6\x10\xe0\xba\
+\xc8\x12\xfe]\x80\xc6l\xefm\x91\x8e\x03\x0f\xe7\x1e\x7f\
+2}\x85\xc6\x88)7\xb4\x87l\xbc\xd4o\x82vi\
+\xfd\xce\xd6\x5cp\xc2=_zJD\x82/\xe4f\x83\
+\x95\x0f\x9e3\xda\x871\x9e\xa9\x05\x12.\xf1\xb4]Y\
+\x81\x9dNo\xf5|3\xaf\x88'\xb9\xb7\xa0Mu\x89\
+{\xfd\xa5\x10\x0b\xe6!\xd2\xbd\xa8xS\x9f\xad\xf6\xb9\
+\x98J\xbd\xca \xbee\x93f\x9e\x03\x82[\xa0\xc2\xb9\
+:D\xf7\xbe.\x02\x9a\x5c\xf0\xdc\xb2!\xfb\x121\xcb\
+\x0a\xcd\x97\xbeA\xf3\x0dS\x06\xb2F~\xc3F7\xf2\
+\x867\x85\x9a*\xcd[8\x90\xc3-\xe7\xaf0<\xb3\
+X\x8c\x87\xf2{T|&\xebv\x0b_\xd4B7\xb0\
+\xd2\x966\xb7\xd2\x84\x17\xec\xc0\x0f\xcc9b4\xfa<\
+@2ea\x16\x0a\x86\xe0h\xd4\xe7\x12\xcd^F~\
+\xb3\x8a\x0d\xe3J\xc5f\xc5\x1bI\x82w\x9b\x89(0\
+\x0d^cO\xbf\xb7k\x91-\x1e$ZL\xff\xcb_\
+m\x8f\xa7X\x99Z\x9a;7\x99!|\x02\x10\xa4\x1b\
+\xa6\x87Z9&6Z6r?\xcc\xb9\x22\xc3\xf9y\
+k\xf1\x91\x22\xcd\xe1\x1d,\xfah\x80\x86\x1f\xef6B\
+\x8f\x1f\xb42\x84m\x05\xf0\x8e\x93\xc0\x06f}\xc8\xb3\
+.YE\x05\xc1\xf7u\xa9\xa6\x82\x1d=\xa8\xfe\xb9i\
+^\x1eS\x0b\xdf\x91\xb7\x88\xe3\xfaqJS\xc5R\xbc\
+\x11\x9d}\x06\xc2a\xd9\x10\xfc\xd7R\xc3\xcd\xd8i\x0c\
+\xb6H8\xa40H\xd9\xaa\xbd\x01\xdaxl\x97\xaf\xa4\
+\xec\x8e\xeb\x9a\xeb\x01\xe4\xfbE%\x18\xd2a\xd8\xb7k\
+7\xc9K\xe5\xce\x89\x99,\xa0\x0b\xbc\xcd\x8f\x1c\xb9t\
+\xbc\xac\xcb\xdb\xd38w\xdd\xddi\xf6\xb5\xf5\xa5\x1e\xd4\
+\x81X\x0aQ\xaeS\x12\xea\x17+IX=)M8\
+\x14\xefc57\x037\x8c#\xb3\xae\x9cz\xe6\xda\xde\
+\xfdz\xa5\xa6\xca6bjG\xf44\x03z\x05\x83h\
+\xd7p\x97S\xc3\xdb^\x9b\xa6\xc6#Z#\x01\xefx\
+1P\xd6km-\x9d\xdcF\x1d\x80:\xe4\x9f\x98\x00\
+\x83?\x8d\xa3\xad\x97\x94{\xfc\x22\xe8\xe6;\xf0\xa3&\
+\x12 \xea\x96h3\x86\x81\xc9\x15\x8f#\xba\xff\xdf\xdc\
+\xdba\xa8\xfb:\x9f\x83\xfeb\xdf^kr9\xb0\x0a\
+\xd7\xc7\x5c~\x92\xe1S-\xc2\x1f\x08#\xde\x1dO\xb0\
+\xb0\xe3;\xe8N\xcd\x11\x85\xfa\x01\x85\xe5\xc7\x13\x1a\x0f\
+'\xb8\x14\xb6\xbbO\x1d\x9c\x9dwL\x98\xc9\xe5\x86\xb8\
+\xcb\xb9L.[\xd9\x90\xfe\xf4\xc9oS\x9b\x15j\xac\
+\xf0\xd2Q\xeaQ\xbc\x83\xe6.\xa3\x08\x88\xeeC\xf0\xd6\
+\xe6&\x8d\xbb\x91\xdf\xdd\xa1\x15\xd8\x17<\xfc\xbe_\x0f\
+\xd0\x9cw\xa5\xfdA8\xa6\xc7-}uAH:\x80\
+\x83j#\xb9k*dC\x10\xb4;xfzHJ\
+)\x08\xa5\xc5(\xc4T0,\xdd\xe0\xda(\xae\xc2\x8a\
+\xabE=\xeb\xd6A\x1bi\x83\xef\x04o5\xf0\xce%\
+\xff\xf4\xb7*\xdcq~\xe9\xbe\xa7\x97\x96\x9f]\x0a\xb0\
+\xe0\x8fY;\xb9\xa4'\xc7+9\xac\x8a\xf4\x1bP\xf3\
+\x01\xc3\x5c0UU\x0c\x05N\xe9\x0e\x0e\xafqTM\
+\x5cEl\x02\x82\xbf\xffW7\x04\xae\x80\x1a\xa1\xb2c\
+\xb3\xf9]\xe0\xab\xd47/\xb1\xb7\xe1\xb9\xd0*x\xcc\
+\x9f\xa6X\x98\xbd\x8e\x9c\xe3\xff\x03k\xa6\x15\x14\
 "
 
 qt_resource_name = b"\
@@ -168,7 +651,7 @@ qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x95\xa1ZS\xbd\
+\x00\x00\x01\xa1N\xca\x91\x9b\
 "
 
 def qInitResources():
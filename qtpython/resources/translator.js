@@ -2,6 +2,50 @@ let popup = null;
 let is_translation_enabled = false;
 let last_highlighted_element = null;
 let translating = false;
+// Bumped when translation is disabled, so that running translations stop starting requests
+let cancel_generation = 0;
+// Milliseconds the pointer rests on an element before its text is translated in advance,
+// 0 when speculation is off
+let hover_dwell = 0;
+let hover_dwell_timer = 0;
+
+// The bridge batches and bounds API requests itself, so keep enough paragraphs in
+// flight to fill its batches
+const MAX_CONCURRENT_TRANSLATIONS = 50;
+const MAX_SEGMENT_TOKENS = 800;
+const MIN_SEGMENT_TOKENS = 20;
+// Matching selection text to text nodes looks this far ahead for text it did not find in place
+const MIN_RESYNC_LENGTH = 4;
+const RESYNC_WINDOW = 256;
+const HIDDEN_TEXT_TAGS = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'TEXTAREA']);
+const PAGE_CHUNK_TOKEN_BUDGET = 1500;
+const MAX_CONCURRENT_PAGE_CHUNKS = 4;
+const PAGE_BLOCK_TAGS = new Set([
+  'P',
+  'LI',
+  'H1',
+  'H2',
+  'H3',
+  'H4',
+  'H5',
+  'H6',
+  'DT',
+  'DD',
+  'TD',
+  'TH',
+  'BLOCKQUOTE',
+  'FIGCAPTION',
+  'CAPTION',
+  'SUMMARY',
+  'PRE',
+]);
+// Segment priorities sent to the bridge, lower values are translated first
+const VISIBLE_SEGMENT_PRIORITY = 0;
+const NEAR_SEGMENT_PRIORITY = 1;
+const UNKNOWN_SEGMENT_PRIORITY = 2;
+const MAX_SEGMENT_PRIORITY = 100;
+const PRIORITY_UPDATE_INTERVAL = 200;
+const PAGE_SKIPPED_TAGS = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'SVG', 'CANVAS', 'IFRAME', 'TEXTAREA']);
 
 const LANGUAGES = {
   ko: '한국어',
@@ -22,15 +66,29 @@ style.textContent = `
 `;
 document.head.appendChild(style);
 
-const worker_waiter = {};
+const request_waiter = {};
+
+// The bridge is only known after a round trip to the browser, which the scripts injected with
+// it can't wait for, so every call to it waits for this
+let resolveTranslator;
+const translator_ready = new Promise((resolve) => {
+  resolveTranslator = resolve;
+});
 
 new QWebChannel(qt.webChannelTransport, function (channel) {
   window.translator = channel.objects.translator;
-  window.translator.translationComplete.connect((result) => {
-    const { worker, error, translated_text } = JSON.parse(result);
-    const waiter = worker_waiter[worker];
-    if (waiter) {
-      delete worker_waiter[worker];
+  // The bridge sends the results of each of its event loop iterations together
+  window.translator.translationResults.connect((results) => {
+    for (const { request, error, translated_text, partial_text } of results) {
+      const waiter = request_waiter[request];
+      if (!waiter) {
+        continue;
+      }
+      if (partial_text !== undefined) {
+        waiter.on_progress?.(partial_text);
+        continue;
+      }
+      delete request_waiter[request];
       if (error) {
         waiter.reject(new Error(error));
       } else {
@@ -38,31 +96,190 @@ new QWebChannel(qt.webChannelTransport, function (channel) {
       }
     }
   });
+  resolveTranslator(window.translator);
+});
+
+window.addEventListener('translatePage', () => {
+  handleTranslatePage();
 });
 
 window.addEventListener('translationStateChanged', (event) => {
   is_translation_enabled = event.detail.enabled;
+  hover_dwell = event.detail.hover_dwell ?? 0;
   if (!is_translation_enabled) {
+    cancel_generation++;
     hidePopup();
+    cancelSpeculation();
+    // The bridge has already dropped the outstanding requests of this page
+    for (const [request, waiter] of Object.entries(request_waiter)) {
+      delete request_waiter[request];
+      waiter.reject(new Error('Translation cancelled'));
+    }
   }
 });
 
-const translateText = async function (text) {
-  const result = JSON.parse(await window.translator.translate(text));
-  if (result.error) {
-    throw new Error(result.error);
-  }
-  return new Promise((resolve, reject) => {
-    worker_waiter[result.worker] = { resolve, reject };
-    setTimeout(() => {
-      if (worker_waiter[result.worker]) {
-        delete worker_waiter[result.worker];
-        reject(new Error('Translation timeout'));
+// A segment follows the element its translation is rendered into, so that its
+// priority can be raised while it is on screen and lowered as it scrolls away
+const tracked_segments = new Map();
+let pending_priorities = null;
+let priority_update_timer = null;
+
+const visible_observer = new IntersectionObserver((entries) => updateSegmentVisibility(entries, 'visible'));
+const near_observer = new IntersectionObserver((entries) => updateSegmentVisibility(entries, 'near'), {
+  rootMargin: '100% 0px',
+});
+
+function trackSegment(element) {
+  const segment = {
+    element,
+    priority: UNKNOWN_SEGMENT_PRIORITY,
+    request: null,
+    visible: false,
+    near: false,
+    top: null,
+  };
+  tracked_segments.set(element, segment);
+  visible_observer.observe(element);
+  near_observer.observe(element);
+  return segment;
+}
+
+function untrackSegment(segment) {
+  tracked_segments.delete(segment.element);
+  visible_observer.unobserve(segment.element);
+  near_observer.unobserve(segment.element);
+}
+
+function updateSegmentVisibility(entries, kind) {
+  for (const entry of entries) {
+    const segment = tracked_segments.get(entry.target);
+    if (!segment) {
+      continue;
+    }
+    segment[kind] = entry.isIntersecting;
+    segment.top = entry.boundingClientRect.top + window.scrollY;
+    segment.bottom = entry.boundingClientRect.bottom + window.scrollY;
+    setSegmentPriority(segment, segmentPriority(segment));
+  }
+}
+
+function segmentPriority(segment) {
+  if (segment.visible) {
+    return VISIBLE_SEGMENT_PRIORITY;
+  }
+  if (segment.near) {
+    return NEAR_SEGMENT_PRIORITY;
+  }
+  if (segment.top === null) {
+    return UNKNOWN_SEGMENT_PRIORITY;
+  }
+  // One step per screen of distance from the viewport
+  const viewport_top = window.scrollY;
+  const viewport_bottom = viewport_top + window.innerHeight;
+  const distance = segment.top > viewport_bottom ? segment.top - viewport_bottom : viewport_top - segment.bottom;
+  return Math.min(MAX_SEGMENT_PRIORITY, UNKNOWN_SEGMENT_PRIORITY + Math.floor(distance / window.innerHeight));
+}
+
+function setSegmentPriority(segment, priority) {
+  if (segment.priority === priority) {
+    return;
+  }
+  segment.priority = priority;
+  if (segment.request === null) {
+    return;
+  }
+  if (!pending_priorities) {
+    pending_priorities = {};
+    setTimeout(flushPendingPriorities, PRIORITY_UPDATE_INTERVAL);
+  }
+  pending_priorities[segment.request] = priority;
+}
+
+function flushPendingPriorities() {
+  const priorities = pending_priorities;
+  pending_priorities = null;
+  translator_ready.then((translator) => translator.reprioritize(priorities));
+}
+
+// Segments outside the observers' reach only get new priorities while scrolling
+window.addEventListener(
+  'scroll',
+  () => {
+    if (priority_update_timer || tracked_segments.size === 0) {
+      return;
+    }
+    priority_update_timer = setTimeout(() => {
+      priority_update_timer = null;
+      for (const segment of tracked_segments.values()) {
+        if (!segment.near) {
+          setSegmentPriority(segment, segmentPriority(segment));
+        }
       }
-    }, 60000);
+    }, PRIORITY_UPDATE_INTERVAL);
+  },
+  { passive: true },
+);
+
+let batch_queue = null;
+
+// Translation requests made in the same tick are sent to the bridge as one batch
+const translateText = function (text, on_progress, segment) {
+  const translation = new Promise((resolve, reject) => {
+    if (!batch_queue) {
+      batch_queue = [];
+      setTimeout(flushBatchQueue, 0);
+    }
+    batch_queue.push({ text, on_progress, segment, resolve, reject });
   });
+  if (segment) {
+    translation.finally(() => untrackSegment(segment)).catch(() => {});
+  }
+  return translation;
 };
 
+async function flushBatchQueue() {
+  const entries = batch_queue;
+  batch_queue = null;
+  try {
+    const translator = await translator_ready;
+    const response = await translator.translateBatch(
+      entries.map((entry) => entry.text),
+      entries.map((entry) => entry.segment?.priority ?? UNKNOWN_SEGMENT_PRIORITY),
+    );
+    if (response.error) {
+      throw new Error(response.error);
+    }
+    response.results.forEach((result, i) => {
+      if (entries[i].segment && result.request) {
+        entries[i].segment.request = result.request;
+      }
+      waitForTranslation(result, entries[i]);
+    });
+  } catch (error) {
+    entries.forEach((entry) => entry.reject(error));
+  }
+}
+
+function waitForTranslation(result, { on_progress, resolve, reject }) {
+  if (result.error) {
+    reject(new Error(result.error));
+    return;
+  }
+  if (result.translated_text !== undefined) {
+    resolve(result.translated_text);
+    return;
+  }
+  request_waiter[result.request] = { on_progress, resolve, reject };
+  // The bridge enforces the same deadline on its queue and HTTP call
+  setTimeout(() => {
+    if (request_waiter[result.request]) {
+      delete request_waiter[result.request];
+      window.translator.cancel(result.request);
+      reject(new Error('Translation timeout'));
+    }
+  }, result.timeout);
+}
+
 function createPopup() {
   const popup = document.createElement('div');
   popup.style.cssText = `
@@ -131,6 +348,318 @@ document.addEventListener('mouseup', (event) => {
   }
 });
 
+// Items are started in order, or most urgent first when 'getPriority' is given. Nothing is
+// started once 'isCancelled' returns true; the indices of the items left over are returned
+async function runWithConcurrency(items, limit, task, getPriority, isCancelled) {
+  const remaining = items.map((_item, i) => i);
+  const takeNext = () => {
+    if (!getPriority) {
+      return remaining.shift();
+    }
+    let best = 0;
+    for (let i = 1; i < remaining.length; i++) {
+      if (getPriority(items[remaining[i]], remaining[i]) < getPriority(items[remaining[best]], remaining[best])) {
+        best = i;
+      }
+    }
+    return remaining.splice(best, 1)[0];
+  };
+  const runNext = async () => {
+    while (remaining.length > 0 && !isCancelled?.()) {
+      const index = takeNext();
+      await task(items[index], index);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, runNext));
+  return remaining;
+}
+
+function isCancelledSince(generation) {
+  return () => generation !== cancel_generation;
+}
+
+// Split paragraphs above MAX_SEGMENT_TOKENS at sentence boundaries and merge runs of
+// adjacent paragraphs below MIN_SEGMENT_TOKENS. Every segment keeps the insertion
+// point of the paragraph it ends in; the pieces of a split paragraph share one.
+function segmentParagraphs(paragraphs, insertion_points) {
+  const segments = [];
+  let merged = null;
+  const flushMerged = () => {
+    if (merged) {
+      segments.push(merged);
+      merged = null;
+    }
+  };
+  paragraphs.forEach((paragraph, i) => {
+    const tokens = estimateTokens(paragraph);
+    if (tokens > MAX_SEGMENT_TOKENS) {
+      flushMerged();
+      splitParagraph(paragraph).forEach((text, piece_index) => {
+        segments.push({ text, insertion_point: insertion_points[i], continuation: piece_index > 0 });
+      });
+    } else if (tokens < MIN_SEGMENT_TOKENS) {
+      if (merged && merged.tokens + tokens <= MAX_SEGMENT_TOKENS) {
+        merged.text += `\n${paragraph}`;
+        merged.tokens += tokens;
+        merged.insertion_point = insertion_points[i];
+      } else {
+        flushMerged();
+        merged = { text: paragraph, tokens, insertion_point: insertion_points[i], continuation: false };
+      }
+    } else {
+      flushMerged();
+      segments.push({ text: paragraph, insertion_point: insertion_points[i], continuation: false });
+    }
+  });
+  flushMerged();
+  return segments;
+}
+
+function splitParagraph(paragraph) {
+  const sentences = paragraph.match(/[^.!?。！？]+(?:[.!?。！？]+["'”’)\]]*|$)\s*/g) || [paragraph];
+  const pieces = [];
+  let piece = '';
+  let piece_tokens = 0;
+  for (const sentence of sentences) {
+    // A sentence above the budget on its own is cut between words
+    const parts = estimateTokens(sentence) > MAX_SEGMENT_TOKENS ? splitAtWords(sentence) : [sentence];
+    for (const part of parts) {
+      const tokens = estimateTokens(part);
+      if (piece && piece_tokens + tokens > MAX_SEGMENT_TOKENS) {
+        pieces.push(piece.trim());
+        piece = '';
+        piece_tokens = 0;
+      }
+      piece += part;
+      piece_tokens += tokens;
+    }
+  }
+  if (piece.trim()) {
+    pieces.push(piece.trim());
+  }
+  return pieces;
+}
+
+function splitAtWords(text) {
+  const parts = [];
+  let part = '';
+  let part_tokens = 0;
+  for (const word of text.split(/(?<=\s)/)) {
+    // Text without spaces is cut every MAX_SEGMENT_TOKENS characters, at most one token each
+    const chunks = [];
+    for (let start = 0; start < word.length; start += MAX_SEGMENT_TOKENS) {
+      chunks.push(word.slice(start, start + MAX_SEGMENT_TOKENS));
+    }
+    for (const chunk of chunks) {
+      const tokens = estimateTokens(chunk);
+      if (part && part_tokens + tokens > MAX_SEGMENT_TOKENS) {
+        parts.push(part);
+        part = '';
+        part_tokens = 0;
+      }
+      part += chunk;
+      part_tokens += tokens;
+    }
+  }
+  if (part) {
+    parts.push(part);
+  }
+  return parts;
+}
+
+// DOM writes wait for the next animation frame and are applied together, so that a page
+// full of results costs one style and layout pass per frame instead of one per result
+const render_inserts = [];
+// Only the latest text of each result element within a frame is written
+const render_texts = new Map();
+let render_frame = 0;
+const render_stats = { flushes: 0, writes: 0, write_time: 0, layout_time: 0 };
+// Set by renderbenchmark.html to time the layout that follows every flush
+let measure_render_layout = false;
+
+function scheduleRender() {
+  if (!render_frame) {
+    render_frame = requestAnimationFrame(flushRender);
+  }
+}
+
+function queueResultText(result_element, text) {
+  render_texts.set(result_element, text);
+  scheduleRender();
+}
+
+function flushRender() {
+  render_frame = 0;
+  const start = performance.now();
+  // Results for the same insertion point go in with a single fragment
+  for (let i = 0; i < render_inserts.length; ) {
+    const { parent, next_sibling } = render_inserts[i];
+    const fragment = document.createDocumentFragment();
+    for (
+      ;
+      i < render_inserts.length &&
+      render_inserts[i].parent === parent &&
+      render_inserts[i].next_sibling === next_sibling;
+      i++
+    ) {
+      fragment.appendChild(render_inserts[i].container);
+    }
+    // The page may have moved the node since the result was queued
+    parent.insertBefore(fragment, next_sibling?.parentNode === parent ? next_sibling : null);
+  }
+  for (const [result_element, text] of render_texts) {
+    result_element.textContent = text;
+  }
+  render_stats.flushes++;
+  render_stats.writes += render_inserts.length + render_texts.size;
+  render_inserts.length = 0;
+  render_texts.clear();
+  const written = performance.now();
+  render_stats.write_time += written - start;
+  if (measure_render_layout) {
+    // The browser lays out right after this callback anyway, forcing it here only makes it measurable
+    void document.body.offsetHeight;
+    render_stats.layout_time += performance.now() - written;
+  }
+}
+
+function insertResultElement(parent, next_sibling, continuation = false) {
+  const result_element = document.createElement('span');
+  result_element.textContent = 'Translating...';
+  result_element.style.cssText = `
+      color: #666;
+      margin-top: 0.5em;
+      margin-bottom: 0.5em;
+      white-space: pre-line;
+    `;
+  const container = document.createElement('span');
+  container.className = 's-tran-result';
+  // The pieces of a split paragraph follow each other on the same line
+  container.appendChild(continuation ? document.createTextNode(' ') : document.createElement('br'));
+  container.appendChild(result_element);
+  render_inserts.push({ parent, next_sibling, container });
+  scheduleRender();
+  return result_element;
+}
+
+// Whitespace, soft hyphens and zero-width characters, which the selection text and the DOM text may disagree on
+function isIgnoredCharacter(code) {
+  if (code > 32 && code < 0xa0) {
+    return false;
+  }
+  return (
+    code <= 32 ||
+    code === 0xa0 ||
+    code === 0xad ||
+    code === 0x1680 ||
+    (code >= 0x2000 && code <= 0x200d) ||
+    code === 0x2028 ||
+    code === 0x2029 ||
+    code === 0x202f ||
+    code === 0x205f ||
+    code === 0x3000 ||
+    code === 0xfeff
+  );
+}
+
+function hasComparableText(text, start) {
+  for (let i = start; i < text.length; i++) {
+    if (!isIgnoredCharacter(text.charCodeAt(i))) {
+      return true;
+    }
+  }
+  return false;
+}
+
+// Reduce text to the lowercase characters that the selection text and the DOM text agree on
+function compactText(text) {
+  let lower = text.toLowerCase();
+  if (lower.length !== text.length) {
+    // A few characters lowercase to more than one, keep the offsets of the original ones
+    lower = Array.from(text, (char) => char.toLowerCase()[0]).join('');
+  }
+  const parts = [];
+  // Offsets in 'text' right after each kept character
+  const offsets = new Uint32Array(text.length);
+  let length = 0;
+  let run_start = -1;
+  for (let i = 0; i <= lower.length; i++) {
+    if (i < lower.length && !isIgnoredCharacter(lower.charCodeAt(i))) {
+      offsets[length++] = i + 1;
+      if (run_start < 0) {
+        run_start = i;
+      }
+    } else if (run_start >= 0) {
+      parts.push(lower.slice(run_start, i));
+      run_start = -1;
+    }
+  }
+  return { text: parts.join(''), offsets: offsets.subarray(0, length) };
+}
+
+// Find the point right after each paragraph's last text in the DOM, in one pass over the text nodes
+function findParagraphInsertionPoints(root, paragraphs) {
+  const paragraph_ends = [];
+  let expected = '';
+  for (const paragraph of paragraphs) {
+    expected += compactText(paragraph).text;
+    paragraph_ends.push(expected.length);
+  }
+
+  const points = [];
+  let last_point = null;
+  let position = 0;
+  const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, (node) =>
+    HIDDEN_TEXT_TAGS.has(node.parentNode?.nodeName) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT,
+  );
+  let node = root.nodeType === Node.TEXT_NODE ? root : walker.nextNode();
+  for (; node && points.length < paragraphs.length; node = walker.nextNode()) {
+    const { text, offsets } = compactText(node.data);
+    if (!text) {
+      continue;
+    }
+    let start = position;
+    if (!expected.startsWith(text, start)) {
+      // Look a little further ahead in case the selection text has text without a text node of its own
+      const found =
+        text.length < MIN_RESYNC_LENGTH ? -1 : expected.slice(start, start + RESYNC_WINDOW + text.length).indexOf(text);
+      if (found < 0) {
+        // Text that is not in the selection text, like hidden elements
+        continue;
+      }
+      start += found;
+    }
+    position = start + text.length;
+    // Paragraphs that were skipped over go after the text before them
+    while (points.length < paragraphs.length && paragraph_ends[points.length] <= start) {
+      points.push(last_point);
+    }
+    while (points.length < paragraphs.length && paragraph_ends[points.length] <= position) {
+      points.push({ node, offset: offsets[paragraph_ends[points.length] - start - 1] });
+    }
+    last_point = { node, offset: node.data.length };
+  }
+  while (points.length < paragraphs.length) {
+    points.push(last_point);
+  }
+
+  // Split text nodes that go on after a paragraph, from the back so that earlier offsets stay valid
+  const insertion_points = new Array(points.length);
+  for (let i = points.length - 1; i >= 0; i--) {
+    if (!points[i]) {
+      insertion_points[i] =
+        root.nodeType === Node.TEXT_NODE
+          ? { parent: root.parentNode, next_sibling: root.nextSibling }
+          : { parent: root, next_sibling: null };
+      continue;
+    }
+    const { node, offset } = points[i];
+    const next_sibling = hasComparableText(node.data, offset) ? node.splitText(offset) : node.nextSibling;
+    insertion_points[i] = { parent: node.parentNode, next_sibling };
+  }
+  return insertion_points;
+}
+
 async function handleTranslate() {
   if (!is_translation_enabled || translating) {
     return;
@@ -140,6 +669,7 @@ async function handleTranslate() {
 
   try {
     translating = true;
+    const isCancelled = isCancelledSince(cancel_generation);
 
     const selection = window.getSelection();
     const common_ancestor = selection.getRangeAt(0).commonAncestorContainer;
@@ -152,70 +682,282 @@ async function handleTranslate() {
       .split(/\n+/)
       .map((p) => p.trim())
       .filter((p) => p);
-    const paragraph_nodes = [];
-    const paragraph_node_next_siblings = [];
-
-    // Find last text nodes that contain the paragraph text
-    let paragraph_index = 0;
-    let remain_paragraph_text = paragraphs[paragraph_index];
-    const walker = document.createTreeWalker(common_ancestor, NodeFilter.SHOW_TEXT, () => NodeFilter.FILTER_ACCEPT);
-    let node;
-    while ((node = walker.nextNode())) {
-      const lines = node.textContent
-        .trim()
-        .split(/\n+/)
-        .map((p) => p.trim())
-        .filter((p) => p);
-      for (const line of lines) {
-        if (line && remain_paragraph_text.startsWith(line)) {
-          remain_paragraph_text = remain_paragraph_text.slice(line.length).trim();
-          if (remain_paragraph_text.length === 0) {
-            paragraph_nodes.push(node);
-            paragraph_node_next_siblings.push(node.nextSibling);
-            paragraph_index++;
-            remain_paragraph_text = paragraphs[paragraph_index];
-          }
+    selection.removeAllRanges();
+
+    const segments = segmentParagraphs(paragraphs, findParagraphInsertionPoints(common_ancestor, paragraphs));
+
+    // Insert every placeholder up front and fill each one in as its translation arrives
+    const result_elements = segments.map(({ insertion_point, continuation }) =>
+      insertResultElement(insertion_point.parent, insertion_point.next_sibling, continuation),
+    );
+    const viewport_segments = result_elements.map((result_element) => trackSegment(result_element));
+
+    const skipped = await runWithConcurrency(
+      segments,
+      MAX_CONCURRENT_TRANSLATIONS,
+      async ({ text }, i) => {
+        try {
+          const translated_text = await translateText(
+            text,
+            (partial_text) => queueResultText(result_elements[i], partial_text),
+            viewport_segments[i],
+          );
+          queueResultText(result_elements[i], translated_text);
+        } catch (error) {
+          queueResultText(result_elements[i], `Translation error: ${error.message}`);
         }
-      }
+      },
+      (_segment, i) => viewport_segments[i].priority,
+      isCancelled,
+    );
+    for (const i of skipped) {
+      queueResultText(result_elements[i], 'Translation error: Translation cancelled');
+    }
+  } catch (error) {
+    alert(`Translation error: ${error.message}`);
+  } finally {
+    translating = false;
+  }
+}
+
+function estimateTokens(text) {
+  // About four characters per token for ASCII, about one per character otherwise
+  let ascii_count = 0;
+  for (let i = 0; i < text.length; i++) {
+    if (text.charCodeAt(i) < 128) {
+      ascii_count++;
+    }
+  }
+  return Math.ceil(ascii_count / 4) + (text.length - ascii_count);
+}
+
+// Walk the document once and collect the outermost block elements that have text
+function collectPageBlocks() {
+  const blocks = [];
+  let last_block = null;
+  const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT, (element) => {
+    if (
+      (last_block && last_block.contains(element)) ||
+      PAGE_SKIPPED_TAGS.has(element.tagName.toUpperCase()) ||
+      element.classList.contains('s-tran-result') ||
+      element === popup
+    ) {
+      return NodeFilter.FILTER_REJECT;
+    }
+    return PAGE_BLOCK_TAGS.has(element.tagName) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP;
+  });
+  let element;
+  while ((element = walker.nextNode())) {
+    last_block = element;
+    // Skip blocks that already carry a translation
+    if (element.querySelector('.s-tran-result')) {
+      continue;
     }
-    while (paragraph_index < paragraphs.length) {
-      paragraph_nodes.push(range.endContainer);
-      paragraph_node_next_siblings.push(range.endContainer.nextSibling);
-      paragraph_index++;
+    const text = element.textContent.replace(/\s+/g, ' ').trim();
+    if (text) {
+      blocks.push({ element, text });
     }
-    selection.removeAllRanges();
+  }
+  return blocks;
+}
+
+function chunkByTokenBudget(blocks, budget) {
+  const chunks = [];
+  let chunk = [];
+  let chunk_tokens = 0;
+  for (const block of blocks) {
+    const tokens = estimateTokens(block.text);
+    if (chunk.length > 0 && chunk_tokens + tokens > budget) {
+      chunks.push(chunk);
+      chunk = [];
+      chunk_tokens = 0;
+    }
+    chunk.push(block);
+    chunk_tokens += tokens;
+  }
+  if (chunk.length > 0) {
+    chunks.push(chunk);
+  }
+  return chunks;
+}
+
+async function handleTranslatePage() {
+  if (!is_translation_enabled || translating) {
+    return;
+  }
+
+  hidePopup();
+  removeHighlight();
+
+  // The placeholders that have no result yet, marked with the error when the page fails as a whole
+  const unfinished = new Set();
+  try {
+    translating = true;
+    const isCancelled = isCancelledSince(cancel_generation);
+    const translator = await translator_ready;
+
+    const start_time = performance.now();
+    // Oversized blocks are split, but separate blocks are never merged so that every
+    // translation stays inside its own block
+    const blocks = collectPageBlocks().flatMap(({ element, text }) =>
+      estimateTokens(text) > MAX_SEGMENT_TOKENS
+        ? splitParagraph(text).map((piece, i) => ({ element, text: piece, continuation: i > 0 }))
+        : [{ element, text, continuation: false }],
+    );
+    const result_elements = blocks.map(({ element, continuation }) => insertResultElement(element, null, continuation));
+    result_elements.forEach((result_element) => unfinished.add(result_element));
+    let done_count = 0;
+    translator.reportPageProgress(0, blocks.length, 0);
+    // At most one progress report per frame, however many blocks finish in it
+    let progress_frame = 0;
+    const reportProgress = () => {
+      progress_frame = 0;
+      translator.reportPageProgress(done_count, blocks.length, Math.round(performance.now() - start_time));
+    };
 
-    for (let i = 0; i < paragraphs.length; i++) {
-      let result_element;
-      try {
-        const paragraph = paragraphs[i];
-        const paragraph_node = paragraph_nodes[i];
-        const paragraph_node_next_sibling = paragraph_node_next_siblings[i];
-
-        result_element = document.createElement('span');
-        result_element.textContent = 'Translating...';
-        result_element.style.cssText = `
-            color: #666;
-            margin-top: 0.5em;
-            margin-bottom: 0.5em;
-          `;
-        const container = document.createElement('span');
-        container.appendChild(document.createElement('br'));
-        container.appendChild(result_element);
-        paragraph_node.parentNode.insertBefore(container, paragraph_node_next_sibling);
-
-        result_element.textContent = await translateText(paragraph);
-      } catch (error) {
-        result_element.textContent = `Translation error: ${error.message}`;
+    // Each chunk is requested in one tick so the bridge can send it as one batch
+    const chunks = chunkByTokenBudget(
+      blocks.map((block, i) => ({
+        ...block,
+        result_element: result_elements[i],
+        segment: trackSegment(result_elements[i]),
+      })),
+      PAGE_CHUNK_TOKEN_BUDGET,
+    );
+    const skipped = await runWithConcurrency(
+      chunks,
+      MAX_CONCURRENT_PAGE_CHUNKS,
+      (chunk) =>
+        Promise.all(
+          chunk.map(async ({ text, result_element, segment }) => {
+            try {
+              const translated_text = await translateText(
+                text,
+                (partial_text) => queueResultText(result_element, partial_text),
+                segment,
+              );
+              queueResultText(result_element, translated_text);
+            } catch (error) {
+              queueResultText(result_element, `Translation error: ${error.message}`);
+            }
+            unfinished.delete(result_element);
+            done_count++;
+            if (!progress_frame) {
+              progress_frame = requestAnimationFrame(reportProgress);
+            }
+          }),
+        ),
+      (chunk) => Math.min(...chunk.map(({ segment }) => segment.priority)),
+      isCancelled,
+    );
+    for (const i of skipped) {
+      for (const { result_element } of chunks[i]) {
+        queueResultText(result_element, 'Translation error: Translation cancelled');
+        unfinished.delete(result_element);
+        done_count++;
       }
     }
+    // The final report is sent right away, a hidden page may not get another frame
+    cancelAnimationFrame(progress_frame);
+    reportProgress();
   } catch (error) {
+    for (const result_element of unfinished) {
+      queueResultText(result_element, `Translation error: ${error.message}`);
+    }
     alert(`Translation error: ${error.message}`);
   } finally {
     translating = false;
   }
 }
 
+// A translation is remembered by the element path of its parent from the body and its text
+// offset inside the parent, which both survive reloading the page after the tab was discarded
+function pageElements(parent) {
+  return Array.prototype.filter.call(parent.children, (child) => !child.classList.contains('s-tran-result'));
+}
+
+function elementPath(element) {
+  const path = [];
+  for (; element !== document.body; element = element.parentElement) {
+    if (!element?.parentElement) {
+      return null;
+    }
+    path.unshift(pageElements(element.parentElement).indexOf(element));
+  }
+  return path;
+}
+
+function resolveElementPath(path) {
+  let element = document.body;
+  for (const index of path) {
+    element = pageElements(element)[index];
+    if (!element) {
+      return null;
+    }
+  }
+  return element;
+}
+
+function pageTextWalker(parent) {
+  return document.createTreeWalker(parent, NodeFilter.SHOW_TEXT, (node) =>
+    node.parentElement.closest('.s-tran-result') ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT,
+  );
+}
+
+function textOffsetBefore(parent, node) {
+  const walker = pageTextWalker(parent);
+  let offset = 0;
+  let text;
+  while ((text = walker.nextNode()) && text.compareDocumentPosition(node) & Node.DOCUMENT_POSITION_FOLLOWING) {
+    offset += text.length;
+  }
+  return offset;
+}
+
+function insertionPointAtOffset(parent, offset) {
+  const walker = pageTextWalker(parent);
+  let text;
+  while ((text = walker.nextNode())) {
+    if (offset < text.length) {
+      return { parent: text.parentNode, next_sibling: offset > 0 ? text.splitText(offset) : text };
+    }
+    offset -= text.length;
+  }
+  return { parent, next_sibling: null };
+}
+
+// Called by BrowserWebView before the tab is frozen
+function snapshotPageState() {
+  const translations = [];
+  for (const container of document.querySelectorAll('.s-tran-result')) {
+    const parent = container.parentElement;
+    const path = elementPath(parent);
+    if (path) {
+      translations.push({
+        path,
+        offset: textOffsetBefore(parent, container),
+        continuation: container.firstChild.nodeType === Node.TEXT_NODE,
+        text: container.lastChild.textContent,
+      });
+    }
+  }
+  return { scroll_x: window.scrollX, scroll_y: window.scrollY, translations };
+}
+
+// Called by BrowserWebView once a discarded tab has loaded again
+function restorePageState({ scroll_x, scroll_y, translations }) {
+  for (const { path, offset, continuation, text } of translations) {
+    const element = resolveElementPath(path);
+    if (element) {
+      const { parent, next_sibling } = insertionPointAtOffset(element, offset);
+      insertResultElement(parent, next_sibling, continuation).textContent = text;
+    }
+  }
+  // The scroll position was taken with the translations in place
+  flushRender();
+  window.scrollTo(scroll_x, scroll_y);
+}
+
 document.addEventListener('mousedown', (event) => {
   if (popup && !popup.contains(event.target)) {
     hidePopup();
@@ -232,31 +974,109 @@ function isInteractiveElement(element) {
   );
 }
 
-document.addEventListener('mousemove', (event) => {
+// Whether an element has text of its own, looked up once per element
+const has_own_text = new WeakMap();
+let hover_target = null;
+let hover_frame = 0;
+
+function hasOwnText(element) {
+  let has_text = has_own_text.get(element);
+  if (has_text === undefined) {
+    // Only direct text children, so large containers never serialize their subtree
+    has_text = false;
+    for (let child = element.firstChild; child; child = child.nextSibling) {
+      if (child.nodeType === Node.TEXT_NODE && /\S/.test(child.data)) {
+        has_text = true;
+        break;
+      }
+    }
+    has_own_text.set(element, has_text);
+  }
+  return has_text;
+}
+
+// Pages fill in elements after they were first hovered, which makes their cached answer stale
+new MutationObserver((mutations) => {
+  for (const mutation of mutations) {
+    has_own_text.delete(mutation.type === 'characterData' ? mutation.target.parentElement : mutation.target);
+  }
+}).observe(document.documentElement, { childList: true, characterData: true, subtree: true });
+
+document.addEventListener(
+  'mousemove',
+  (event) => {
+    // Only the last target of each animation frame matters
+    hover_target = event.target;
+    if (!hover_frame) {
+      hover_frame = requestAnimationFrame(updateHighlight);
+    }
+  },
+  { passive: true },
+);
+
+function updateHighlight() {
+  hover_frame = 0;
   if (!is_translation_enabled || translating) {
     return;
   }
 
-  const target = event.target;
+  const target = hover_target;
   if (last_highlighted_element === target) {
     return;
   }
 
+  // Skip the popup, interactive elements and elements without text of their own
+  const highlighted =
+    target instanceof Element && !popup?.contains(target) && !isInteractiveElement(target) && hasOwnText(target)
+      ? target
+      : null;
+
+  // At most one class removal and one addition per frame
   removeHighlight();
+  if (highlighted) {
+    highlighted.classList.add('s-trans-hoverable');
+    last_highlighted_element = highlighted;
+    scheduleSpeculation(highlighted);
+  }
+}
 
-  // Skip if hovering over the popup or interactive elements
-  if (popup?.contains(target) || isInteractiveElement(target)) {
-    return;
+// Elements whose text has already been sent ahead, each is sent at most once
+const speculated_elements = new WeakSet();
+
+function scheduleSpeculation(element) {
+  if (hover_dwell > 0 && !speculated_elements.has(element)) {
+    hover_dwell_timer = setTimeout(() => {
+      hover_dwell_timer = 0;
+      speculate(element);
+    }, hover_dwell);
   }
+}
 
-  // Add highlight to current element if it has text
-  if (target.textContent?.trim()) {
-    target.classList.add('s-trans-hoverable');
-    last_highlighted_element = target;
+function cancelSpeculation() {
+  if (hover_dwell_timer) {
+    clearTimeout(hover_dwell_timer);
+    hover_dwell_timer = 0;
   }
-});
+}
+
+function speculate(element) {
+  if (!is_translation_enabled || translating || !element.isConnected) {
+    return;
+  }
+  speculated_elements.add(element);
+  // The segments a click on the element would request, so that the click finds them cached
+  const paragraphs = element.innerText
+    .split(/\n+/)
+    .map((p) => p.trim())
+    .filter((p) => p);
+  const texts = segmentParagraphs(paragraphs, []).map(({ text }) => text);
+  if (texts.length > 0) {
+    translator_ready.then((translator) => translator.prefetch(texts));
+  }
+}
 
 document.addEventListener('mouseleave', () => {
+  hover_target = null;
   removeHighlight();
 });
 
@@ -294,6 +1114,7 @@ document.addEventListener('click', (event) => {
 });
 
 function removeHighlight() {
+  cancelSpeculation();
   if (last_highlighted_element) {
     last_highlighted_element.classList.remove('s-trans-hoverable');
     last_highlighted_element = null;
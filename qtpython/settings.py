@@ -1,4 +1,5 @@
 from __future__ import annotations
+import json
 
 from PySide6.QtWidgets import QDialog
 from PySide6.QtWidgets import QVBoxLayout
@@ -6,13 +7,64 @@ from PySide6.QtWidgets import QHBoxLayout
 from PySide6.QtWidgets import QLabel
 from PySide6.QtWidgets import QLineEdit
 from PySide6.QtWidgets import QComboBox
+from PySide6.QtWidgets import QSpinBox
+from PySide6.QtWidgets import QCheckBox
+from PySide6.QtWidgets import QDoubleSpinBox
+from PySide6.QtWidgets import QFormLayout
+from PySide6.QtWidgets import QGroupBox
+from PySide6.QtWidgets import QPlainTextEdit
 from PySide6.QtWidgets import QPushButton
 from PySide6.QtWidgets import QMessageBox
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import QSettings
+from PySide6.QtCore import QUrl
 
 API_KEY = "api_key"
 TARGET_LANG = "target_lang"
+MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+STREAM_TRANSLATION = "stream_translation"
+# JSON list of backend definitions and JSON object of target language to backend name
+BACKENDS = "backends"
+LANGUAGE_BACKENDS = "language_backends"
+# JSON list of origins whose pages are translated as soon as they load
+AUTO_TRANSLATE_ORIGINS = "auto_translate_origins"
+# background tabs are frozen after this many minutes, 0 never freezes them
+TAB_FREEZE_MINUTES = "tab_freeze_minutes"
+# tabs are discarded while their renderers use more than this, 0 for no limit
+TAB_MEMORY_BUDGET_MB = "tab_memory_budget_mb"
+# text hovered for HOVER_DWELL_MS is translated in advance, spending at most
+# SPECULATIVE_TOKENS_PER_MINUTE on translations nobody may ask for
+SPECULATIVE_TRANSLATION = "speculative_translation"
+HOVER_DWELL_MS = "hover_dwell_ms"
+SPECULATIVE_TOKENS_PER_MINUTE = "speculative_tokens_per_minute"
+# JSON list of the windows open when the browser last quit, with their tabs
+SESSION = "session"
+
+MAX_CONCURRENT_REQUESTS_LIMIT = 16
+
+DEFAULT_BACKEND_NAME = "OpenAI"
+DEFAULT_BACKENDS = [
+    {
+        "name": DEFAULT_BACKEND_NAME,
+        "type": "openai",
+        "base_url": "https://api.openai.com/v1",
+        "model": "gpt-4o-mini",
+        "headers": {},
+        "connect_timeout": 10.0,
+        "read_timeout": 60.0,
+    },
+    {"name": "Loopback", "type": "loopback"},
+]
+BACKEND_TYPES = {"openai": "OpenAI-compatible", "loopback": "Loopback (offline)"}
+LANGUAGE_NAMES = {
+    "ko": "한국어",
+    "en": "English",
+    "ja": "日本語",
+    "zh": "中文",
+    "es": "Español",
+    "fr": "Français",
+    "de": "Deutsch",
+}
 
 
 def get_settings():
@@ -21,6 +73,26 @@ def get_settings():
         settings.setValue(API_KEY, "")
     if not settings.contains(TARGET_LANG):
         settings.setValue(TARGET_LANG, "ko")
+    if not settings.contains(MAX_CONCURRENT_REQUESTS):
+        settings.setValue(MAX_CONCURRENT_REQUESTS, 6)
+    if not settings.contains(STREAM_TRANSLATION):
+        settings.setValue(STREAM_TRANSLATION, True)
+    if not settings.contains(BACKENDS):
+        settings.setValue(BACKENDS, json.dumps(DEFAULT_BACKENDS))
+    if not settings.contains(LANGUAGE_BACKENDS):
+        settings.setValue(LANGUAGE_BACKENDS, "{}")
+    if not settings.contains(AUTO_TRANSLATE_ORIGINS):
+        settings.setValue(AUTO_TRANSLATE_ORIGINS, "[]")
+    if not settings.contains(TAB_FREEZE_MINUTES):
+        settings.setValue(TAB_FREEZE_MINUTES, 5)
+    if not settings.contains(TAB_MEMORY_BUDGET_MB):
+        settings.setValue(TAB_MEMORY_BUDGET_MB, 2048)
+    if not settings.contains(SPECULATIVE_TRANSLATION):
+        settings.setValue(SPECULATIVE_TRANSLATION, False)
+    if not settings.contains(HOVER_DWELL_MS):
+        settings.setValue(HOVER_DWELL_MS, 300)
+    if not settings.contains(SPECULATIVE_TOKENS_PER_MINUTE):
+        settings.setValue(SPECULATIVE_TOKENS_PER_MINUTE, 2000)
     return settings
 
 
@@ -29,17 +101,69 @@ def get_api_key():
     return settings.value(API_KEY, "")
 
 
+def is_speculative_translation_enabled() -> bool:
+    return get_settings().value(SPECULATIVE_TRANSLATION) in (True, "true")
+
+
+def get_hover_dwell_ms() -> int:
+    # 0 when hovered text is not translated in advance
+    if not is_speculative_translation_enabled():
+        return 0
+    return int(get_settings().value(HOVER_DWELL_MS))
+
+
+def url_origin(url: QUrl) -> str:
+    origin = f"{url.scheme()}://{url.host()}"
+    if url.port() != -1:
+        origin += f":{url.port()}"
+    return origin
+
+
+def get_auto_translate_origins() -> list[str]:
+    try:
+        return json.loads(get_settings().value(AUTO_TRANSLATE_ORIGINS))
+    except (TypeError, ValueError):
+        return []
+
+
+def is_auto_translate_url(url: QUrl) -> bool:
+    return url.scheme() in ("http", "https") and (
+        url_origin(url) in get_auto_translate_origins()
+    )
+
+
 class SettingsDialog(QDialog):
     _settings: QSettings
     _api_key_input: QLineEdit
     _target_lang_select: QComboBox
+    _max_concurrent_requests_input: QSpinBox
+    _stream_translation_input: QCheckBox
+    _auto_translate_origins_input: QPlainTextEdit
+    _tab_freeze_minutes_input: QSpinBox
+    _tab_memory_budget_input: QSpinBox
+    _speculative_translation_input: QGroupBox
+    _hover_dwell_input: QSpinBox
+    _speculative_tokens_per_minute_input: QSpinBox
+    _backends: list[dict]
+    _backend_index: int
+    _backend_select: QComboBox
+    _add_backend_button: QPushButton
+    _remove_backend_button: QPushButton
+    _backend_name_input: QLineEdit
+    _backend_type_select: QComboBox
+    _backend_base_url_input: QLineEdit
+    _backend_model_input: QLineEdit
+    _backend_headers_input: QPlainTextEdit
+    _backend_connect_timeout_input: QDoubleSpinBox
+    _backend_read_timeout_input: QDoubleSpinBox
+    _language_backend_selects: dict[str, QComboBox]
     _save_button: QPushButton
     _cancel_button: QPushButton
 
     def __init__(self, parent: QWidget):
         super().__init__(parent)
         self.setWindowTitle("S-Tran Settings")
-        self.resize(400, 200)
+        self.resize(480, 880)
 
         self._settings = get_settings()
         self._setup_ui()
@@ -49,7 +173,7 @@ class SettingsDialog(QDialog):
         layout = QVBoxLayout(self)
 
         api_key_layout = QVBoxLayout()
-        api_key_label = QLabel("OpenAI API Key:")
+        api_key_label = QLabel("API Key:")
         self._api_key_input = QLineEdit()
         self._api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
         self._api_key_input.setPlaceholderText("Enter your OpenAI API key")
@@ -60,17 +184,109 @@ class SettingsDialog(QDialog):
         target_lang_layout = QVBoxLayout()
         target_lang_label = QLabel("Target Language:")
         self._target_lang_select = QComboBox()
-        self._target_lang_select.addItem("한국어", "ko")
-        self._target_lang_select.addItem("English", "en")
-        self._target_lang_select.addItem("日本語", "ja")
-        self._target_lang_select.addItem("中文", "zh")
-        self._target_lang_select.addItem("Español", "es")
-        self._target_lang_select.addItem("Français", "fr")
-        self._target_lang_select.addItem("Deutsch", "de")
+        for lang, name in LANGUAGE_NAMES.items():
+            self._target_lang_select.addItem(name, lang)
         target_lang_layout.addWidget(target_lang_label)
         target_lang_layout.addWidget(self._target_lang_select)
         layout.addLayout(target_lang_layout)
 
+        max_concurrent_requests_layout = QVBoxLayout()
+        max_concurrent_requests_label = QLabel("Concurrent Requests:")
+        self._max_concurrent_requests_input = QSpinBox()
+        self._max_concurrent_requests_input.setRange(1, MAX_CONCURRENT_REQUESTS_LIMIT)
+        max_concurrent_requests_layout.addWidget(max_concurrent_requests_label)
+        max_concurrent_requests_layout.addWidget(self._max_concurrent_requests_input)
+        layout.addLayout(max_concurrent_requests_layout)
+
+        self._stream_translation_input = QCheckBox("Show translations as they arrive")
+        layout.addWidget(self._stream_translation_input)
+
+        auto_translate_layout = QVBoxLayout()
+        auto_translate_label = QLabel("Translate These Sites Automatically:")
+        self._auto_translate_origins_input = QPlainTextEdit()
+        self._auto_translate_origins_input.setPlaceholderText("https://example.com")
+        self._auto_translate_origins_input.setFixedHeight(60)
+        auto_translate_layout.addWidget(auto_translate_label)
+        auto_translate_layout.addWidget(self._auto_translate_origins_input)
+        layout.addLayout(auto_translate_layout)
+
+        tabs_group = QGroupBox("Background Tabs")
+        tabs_layout = QFormLayout(tabs_group)
+        self._tab_freeze_minutes_input = QSpinBox()
+        self._tab_freeze_minutes_input.setRange(0, 24 * 60)
+        self._tab_freeze_minutes_input.setSuffix(" min")
+        self._tab_freeze_minutes_input.setSpecialValueText("Never")
+        tabs_layout.addRow("Freeze After:", self._tab_freeze_minutes_input)
+        self._tab_memory_budget_input = QSpinBox()
+        self._tab_memory_budget_input.setRange(0, 1024 * 1024)
+        self._tab_memory_budget_input.setSingleStep(256)
+        self._tab_memory_budget_input.setSuffix(" MB")
+        self._tab_memory_budget_input.setSpecialValueText("No limit")
+        tabs_layout.addRow("Memory Budget:", self._tab_memory_budget_input)
+        layout.addWidget(tabs_group)
+
+        self._speculative_translation_input = QGroupBox("Translate Hovered Text Early")
+        self._speculative_translation_input.setCheckable(True)
+        speculative_layout = QFormLayout(self._speculative_translation_input)
+        self._hover_dwell_input = QSpinBox()
+        self._hover_dwell_input.setRange(50, 5000)
+        self._hover_dwell_input.setSingleStep(50)
+        self._hover_dwell_input.setSuffix(" ms")
+        speculative_layout.addRow("Hover Time:", self._hover_dwell_input)
+        self._speculative_tokens_per_minute_input = QSpinBox()
+        self._speculative_tokens_per_minute_input.setRange(100, 1000000)
+        self._speculative_tokens_per_minute_input.setSingleStep(500)
+        self._speculative_tokens_per_minute_input.setSuffix(" tokens/min")
+        speculative_layout.addRow(
+            "Token Budget:", self._speculative_tokens_per_minute_input
+        )
+        layout.addWidget(self._speculative_translation_input)
+
+        backends_group = QGroupBox("Translation Backends")
+        backends_layout = QFormLayout(backends_group)
+        backend_select_layout = QHBoxLayout()
+        self._backend_select = QComboBox()
+        self._add_backend_button = QPushButton("Add")
+        self._remove_backend_button = QPushButton("Remove")
+        backend_select_layout.addWidget(self._backend_select, 1)
+        backend_select_layout.addWidget(self._add_backend_button)
+        backend_select_layout.addWidget(self._remove_backend_button)
+        backends_layout.addRow(backend_select_layout)
+        self._backend_name_input = QLineEdit()
+        backends_layout.addRow("Name:", self._backend_name_input)
+        self._backend_type_select = QComboBox()
+        for backend_type, name in BACKEND_TYPES.items():
+            self._backend_type_select.addItem(name, backend_type)
+        backends_layout.addRow("Type:", self._backend_type_select)
+        self._backend_base_url_input = QLineEdit()
+        self._backend_base_url_input.setPlaceholderText("https://api.openai.com/v1")
+        backends_layout.addRow("Base URL:", self._backend_base_url_input)
+        self._backend_model_input = QLineEdit()
+        self._backend_model_input.setPlaceholderText("gpt-4o-mini")
+        backends_layout.addRow("Model:", self._backend_model_input)
+        self._backend_headers_input = QPlainTextEdit()
+        self._backend_headers_input.setPlaceholderText("Header-Name: value")
+        self._backend_headers_input.setFixedHeight(60)
+        backends_layout.addRow("Headers:", self._backend_headers_input)
+        self._backend_connect_timeout_input = QDoubleSpinBox()
+        self._backend_connect_timeout_input.setRange(0.5, 120)
+        self._backend_connect_timeout_input.setSuffix(" s")
+        backends_layout.addRow("Connect Timeout:", self._backend_connect_timeout_input)
+        self._backend_read_timeout_input = QDoubleSpinBox()
+        self._backend_read_timeout_input.setRange(1, 600)
+        self._backend_read_timeout_input.setSuffix(" s")
+        backends_layout.addRow("Read Timeout:", self._backend_read_timeout_input)
+        layout.addWidget(backends_group)
+
+        language_backends_group = QGroupBox("Backend per Language")
+        language_backends_layout = QFormLayout(language_backends_group)
+        self._language_backend_selects = {}
+        for lang, name in LANGUAGE_NAMES.items():
+            select = QComboBox()
+            self._language_backend_selects[lang] = select
+            language_backends_layout.addRow(f"{name}:", select)
+        layout.addWidget(language_backends_group)
+
         button_layout = QHBoxLayout()
         self._save_button = QPushButton("Save")
         self._cancel_button = QPushButton("Cancel")
@@ -80,6 +296,12 @@ class SettingsDialog(QDialog):
 
         self._save_button.clicked.connect(self._save_settings)
         self._cancel_button.clicked.connect(self.reject)
+        self._backend_select.currentIndexChanged.connect(self._select_backend)
+        self._backend_type_select.currentIndexChanged.connect(
+            self._update_backend_inputs
+        )
+        self._add_backend_button.clicked.connect(self._add_backend)
+        self._remove_backend_button.clicked.connect(self._remove_backend)
 
     def _load_settings(self):
         api_key = self._settings.value(API_KEY, "")
@@ -90,16 +312,197 @@ class SettingsDialog(QDialog):
         if index >= 0:
             self._target_lang_select.setCurrentIndex(index)
 
+        max_concurrent_requests = int(self._settings.value(MAX_CONCURRENT_REQUESTS, 6))
+        self._max_concurrent_requests_input.setValue(max_concurrent_requests)
+
+        stream_translation = self._settings.value(STREAM_TRANSLATION, True)
+        self._stream_translation_input.setChecked(stream_translation in (True, "true"))
+
+        self._auto_translate_origins_input.setPlainText(
+            "\n".join(get_auto_translate_origins())
+        )
+
+        self._tab_freeze_minutes_input.setValue(
+            int(self._settings.value(TAB_FREEZE_MINUTES, 5))
+        )
+        self._tab_memory_budget_input.setValue(
+            int(self._settings.value(TAB_MEMORY_BUDGET_MB, 2048))
+        )
+
+        self._speculative_translation_input.setChecked(
+            is_speculative_translation_enabled()
+        )
+        self._hover_dwell_input.setValue(int(self._settings.value(HOVER_DWELL_MS, 300)))
+        self._speculative_tokens_per_minute_input.setValue(
+            int(self._settings.value(SPECULATIVE_TOKENS_PER_MINUTE, 2000))
+        )
+
+        try:
+            self._backends = json.loads(self._settings.value(BACKENDS))
+        except (TypeError, ValueError):
+            self._backends = []
+        if not self._backends:
+            self._backends = [dict(definition) for definition in DEFAULT_BACKENDS]
+        self._backend_index = -1
+        self._update_backend_names()
+        self._select_backend(0)
+
+        try:
+            language_backends = json.loads(self._settings.value(LANGUAGE_BACKENDS))
+        except (TypeError, ValueError):
+            language_backends = {}
+        for lang, select in self._language_backend_selects.items():
+            index = select.findText(language_backends.get(lang, ""))
+            select.setCurrentIndex(max(0, index))
+
+    def _update_backend_names(self):
+        names = [definition["name"] for definition in self._backends]
+        self._backend_select.blockSignals(True)
+        self._backend_select.clear()
+        self._backend_select.addItems(names)
+        self._backend_select.setCurrentIndex(self._backend_index)
+        self._backend_select.blockSignals(False)
+        for select in self._language_backend_selects.values():
+            # keep each language on the same definition across renames and removals
+            current = select.currentData()
+            select.clear()
+            for definition in self._backends:
+                select.addItem(definition["name"], id(definition))
+            select.setCurrentIndex(max(0, select.findData(current)))
+        self._remove_backend_button.setEnabled(len(names) > 1)
+
+    def _select_backend(self, index: int):
+        self._store_backend()
+        self._backend_index = index
+        self._backend_select.blockSignals(True)
+        self._backend_select.setCurrentIndex(index)
+        self._backend_select.blockSignals(False)
+        definition = self._backends[index]
+        self._backend_name_input.setText(definition.get("name", ""))
+        type_index = self._backend_type_select.findData(definition.get("type"))
+        self._backend_type_select.setCurrentIndex(max(0, type_index))
+        self._backend_base_url_input.setText(definition.get("base_url", ""))
+        self._backend_model_input.setText(definition.get("model", ""))
+        self._backend_headers_input.setPlainText(
+            "\n".join(
+                f"{name}: {value}"
+                for name, value in definition.get("headers", {}).items()
+            )
+        )
+        self._backend_connect_timeout_input.setValue(
+            float(definition.get("connect_timeout", 10.0))
+        )
+        self._backend_read_timeout_input.setValue(
+            float(definition.get("read_timeout", 60.0))
+        )
+        self._update_backend_inputs()
+
+    def _store_backend(self):
+        # write the inputs back into the definition that is being edited
+        if not 0 <= self._backend_index < len(self._backends):
+            return
+        definition = self._backends[self._backend_index]
+        name = self._backend_name_input.text().strip() or definition["name"]
+        headers = {}
+        for line in self._backend_headers_input.toPlainText().splitlines():
+            header_name, _, value = line.partition(":")
+            if header_name.strip():
+                headers[header_name.strip()] = value.strip()
+        definition.update(
+            name=name,
+            type=self._backend_type_select.currentData(),
+            base_url=self._backend_base_url_input.text().strip(),
+            model=self._backend_model_input.text().strip(),
+            headers=headers,
+            connect_timeout=self._backend_connect_timeout_input.value(),
+            read_timeout=self._backend_read_timeout_input.value(),
+        )
+        if self._backend_select.itemText(self._backend_index) != name:
+            self._update_backend_names()
+
+    def _update_backend_inputs(self):
+        # the loopback backend has nothing to connect to
+        remote = self._backend_type_select.currentData() != "loopback"
+        for widget in (
+            self._backend_base_url_input,
+            self._backend_model_input,
+            self._backend_headers_input,
+            self._backend_connect_timeout_input,
+            self._backend_read_timeout_input,
+        ):
+            widget.setEnabled(remote)
+
+    def _add_backend(self):
+        self._store_backend()
+        names = {definition["name"] for definition in self._backends}
+        number = 1
+        while f"Server {number}" in names:
+            number += 1
+        self._backends.append({**DEFAULT_BACKENDS[0], "name": f"Server {number}"})
+        self._update_backend_names()
+        self._select_backend(len(self._backends) - 1)
+
+    def _remove_backend(self):
+        if len(self._backends) <= 1:
+            return
+        del self._backends[self._backend_index]
+        self._backend_index = -1
+        self._update_backend_names()
+        self._select_backend(0)
+
     def _save_settings(self):
         api_key = self._api_key_input.text().strip()
         target_lang = self._target_lang_select.currentData()
+        max_concurrent_requests = self._max_concurrent_requests_input.value()
+        stream_translation = self._stream_translation_input.isChecked()
+        auto_translate_origins = []
+        for line in self._auto_translate_origins_input.toPlainText().splitlines():
+            url = QUrl.fromUserInput(line.strip())
+            if line.strip() and url.isValid():
+                origin = url_origin(url)
+                if origin not in auto_translate_origins:
+                    auto_translate_origins.append(origin)
+        self._store_backend()
+        language_backends = {
+            lang: select.currentText()
+            for lang, select in self._language_backend_selects.items()
+        }
+
+        names = [definition["name"] for definition in self._backends]
+        if len(set(names)) != len(names):
+            QMessageBox.warning(self, "Warning", "Backend names must be unique")
+            return
+
+        from translationbackend import create_backend
 
-        if not api_key:
+        definition = self._backends[names.index(language_backends[target_lang])]
+        if not api_key and create_backend(definition).requires_api_key():
             QMessageBox.warning(self, "Warning", "Please enter an API key")
             return
 
         self._settings.setValue(API_KEY, api_key)
         self._settings.setValue(TARGET_LANG, target_lang)
+        self._settings.setValue(MAX_CONCURRENT_REQUESTS, max_concurrent_requests)
+        self._settings.setValue(STREAM_TRANSLATION, stream_translation)
+        self._settings.setValue(BACKENDS, json.dumps(self._backends))
+        self._settings.setValue(LANGUAGE_BACKENDS, json.dumps(language_backends))
+        self._settings.setValue(
+            AUTO_TRANSLATE_ORIGINS, json.dumps(auto_translate_origins)
+        )
+        self._settings.setValue(
+            TAB_FREEZE_MINUTES, self._tab_freeze_minutes_input.value()
+        )
+        self._settings.setValue(
+            TAB_MEMORY_BUDGET_MB, self._tab_memory_budget_input.value()
+        )
+        self._settings.setValue(
+            SPECULATIVE_TRANSLATION, self._speculative_translation_input.isChecked()
+        )
+        self._settings.setValue(HOVER_DWELL_MS, self._hover_dwell_input.value())
+        self._settings.setValue(
+            SPECULATIVE_TOKENS_PER_MINUTE,
+            self._speculative_tokens_per_minute_input.value(),
+        )
 
         QMessageBox.information(self, "Success", "Settings saved successfully!")
         self.accept()
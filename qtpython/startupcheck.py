@@ -0,0 +1,73 @@
+from __future__ import annotations
+import argparse
+import os
+import subprocess
+import sys
+
+# the first window of an empty session, on a developer machine
+DEFAULT_BUDGET_MS = 1000.0
+DEFAULT_RUNS = 3
+RUN_TIMEOUT = 60.0
+MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+
+
+def run_once(budget_ms: float) -> tuple[bool | None, str]:
+    # main.py quits once started and reports whether it was within the budget,
+    # None when it failed to start
+    process = subprocess.run(
+        [
+            sys.executable,
+            MAIN,
+            "--startup-timing",
+            "--startup-budget-ms",
+            str(budget_ms),
+        ],
+        capture_output=True,
+        text=True,
+        timeout=RUN_TIMEOUT,
+    )
+    if process.returncode == 0:
+        return True, process.stderr
+    if process.returncode == 1 and "exceeded" in process.stderr:
+        return False, process.stderr
+    return None, process.stderr
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Start the browser a few times and fail if the first window"
+        " takes longer than the budget in most of them."
+    )
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=DEFAULT_RUNS,
+        help="the first start is usually the slowest, with cold disk caches",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = []
+    for run in range(args.runs):
+        within_budget, report = run_once(args.budget_ms)
+        print(f"run {run + 1}:\n{report.rstrip()}", file=sys.stderr)
+        if within_budget is None:
+            print("main.py failed to start", file=sys.stderr)
+            return 2
+        results.append(within_budget)
+
+    # most starts decide, one slow start is noise
+    within_budget = sum(results) * 2 >= len(results)
+    print(
+        f"{sum(results)} of {args.runs} starts within {args.budget_ms:.0f} ms:"
+        f" {'ok' if within_budget else 'exceeded'}",
+        file=sys.stderr,
+    )
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+from __future__ import annotations
+import time
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QEvent
+from PySide6.QtCore import QObject
+from PySide6.QtCore import QTimer
+from PySide6.QtCore import Signal
+
+
+class StartupTiming:
+    _start: float
+    _last: float
+    _phases: list[tuple[str, float]]
+
+    def __init__(self, start: float):
+        self._start = start
+        self._last = start
+        self._phases = []
+
+    def mark(self, phase: str):
+        # the phase ends now and started where the previous one ended
+        now = time.perf_counter()
+        self._phases.append((phase, now - self._last))
+        self._last = now
+
+    def elapsed(self) -> float:
+        return self._last - self._start
+
+    def report(self) -> str:
+        width = max(len(phase) for phase, _duration in self._phases)
+        lines = [
+            f"{phase:<{width}}  {duration * 1000:8.1f} ms"
+            for phase, duration in self._phases
+        ]
+        lines.append(f"{'total':<{width}}  {self.elapsed() * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+class FirstPaintWatcher(QObject):
+    # emitted once, after the widget has been painted for the first time
+    painted = Signal()
+
+    def __init__(self, widget: QWidget):
+        super().__init__(widget)
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Paint:
+            watched.removeEventFilter(self)
+            QTimer.singleShot(0, self.painted.emit)
+        return False
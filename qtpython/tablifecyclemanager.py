@@ -0,0 +1,124 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import time
+
+from PySide6.QtWebEngineCore import QWebEnginePage
+from PySide6.QtCore import QObject
+from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
+
+from settings import get_settings, TAB_FREEZE_MINUTES, TAB_MEMORY_BUDGET_MB
+
+if TYPE_CHECKING:
+    from browser import Browser
+    from browserwebview import BrowserWebView
+
+CHECK_INTERVAL_MS = 30 * 1000
+# after a tab was suspended, its renderer may take a moment to exit
+RECHECK_DELAY_MS = 1000
+# bytes, for renderers whose memory cannot be read
+ESTIMATED_RENDERER_MEMORY = 150 * 1024 * 1024
+# from the state that keeps the most memory to the one that keeps the least
+LIFECYCLE_STATES = [
+    QWebEnginePage.LifecycleState.Active,
+    QWebEnginePage.LifecycleState.Frozen,
+    QWebEnginePage.LifecycleState.Discarded,
+]
+
+
+def renderer_memory(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return ESTIMATED_RENDERER_MEMORY
+
+
+class TabLifecycleManager(QObject):
+    # freezes tabs that stay in the background and discards them, least recently
+    # shown first, while the renderers of all tabs use more than the budget
+    _browser: Browser
+    _timer: QTimer
+    _recheck_timer: QTimer
+
+    def __init__(self, browser: Browser):
+        super().__init__(browser)
+        self._browser = browser
+        self._timer = QTimer(self)
+        self._timer.setInterval(CHECK_INTERVAL_MS)
+        self._timer.timeout.connect(self.check)
+        self._timer.start()
+        self._recheck_timer = QTimer(self)
+        self._recheck_timer.setSingleShot(True)
+        self._recheck_timer.setInterval(RECHECK_DELAY_MS)
+        self._recheck_timer.timeout.connect(self.check)
+
+    def check(self):
+        settings = get_settings()
+        freeze_after = int(settings.value(TAB_FREEZE_MINUTES, 5)) * 60
+        budget = int(settings.value(TAB_MEMORY_BUDGET_MB, 2048)) * 1024 * 1024
+        background = sorted(
+            (
+                web_view
+                for web_view in self._browser.web_views()
+                if web_view.background_since() is not None
+            ),
+            key=lambda web_view: web_view.background_since(),
+        )
+
+        if freeze_after:
+            now = time.monotonic()
+            for web_view in background:
+                if now - web_view.background_since() >= freeze_after:
+                    self._suspend(web_view, QWebEnginePage.LifecycleState.Frozen)
+
+        if budget:
+            self._enforce_budget(budget, background)
+
+    def _enforce_budget(self, budget: int, background: list[BrowserWebView]):
+        # a suspend only takes effect after the page state was taken, so one tab is
+        # discarded at a time and the memory is measured again once it is gone
+        web_views = self._browser.web_views()
+        if any(web_view.is_suspending() for web_view in web_views):
+            return
+        pids = {web_view.page().renderProcessPid() for web_view in web_views}
+        usage = sum(renderer_memory(pid) for pid in pids if pid > 0)
+        if usage <= budget:
+            return
+
+        for web_view in background:
+            if web_view.page().renderProcessPid() <= 0:
+                continue
+            if self._suspend(web_view, QWebEnginePage.LifecycleState.Discarded):
+                return
+
+    def _suspend(
+        self, web_view: BrowserWebView, state: QWebEnginePage.LifecycleState
+    ) -> bool:
+        # true when the suspend was started, its outcome comes with suspend_finished
+        page = web_view.page()
+        if LIFECYCLE_STATES.index(page.lifecycleState()) >= LIFECYCLE_STATES.index(
+            state
+        ):
+            return False
+        # e.g. pages playing audio or with unsaved form input are not discarded
+        if LIFECYCLE_STATES.index(page.recommendedState()) < LIFECYCLE_STATES.index(
+            state
+        ):
+            return False
+        # results for a frozen page would wait until it is shown again
+        if web_view.has_pending_translations() or page.isLoading():
+            return False
+        web_view.suspend_finished.connect(
+            self._handle_suspend_finished, Qt.ConnectionType.SingleShotConnection
+        )
+        web_view.suspend(state)
+        return True
+
+    def _handle_suspend_finished(self, suspended: bool):
+        # a failed suspend waits for the next regular check
+        if suspended:
+            self._recheck_timer.start()
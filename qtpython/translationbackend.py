@@ -0,0 +1,191 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any
+from urllib.parse import urlparse
+import io
+import json
+import re
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from settings import DEFAULT_BACKEND_NAME, DEFAULT_BACKENDS
+
+OPENAI_COMPATIBLE = "openai"
+LOOPBACK = "loopback"
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+DEFAULT_MODEL = "gpt-4o-mini"
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 60.0
+
+
+class TranslationBackend(ABC):
+    name: str
+    model: str
+
+    def __init__(self, name: str, model: str):
+        self.name = name
+        self.model = model
+
+    @abstractmethod
+    def cache_id(self) -> str:
+        # translations from different models or servers must not share cache entries
+        pass
+
+    @abstractmethod
+    def requires_api_key(self) -> bool:
+        pass
+
+    @abstractmethod
+    def post(
+        self,
+        session: requests.Session,
+        api_key: str,
+        messages: list[dict[str, str]],
+        remaining: float,
+        **kw,
+    ) -> requests.Response:
+        # sends a chat completions request, 'remaining' is the time left in seconds
+        pass
+
+    def warm_up(self, session: requests.Session):
+        # opens a connection in 'session' ahead of the first request, if there is one
+        pass
+
+
+class OpenAICompatibleBackend(TranslationBackend):
+    base_url: str
+    headers: dict[str, str]
+    connect_timeout: float
+    read_timeout: float
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str = DEFAULT_BASE_URL,
+        model: str = DEFAULT_MODEL,
+        headers: dict[str, str] | None = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ):
+        super().__init__(name, model)
+        self.base_url = base_url.rstrip("/")
+        self.headers = headers or {}
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+    def cache_id(self) -> str:
+        return f"{self.model}@{self.base_url}"
+
+    def requires_api_key(self) -> bool:
+        # self-hosted servers usually take no key or get one through 'headers'
+        return urlparse(self.base_url).hostname == "api.openai.com"
+
+    def post(
+        self,
+        session: requests.Session,
+        api_key: str,
+        messages: list[dict[str, str]],
+        remaining: float,
+        **kw,
+    ) -> requests.Response:
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        headers.update(self.headers)
+        return session.post(
+            f"{self.base_url}/chat/completions",
+            headers=headers,
+            json={"model": self.model, "messages": messages, **kw},
+            timeout=(self.connect_timeout, max(1.0, min(self.read_timeout, remaining))),
+            stream=kw.get("stream", False),
+        )
+
+    def warm_up(self, session: requests.Session):
+        # any answer leaves a connection in the pool, and HEAD is not billed
+        session.head(
+            self.base_url,
+            headers=self.headers,
+            timeout=(self.connect_timeout, self.connect_timeout),
+            allow_redirects=False,
+        )
+
+
+class LoopbackBackend(TranslationBackend):
+    # answers locally without any network, echoing the text with a marker
+
+    def __init__(self, name: str, model: str = LOOPBACK):
+        super().__init__(name, model)
+
+    def cache_id(self) -> str:
+        return f"{self.model}@{LOOPBACK}"
+
+    def requires_api_key(self) -> bool:
+        return False
+
+    def post(
+        self,
+        session: requests.Session,
+        api_key: str,
+        messages: list[dict[str, str]],
+        remaining: float,
+        **kw,
+    ) -> requests.Response:
+        content = messages[-1]["content"]
+        if kw.get("response_format", {}).get("type") == "json_object":
+            segments = json.loads(content)["segments"]
+            for segment in segments:
+                segment["text"] = self._translate(segment["text"])
+            content = json.dumps({"segments": segments}, ensure_ascii=False)
+        else:
+            content = self._translate(content)
+
+        if kw.get("stream"):
+            # one server-sent event per word, the way a real server streams tokens
+            body = "".join(
+                f"data: {json.dumps({'choices': [{'delta': {'content': word}}]})}\n\n"
+                for word in re.findall(r"\s*\S+\s*", content)
+            )
+            return self._response(body + "data: [DONE]\n\n", "text/event-stream")
+        data = {"choices": [{"message": {"role": "assistant", "content": content}}]}
+        return self._response(json.dumps(data, ensure_ascii=False), "application/json")
+
+    def _translate(self, text: str) -> str:
+        return f"[{self.name}] {text}"
+
+    def _response(self, body: str, content_type: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict({"Content-Type": content_type})
+        response.encoding = "utf8"
+        response.raw = io.BytesIO(body.encode("utf8"))
+        return response
+
+
+def create_backend(definition: dict[str, Any]) -> TranslationBackend:
+    name = definition.get("name") or DEFAULT_BACKEND_NAME
+    if definition.get("type") == LOOPBACK:
+        return LoopbackBackend(name)
+    return OpenAICompatibleBackend(
+        name,
+        base_url=definition.get("base_url") or DEFAULT_BASE_URL,
+        model=definition.get("model") or DEFAULT_MODEL,
+        headers=dict(definition.get("headers") or {}),
+        connect_timeout=float(
+            definition.get("connect_timeout") or DEFAULT_CONNECT_TIMEOUT
+        ),
+        read_timeout=float(definition.get("read_timeout") or DEFAULT_READ_TIMEOUT),
+    )
+
+
+def load_backends(definitions: str) -> dict[str, TranslationBackend]:
+    try:
+        backends = [
+            create_backend(definition) for definition in json.loads(definitions)
+        ]
+    except (TypeError, ValueError):
+        backends = []
+    if not backends:
+        backends = [create_backend(definition) for definition in DEFAULT_BACKENDS]
+    return {backend.name: backend for backend in backends}
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+
+from PySide6.QtCore import QStandardPaths
+
+CACHE_FILE_NAME = "translations.sqlite3"
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+# hits only note their time, which is written with the next put() or once this many
+# hits have piled up, so that a page of cached text doesn't commit once per paragraph
+CACHE_MAX_PENDING_HITS = 256
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def cache_key(text: str, target_lang: str, backend_id: str, prompt_version: int) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf8")).hexdigest()
+    return f"{digest}:{target_lang}:{backend_id}:{prompt_version}"
+
+
+class TranslationCache:
+    _connection: sqlite3.Connection
+    _max_bytes: int
+    _total_bytes: int
+    # key to the time of its latest hit, not written yet
+    _pending_hits: dict[str, float]
+
+    def __init__(self, path: str, max_bytes: int = CACHE_MAX_BYTES):
+        self._max_bytes = max_bytes
+        self._pending_hits = {}
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " key TEXT PRIMARY KEY,"
+            " translated_text TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS translations_last_used"
+            " ON translations (last_used)"
+        )
+        self._connection.commit()
+        row = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM translations"
+        ).fetchone()
+        self._total_bytes = row[0]
+
+    def get(self, key: str) -> str | None:
+        row = self._connection.execute(
+            "SELECT translated_text FROM translations WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._pending_hits[key] = time.time()
+        if len(self._pending_hits) >= CACHE_MAX_PENDING_HITS:
+            self._write_hits()
+            self._connection.commit()
+        return row[0]
+
+    def flush(self):
+        if self._pending_hits:
+            self._write_hits()
+            self._connection.commit()
+
+    def put(self, key: str, translated_text: str):
+        # eviction goes by the time of the latest hit
+        self._write_hits()
+        size = len(key) + len(translated_text.encode("utf8"))
+        row = self._connection.execute(
+            "SELECT size FROM translations WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            self._total_bytes -= row[0]
+        self._connection.execute(
+            "INSERT OR REPLACE INTO translations (key, translated_text, size, last_used)"
+            " VALUES (?, ?, ?, ?)",
+            (key, translated_text, size, time.time()),
+        )
+        self._total_bytes += size
+        if self._total_bytes > self._max_bytes:
+            self._evict()
+        self._connection.commit()
+
+    def clear(self):
+        self._pending_hits.clear()
+        self._connection.execute("DELETE FROM translations")
+        self._connection.commit()
+        self._total_bytes = 0
+
+    def _write_hits(self):
+        self._connection.executemany(
+            "UPDATE translations SET last_used = ? WHERE key = ?",
+            [(last_used, key) for key, last_used in self._pending_hits.items()],
+        )
+        self._pending_hits.clear()
+
+    def _evict(self):
+        # drop least recently used entries until we are back under 90% of the budget
+        target = self._max_bytes * 0.9
+        cursor = self._connection.execute(
+            "SELECT key, size FROM translations ORDER BY last_used"
+        )
+        evicted = []
+        for key, size in cursor:
+            if self._total_bytes <= target:
+                break
+            evicted.append((key,))
+            self._total_bytes -= size
+        cursor.close()
+        self._connection.executemany("DELETE FROM translations WHERE key = ?", evicted)
+
+
+_cache: TranslationCache | None = None
+
+
+def get_translation_cache() -> TranslationCache:
+    global _cache
+    if _cache is None:
+        directory = QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.CacheLocation
+        )
+        os.makedirs(directory, exist_ok=True)
+        _cache = TranslationCache(os.path.join(directory, CACHE_FILE_NAME))
+    return _cache
@@ -0,0 +1,915 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Mapping
+import heapq
+import itertools
+import json
+import threading
+import time
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QObject
+from PySide6.QtCore import QRunnable
+from PySide6.QtCore import QThreadPool
+from PySide6.QtCore import QTimer
+from PySide6.QtCore import Signal
+from PySide6.QtCore import Slot
+import requests
+
+from ratelimit import (
+    AimdController,
+    RateLimiter,
+    TokenBudget,
+    backoff_delay,
+    parse_retry_after,
+)
+
+from settings import (
+    get_settings,
+    BACKENDS,
+    LANGUAGE_BACKENDS,
+    LANGUAGE_NAMES,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_CONCURRENT_REQUESTS_LIMIT,
+    SPECULATIVE_TOKENS_PER_MINUTE,
+    STREAM_TRANSLATION,
+)
+from translationbackend import TranslationBackend, load_backends
+from translationcache import cache_key, get_translation_cache
+from translationmemory import get_translation_memory
+from translationmetrics import (
+    TimedHTTPAdapter,
+    TranslationMetrics,
+    TranslationMetricsRecord,
+    connect_time,
+    reset_connect_time,
+)
+
+PROMPT_VERSION = 1
+MEMORY_CACHE_MAX_ENTRIES = 2048
+BATCH_TOKEN_BUDGET = 1500
+BATCH_MAX_SEGMENTS = 50
+PROGRESS_INTERVAL = 0.05
+# one deadline for the page's promise, the queue wait and the HTTP call, in seconds
+TRANSLATION_TIMEOUT = 60.0
+SHUTDOWN_TIMEOUT_MS = 2000
+MAX_RETRIES = 4
+TRANSIENT_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+# a warm connection is refreshed after this many idle seconds, well within the
+# keep-alive timeout of common servers, for as long as translation is in use
+WARM_CONNECTION_REFRESH = 30.0
+KEEP_WARM_DURATION = 600.0
+KEEP_WARM_CHECK_INTERVAL_MS = 5000
+# speculative translations are queued behind every requested one, only run while
+# this many workers stay free for requests and are dropped after their timeout
+SPECULATIVE_PRIORITY = 1_000_000
+SPECULATIVE_RESERVED_WORKERS = 1
+SPECULATIVE_TIMEOUT = 30.0
+
+
+# called with (translated_text, error); exactly one of them is non-empty
+TranslationCallback = Callable[[str, str], None]
+# called with the partial translation while a streamed translation is arriving
+ProgressCallback = Callable[[str], None]
+
+
+@dataclass(eq=False)
+class TranslationWaiter:
+    on_complete: TranslationCallback
+    on_progress: ProgressCallback | None
+    # time.monotonic() value after which the request fails with a timeout
+    deadline: float
+    # lower values are sent first
+    priority: int = 0
+    key: str = ""
+
+
+@dataclass(eq=False)
+class TranslationJob:
+    key: str
+    text: str
+    api_key: str
+    target_lang: str
+    backend: TranslationBackend
+    waiters: list[TranslationWaiter] = field(default_factory=list)
+    batchable: bool = True
+    task: TranslatorTask | None = None
+    priority: int = 0
+    sequence: int = 0
+    queued: bool = False
+    # identifies the job's current entry in the engine's queue
+    queue_stamp: int = 0
+    attempts: int = 0
+    # source and translation of a similar text translated before, sent along
+    reference: tuple[str, str] | None = None
+    created: float = field(default_factory=time.monotonic)
+    # when the job last joined the queue, for the first time or for a retry
+    enqueued: float = 0.0
+
+    def deadline(self) -> float:
+        return max(waiter.deadline for waiter in self.waiters)
+
+
+@dataclass
+class TranslationResult:
+    job: TranslationJob
+    translated_text: str = ""
+    error: str = ""
+    # the batch response did not contain this segment, translate it on its own
+    retry: bool = False
+    # the request failed in a way that may succeed when tried again later
+    transient: bool = False
+
+
+def estimate_tokens(text: str) -> int:
+    # about four characters per token for ASCII, about one per character otherwise
+    ascii_count = len(text.encode("ascii", "ignore"))
+    return (ascii_count + 3) // 4 + (len(text) - ascii_count)
+
+
+def memory_scope(target_lang: str, backend: TranslationBackend) -> str:
+    # translations are only reused for the language, backend and prompt they were made with
+    return f"{target_lang}:{backend.cache_id()}:{PROMPT_VERSION}"
+
+
+def request_tokens(jobs: list[TranslationJob]) -> int:
+    # rate limits count the completion too, which is about as long as the input
+    return sum(estimate_tokens(job.text) for job in jobs) * 2
+
+
+def is_speculative(job: TranslationJob) -> bool:
+    # nobody has asked for the translation yet
+    return job.priority >= SPECULATIVE_PRIORITY
+
+
+def is_transient_error(error: Exception) -> bool:
+    if isinstance(error, requests.HTTPError):
+        return (
+            error.response is not None
+            and error.response.status_code in TRANSIENT_STATUS_CODES
+        )
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+class TranslatorTask(QRunnable):
+    def __init__(
+        self,
+        engine: TranslationEngine,
+        session: requests.Session,
+        jobs: list[TranslationJob],
+        stream: bool,
+    ):
+        super().__init__()
+        self._engine = engine
+        self._session = session
+        self._jobs = jobs
+        self._stream = stream
+        self._deadline = max(job.deadline() for job in jobs)
+        self._cancel_event = threading.Event()
+        # status and headers of the last response, None and empty without one
+        self.status: int | None = None
+        self.headers: Mapping[str, str] = {}
+        # seconds; connect is zero when a pooled connection was reused
+        self.started = 0.0
+        self.connect = 0.0
+        self.ttfb = 0.0
+        self.latency = 0.0
+        self.usage: dict[str, int] = {}
+
+    def jobs(self) -> list[TranslationJob]:
+        return self._jobs
+
+    def cancel(self):
+        # the request is aborted at its next chunk, see _complete()
+        self._cancel_event.set()
+
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self):
+        start = self.started = time.monotonic()
+        if len(self._jobs) == 1 and self._stream:
+            results = [self._translate_streaming(self._jobs[0])]
+        elif len(self._jobs) == 1:
+            results = [self._translate_single(self._jobs[0])]
+        else:
+            results = self._translate_batch(self._jobs)
+        self.latency = time.monotonic() - start
+        try:
+            self._engine.task_finished.emit(self, results)
+        except RuntimeError:
+            # the engine was deleted while the request was running
+            pass
+
+    def _post(self, job: TranslationJob, system_prompt: str, content: str, **kw):
+        if self._cancel_event.is_set():
+            raise RuntimeError("Translation cancelled")
+        reset_connect_time()
+        try:
+            response = job.backend.post(
+                self._session,
+                job.api_key,
+                [
+                    {
+                        "role": "system",
+                        "content": system_prompt,
+                    },
+                    {
+                        "role": "user",
+                        "content": content,
+                    },
+                ],
+                self._deadline - time.monotonic(),
+                **kw,
+            )
+        finally:
+            self.connect = connect_time()
+        # time until the response headers arrived, including the connect time
+        self.ttfb = response.elapsed.total_seconds()
+        self.status = response.status_code
+        self.headers = response.headers
+        response.raise_for_status()
+        return response
+
+    def _complete(
+        self,
+        job: TranslationJob,
+        system_prompt: str,
+        content: str,
+        on_progress: Callable[[str], None] | None = None,
+        **kw,
+    ) -> str:
+        # every response is streamed, so a cancelled request stops at its next chunk
+        # instead of holding its worker until the whole translation has arrived
+        response = self._post(
+            job,
+            system_prompt,
+            content,
+            stream=True,
+            stream_options={"include_usage": True},
+            **kw,
+        )
+        parts = []
+        last_progress = 0.0
+        with response:
+            for line in response.iter_lines(chunk_size=None):
+                if self._cancel_event.is_set():
+                    raise RuntimeError("Translation cancelled")
+                # server-sent events, one "data: <json>" line per chunk
+                if not line.startswith(b"data:"):
+                    continue
+                payload = line[5:].strip()
+                if payload == b"[DONE]":
+                    break
+                data = json.loads(payload)
+                # the last chunk has the usage and no choices
+                self.usage = data.get("usage") or self.usage
+                choices = data["choices"]
+                delta = choices[0]["delta"].get("content") if choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                now = time.monotonic()
+                if on_progress and now - last_progress >= PROGRESS_INTERVAL:
+                    last_progress = now
+                    on_progress("".join(parts))
+        return "".join(parts).strip()
+
+    def _system_prompt(self, job: TranslationJob) -> str:
+        prompt = f"You are a translator. Translate the given text to {LANGUAGE_NAMES[job.target_lang]}. Only respond with the translated text, without any additional explanation or context."
+        if job.reference:
+            source, translated_text = job.reference
+            prompt += f" A similar text was translated before, keep to its wording where the texts are the same.\nText: {source}\nTranslation: {translated_text}"
+        return prompt
+
+    def _failure(self, job: TranslationJob, error: Exception) -> TranslationResult:
+        return TranslationResult(
+            job, error=str(error), transient=is_transient_error(error)
+        )
+
+    def _translate_single(self, job: TranslationJob) -> TranslationResult:
+        try:
+            translated_text = self._complete(job, self._system_prompt(job), job.text)
+            return TranslationResult(job, translated_text=translated_text)
+        except Exception as e:
+            return self._failure(job, e)
+
+    def _translate_streaming(self, job: TranslationJob) -> TranslationResult:
+        try:
+            translated_text = self._complete(
+                job,
+                self._system_prompt(job),
+                job.text,
+                partial(self._engine.task_progress.emit, job),
+            )
+            if not translated_text:
+                raise ValueError("Empty translation")
+            return TranslationResult(job, translated_text=translated_text)
+        except Exception as e:
+            return self._failure(job, e)
+
+    def _translate_batch(self, jobs: list[TranslationJob]) -> list[TranslationResult]:
+        segments = []
+        for i, job in enumerate(jobs):
+            segment = {"id": i, "text": job.text}
+            if job.reference:
+                source, translated_text = job.reference
+                segment["reference"] = {"text": source, "translation": translated_text}
+            segments.append(segment)
+        reference_prompt = (
+            ' A segment may have a "reference" with the translation of a similar text, keep to its wording where the texts are the same.'
+            if any(job.reference for job in jobs)
+            else ""
+        )
+        try:
+            content = self._complete(
+                jobs[0],
+                f'You are a translator. Translate the text of every segment to {LANGUAGE_NAMES[jobs[0].target_lang]}.{reference_prompt} Respond with a JSON object of the form {{"segments": [{{"id": <id>, "text": <translated text>}}]}} that contains every given segment id exactly once. Only respond with the JSON object, without any additional explanation or context.',
+                json.dumps({"segments": segments}, ensure_ascii=False),
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            return [self._failure(job, e) for job in jobs]
+
+        # segments may have been merged, split or dropped unless every id comes back
+        # exactly once, then no translation of the batch can be trusted
+        translations = {}
+        try:
+            returned = json.loads(content)["segments"]
+            for segment in returned:
+                translations[int(segment["id"])] = segment["text"].strip()
+            if len(returned) != len(jobs) or set(translations) != set(range(len(jobs))):
+                translations = {}
+        except Exception:
+            translations = {}
+
+        if not all(translations.get(i) for i in range(len(jobs))):
+            return [TranslationResult(job, retry=True) for job in jobs]
+        return [
+            TranslationResult(job, translated_text=translations[i])
+            for i, job in enumerate(jobs)
+        ]
+
+
+class WarmUpTask(QRunnable):
+    def __init__(
+        self,
+        engine: TranslationEngine,
+        session: requests.Session,
+        backend: TranslationBackend,
+    ):
+        super().__init__()
+        self._engine = engine
+        self._session = session
+        self._backend = backend
+
+    def run(self):
+        try:
+            self._backend.warm_up(self._session)
+            connected = True
+        except requests.RequestException:
+            # the first translation connects on its own
+            connected = False
+        try:
+            self._engine.warm_up_finished.emit(connected)
+        except RuntimeError:
+            # the engine was deleted while connecting
+            pass
+
+
+class MemoryWriteTask(QRunnable):
+    def __init__(self, entries: list[tuple[str, str]], scope: str):
+        super().__init__()
+        self._entries = entries
+        self._scope = scope
+
+    def run(self):
+        get_translation_memory().add_many(self._entries, self._scope)
+
+
+class TranslationEngine(QObject):
+    # emitted from pool threads, delivered on the engine's thread
+    task_finished = Signal(object, object)
+    task_progress = Signal(object, str)
+    # whether the warm-up left an open connection
+    warm_up_finished = Signal(bool)
+
+    _memory_cache: OrderedDict[str, str]
+    _pending: dict[str, TranslationJob]
+    # heap of (priority, sequence, stamp, job); entries are left behind when a job
+    # is reprioritized or cancelled and skipped when their stamp is outdated
+    _queue: list[tuple[int, int, int, TranslationJob]]
+    _queued_count: int
+    _sequence: itertools.count
+    _dispatch_scheduled: bool
+    _active_count: int
+    _running_tasks: set[TranslatorTask]
+    _max_workers: int
+    _concurrency: AimdController
+    _rate_limiter: RateLimiter
+    _stream: bool
+    _backends: dict[str, TranslationBackend]
+    _language_backends: dict[str, str]
+    _thread_pool: QThreadPool
+    # one thread, so that translation memory writes neither wait for a translation
+    # worker nor run on the GUI thread
+    _memory_pool: QThreadPool
+    _session: requests.Session
+    _deadline_timer: QTimer
+    _throttle_timer: QTimer
+    _metrics: TranslationMetrics
+    # the backend whose connection is kept open, until the monotonic time
+    _warm_backend: TranslationBackend | None
+    _keep_warm_until: float
+    _connection_used: float
+    _warming: bool
+    _keep_warm_timer: QTimer
+    _speculative_budget: TokenBudget
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._memory_cache = OrderedDict()
+        self._pending = {}
+        self._queue = []
+        self._queued_count = 0
+        self._sequence = itertools.count()
+        self._dispatch_scheduled = False
+        self._active_count = 0
+        self._running_tasks = set()
+        self._concurrency = AimdController(MAX_CONCURRENT_REQUESTS_LIMIT)
+        self._rate_limiter = RateLimiter()
+        self._metrics = TranslationMetrics()
+        self._thread_pool = QThreadPool(self)
+        self._memory_pool = QThreadPool(self)
+        self._memory_pool.setMaxThreadCount(1)
+        self._session = self._create_session()
+        self._deadline_timer = QTimer(self)
+        self._deadline_timer.setInterval(500)
+        self._deadline_timer.timeout.connect(self._expire_waiters)
+        # holds dispatching back until the rate limit allows another request
+        self._throttle_timer = QTimer(self)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.timeout.connect(self._dispatch)
+        self._warm_backend = None
+        self._keep_warm_until = 0.0
+        self._connection_used = 0.0
+        self._warming = False
+        self._keep_warm_timer = QTimer(self)
+        self._keep_warm_timer.setInterval(KEEP_WARM_CHECK_INTERVAL_MS)
+        self._keep_warm_timer.timeout.connect(self._keep_warm)
+        self._speculative_budget = TokenBudget()
+        self.apply_settings()
+        self.task_finished.connect(self._handle_task_finished)
+        self.task_progress.connect(self._handle_task_progress)
+        self.warm_up_finished.connect(self._handle_warm_up_finished)
+
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self._shut_down)
+
+    def _shut_down(self):
+        # running requests stop at their next chunk, the wait is bounded in case a
+        # server does not send one
+        self._thread_pool.clear()
+        for task in self._running_tasks:
+            task.cancel()
+        self._thread_pool.waitForDone(SHUTDOWN_TIMEOUT_MS)
+        self._memory_pool.waitForDone(SHUTDOWN_TIMEOUT_MS)
+        get_translation_cache().flush()
+
+    def queue_depth(self) -> int:
+        return self._queued_count
+
+    def active_count(self) -> int:
+        return self._active_count
+
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def metrics(self) -> TranslationMetrics:
+        return self._metrics
+
+    def concurrency_limit(self) -> int:
+        # the configured maximum, lowered while the server is throttling us
+        return min(self._max_workers, self._concurrency.limit())
+
+    def set_max_workers(self, max_workers: int):
+        self._max_workers = max(1, min(max_workers, MAX_CONCURRENT_REQUESTS_LIMIT))
+        self._concurrency.set_max_limit(self._max_workers)
+        # cancelled tasks keep their worker until they return, one more is left for
+        # the warm-up task
+        self._thread_pool.setMaxThreadCount(self._max_workers + 1)
+        self._dispatch()
+
+    def apply_settings(self):
+        settings = get_settings()
+        self._stream = settings.value(STREAM_TRANSLATION) in (True, "true")
+        self._backends = load_backends(settings.value(BACKENDS))
+        try:
+            self._language_backends = json.loads(settings.value(LANGUAGE_BACKENDS))
+        except (TypeError, ValueError):
+            self._language_backends = {}
+        self.set_max_workers(int(settings.value(MAX_CONCURRENT_REQUESTS)))
+        self._speculative_budget.set_tokens_per_minute(
+            int(settings.value(SPECULATIVE_TOKENS_PER_MINUTE))
+        )
+        # the backend may have been replaced, the next warm_up() picks the new one
+        self._warm_backend = None
+        self._keep_warm_timer.stop()
+
+    def backend(self, target_lang: str) -> TranslationBackend:
+        backend = self._backends.get(self._language_backends.get(target_lang, ""))
+        return backend or next(iter(self._backends.values()))
+
+    def warm_up(self, target_lang: str):
+        # opens a connection to the backend in the background and keeps it open
+        # while translations keep coming, so the first one does not wait for it
+        self._warm_backend = self.backend(target_lang)
+        self._keep_warm_until = time.monotonic() + KEEP_WARM_DURATION
+        self._start_warm_up()
+        if not self._keep_warm_timer.isActive():
+            self._keep_warm_timer.start()
+
+    def _start_warm_up(self):
+        if self._warming or self._warm_backend is None:
+            return
+        self._warming = True
+        self._thread_pool.start(WarmUpTask(self, self._session, self._warm_backend))
+
+    def _keep_warm(self):
+        now = time.monotonic()
+        if now >= self._keep_warm_until:
+            self._warm_backend = None
+            self._keep_warm_timer.stop()
+        elif now - self._connection_used >= WARM_CONNECTION_REFRESH:
+            self._start_warm_up()
+
+    @Slot(bool)
+    def _handle_warm_up_finished(self, connected: bool):
+        self._warming = False
+        # a failed warm-up is tried again by the next _keep_warm() check
+        if connected:
+            self._connection_used = time.monotonic()
+            self._metrics.record_warm_up()
+
+    def translate(
+        self,
+        text: str,
+        api_key: str,
+        target_lang: str,
+        waiter: TranslationWaiter,
+    ) -> str | None:
+        # returns the cached translation, or None after scheduling 'waiter'
+        backend = self.backend(target_lang)
+        key = cache_key(text, target_lang, backend.cache_id(), PROMPT_VERSION)
+        translated_text = self._lookup(key)
+        if translated_text is not None:
+            return translated_text
+
+        # attach to the outstanding request for the same text if there is one
+        job = self._pending.get(key)
+        if job is None:
+            # the same text with other numbers, dates or identifiers may have been translated
+            match = get_translation_memory().lookup(
+                text, memory_scope(target_lang, backend)
+            )
+            if match is not None and match.reused_text is not None:
+                self._remember(key, match.reused_text)
+                self._metrics.record(TranslationMetricsRecord("reuse"))
+                return match.reused_text
+            job = TranslationJob(key, text, api_key, target_lang, backend)
+            if match is not None:
+                job.reference = (match.source, match.translated_text)
+                self._metrics.record_reference()
+            self._pending[key] = job
+            job.priority = waiter.priority
+            job.sequence = next(self._sequence)
+            self._enqueue(job)
+        waiter.key = key
+        job.waiters.append(waiter)
+        self._update_priority(job)
+        if not self._deadline_timer.isActive():
+            self._deadline_timer.start()
+        return None
+
+    def prefetch(self, text: str, api_key: str, target_lang: str):
+        # translates 'text' into the cache ahead of a request that may follow
+        backend = self.backend(target_lang)
+        key = cache_key(text, target_lang, backend.cache_id(), PROMPT_VERSION)
+        if key in self._pending or key in self._memory_cache:
+            return
+        translated_text = get_translation_cache().get(key)
+        if translated_text is not None:
+            self._remember(key, translated_text)
+            return
+        if not self._speculative_budget.allows(estimate_tokens(text) * 2):
+            return
+
+        # the result only goes into the cache
+        waiter = TranslationWaiter(
+            lambda _translated_text, _error: None,
+            None,
+            time.monotonic() + SPECULATIVE_TIMEOUT,
+            SPECULATIVE_PRIORITY,
+        )
+        self.translate(text, api_key, target_lang, waiter)
+
+    def cancel(self, waiter: TranslationWaiter):
+        job = self._pending.get(waiter.key)
+        if job is None or waiter not in job.waiters:
+            return
+        job.waiters.remove(waiter)
+        if job.waiters:
+            return
+
+        del self._pending[job.key]
+        if job.queued:
+            job.queued = False
+            self._queued_count -= 1
+        elif job.task is None:
+            # waiting to be retried
+            pass
+        elif not any(
+            self._pending.get(other.key) is other for other in job.task.jobs()
+        ):
+            # nobody waits for this task anymore, its slot is freed once it returns
+            job.task.cancel()
+
+    def reprioritize(self, waiter: TranslationWaiter, priority: int):
+        waiter.priority = priority
+        job = self._pending.get(waiter.key)
+        if job is not None and waiter in job.waiters:
+            self._update_priority(job)
+
+    def _update_priority(self, job: TranslationJob):
+        # a job is as urgent as its most urgent waiter
+        priority = min(waiter.priority for waiter in job.waiters)
+        if priority != job.priority:
+            job.priority = priority
+            if job.queued:
+                self._push(job)
+
+    def _enqueue(self, job: TranslationJob):
+        job.enqueued = time.monotonic()
+        self._requeue(job)
+        self._schedule_dispatch()
+
+    def _requeue(self, job: TranslationJob):
+        job.queued = True
+        self._queued_count += 1
+        self._push(job)
+
+    def _push(self, job: TranslationJob):
+        job.queue_stamp = next(self._sequence)
+        heapq.heappush(self._queue, (job.priority, job.sequence, job.queue_stamp, job))
+
+    def _pop_queued(self) -> TranslationJob | None:
+        while self._queue:
+            _priority, _sequence, stamp, job = heapq.heappop(self._queue)
+            if job.queued and job.queue_stamp == stamp:
+                job.queued = False
+                self._queued_count -= 1
+                return job
+        return None
+
+    def _schedule_dispatch(self):
+        # wait for the rest of this event loop iteration so its requests can be batched
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            QTimer.singleShot(0, self._dispatch)
+
+    def _create_session(self) -> requests.Session:
+        # one keep-alive pool shared by every tab and window
+        session = requests.Session()
+        adapter = TimedHTTPAdapter(
+            pool_connections=4, pool_maxsize=MAX_CONCURRENT_REQUESTS_LIMIT
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _dispatch(self):
+        self._dispatch_scheduled = False
+        if self._throttle_timer.isActive():
+            return
+        while self._queued_count and self._active_count < self.concurrency_limit():
+            jobs = self._take_batch()
+            tokens = request_tokens(jobs)
+            if is_speculative(jobs[0]):
+                # everything still queued is speculative, see _take_batch
+                if not self._may_speculate(tokens):
+                    for job in jobs:
+                        self._requeue(job)
+                    return
+                self._speculative_budget.consume(tokens)
+                self._metrics.record_prefetch(len(jobs))
+            delay = self._rate_limiter.delay(tokens)
+            if delay > 0:
+                for job in jobs:
+                    self._requeue(job)
+                self._throttle_timer.start(int(delay * 1000) + 1)
+                return
+            self._rate_limiter.consume(tokens)
+            task = TranslatorTask(self, self._session, jobs, self._stream)
+            for job in jobs:
+                job.task = task
+            self._active_count += 1
+            self._running_tasks.add(task)
+            self._thread_pool.start(task)
+
+    def _may_speculate(self, tokens: int) -> bool:
+        # never take a worker or rate limit capacity a request could need
+        return (
+            self._active_count < self.concurrency_limit() - SPECULATIVE_RESERVED_WORKERS
+            and self._rate_limiter.delay(tokens) == 0
+            and self._speculative_budget.allows(tokens)
+        )
+
+    def _take_batch(self) -> list[TranslationJob]:
+        first = self._pop_queued()
+        jobs = [first]
+        if not first.batchable:
+            return jobs
+
+        # spread queued work over the idle workers instead of packing it into one call
+        idle_count = self.concurrency_limit() - self._active_count
+        max_segments = min(
+            BATCH_MAX_SEGMENTS, -(-(self._queued_count + 1) // idle_count)
+        )
+        tokens = estimate_tokens(first.text)
+        skipped = []
+        while len(jobs) < max_segments:
+            job = self._pop_queued()
+            if job is None:
+                break
+            job_tokens = estimate_tokens(job.text)
+            if (
+                job.batchable
+                and job.api_key == first.api_key
+                and job.backend is first.backend
+                and job.target_lang == first.target_lang
+                and is_speculative(job) == is_speculative(first)
+                and tokens + job_tokens <= BATCH_TOKEN_BUDGET
+            ):
+                jobs.append(job)
+                tokens += job_tokens
+            else:
+                skipped.append(job)
+        for job in skipped:
+            self._requeue(job)
+        return jobs
+
+    def _lookup(self, key: str) -> str | None:
+        translated_text = self._memory_cache.get(key)
+        if translated_text is not None:
+            self._memory_cache.move_to_end(key)
+            self._metrics.record(TranslationMetricsRecord("memory"))
+            return translated_text
+
+        translated_text = get_translation_cache().get(key)
+        if translated_text is not None:
+            self._remember(key, translated_text)
+            self._metrics.record(TranslationMetricsRecord("disk"))
+        return translated_text
+
+    def _remember(self, key: str, translated_text: str):
+        self._memory_cache[key] = translated_text
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > MEMORY_CACHE_MAX_ENTRIES:
+            self._memory_cache.popitem(last=False)
+
+    def _expire_waiters(self):
+        if not self._pending:
+            self._deadline_timer.stop()
+            return
+
+        now = time.monotonic()
+        expired = [
+            (job, waiter)
+            for job in self._pending.values()
+            for waiter in job.waiters
+            if waiter.deadline <= now
+        ]
+        for job, waiter in expired:
+            self.cancel(waiter)
+            waiter.on_complete("", "Translation timeout")
+            if waiter.priority >= SPECULATIVE_PRIORITY:
+                continue
+            self._metrics.record(
+                TranslationMetricsRecord(
+                    "miss",
+                    total=now - job.created,
+                    retries=job.attempts,
+                    error="Translation timeout",
+                )
+            )
+
+    @Slot(object, str)
+    def _handle_task_progress(self, job: TranslationJob, partial_text: str):
+        if self._pending.get(job.key) is job:
+            for waiter in job.waiters:
+                if waiter.on_progress:
+                    waiter.on_progress(partial_text)
+
+    @Slot(object, object)
+    def _handle_task_finished(
+        self, task: TranslatorTask, results: list[TranslationResult]
+    ):
+        self._active_count -= 1
+        self._running_tasks.discard(task)
+        self._connection_used = time.monotonic()
+        if self._warm_backend is not None:
+            self._keep_warm_until = self._connection_used + KEEP_WARM_DURATION
+
+        self._rate_limiter.update(task.headers)
+        if any(result.transient for result in results):
+            self._concurrency.on_throttle()
+        elif task.status == 200 and not task.cancelled():
+            self._concurrency.on_success(
+                task.latency, request_tokens([result.job for result in results])
+            )
+        retry_after = parse_retry_after(task.headers)
+        prompt_tokens = task.usage.get("prompt_tokens", 0)
+        completion_tokens = task.usage.get("completion_tokens", 0)
+        self._metrics.record_request(prompt_tokens, completion_tokens)
+        translated = [
+            (result.job.text, result.translated_text)
+            for result in results
+            if result.translated_text
+        ]
+        if translated:
+            # the jobs of one task share their language and backend
+            job = results[0].job
+            self._memory_pool.start(
+                MemoryWriteTask(translated, memory_scope(job.target_lang, job.backend))
+            )
+
+        for result in results:
+            job = result.job
+            if result.translated_text:
+                self._remember(job.key, result.translated_text)
+                get_translation_cache().put(job.key, result.translated_text)
+
+            # the job was cancelled while it was running
+            if self._pending.get(job.key) is not job:
+                continue
+
+            if result.retry:
+                job.batchable = False
+                job.task = None
+                self._enqueue(job)
+                continue
+
+            if result.transient and self._schedule_retry(job, retry_after):
+                continue
+
+            del self._pending[job.key]
+            for waiter in job.waiters:
+                waiter.on_complete(result.translated_text, result.error)
+            if is_speculative(job):
+                continue
+            self._metrics.record(
+                TranslationMetricsRecord(
+                    "miss",
+                    queue_wait=task.started - job.enqueued,
+                    connect=task.connect,
+                    ttfb=task.ttfb,
+                    request=task.latency,
+                    total=time.monotonic() - job.created,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    batch_size=len(results),
+                    retries=job.attempts,
+                    error=result.error,
+                )
+            )
+
+        self._dispatch()
+
+    def _schedule_retry(self, job: TranslationJob, retry_after: float | None) -> bool:
+        if job.attempts >= MAX_RETRIES:
+            return False
+        delay = backoff_delay(job.attempts, retry_after)
+        if time.monotonic() + delay >= job.deadline():
+            return False
+        job.attempts += 1
+        job.task = None
+        QTimer.singleShot(int(delay * 1000), partial(self._retry, job))
+        return True
+
+    def _retry(self, job: TranslationJob):
+        # skip jobs that were cancelled or timed out while waiting
+        if self._pending.get(job.key) is job and job.task is None and not job.queued:
+            self._enqueue(job)
+
+
+_engine: TranslationEngine | None = None
+
+
+def get_translation_engine() -> TranslationEngine:
+    global _engine
+    if _engine is None:
+        _engine = TranslationEngine()
+    return _engine
@@ -0,0 +1,417 @@
+from __future__ import annotations
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable
+import hashlib
+import os
+import re
+import sqlite3
+import struct
+import threading
+import zlib
+
+from PySide6.QtCore import QStandardPaths
+
+MEMORY_FILE_NAME = "translation_memory.sqlite3"
+MEMORY_MAX_BYTES = 64 * 1024 * 1024
+# bumped when the tables change, a memory of another version is started over
+MEMORY_SCHEMA_VERSION = 2
+MEMORY_MMAP_BYTES = 1 << 30
+# one permutation MinHash: every shingle is hashed once into one of SIGNATURE_SIZE
+# bins, and the bins are split into LSH bands of BAND_ROWS bins each
+SIGNATURE_SIZE = 24
+BAND_ROWS = 3
+BAND_COUNT = SIGNATURE_SIZE // BAND_ROWS
+# what a segment's signature and band rows add to the size of its texts
+SIGNATURE_BYTES = SIGNATURE_SIZE * 8 + BAND_COUNT * 16
+# estimated Jaccard similarity of the shingles above which an earlier translation
+# is sent along as a reference
+REFERENCE_SIMILARITY = 0.6
+# the newest segments of each band bucket are candidates, so that text every page
+# repeats can't make a lookup slow, and the ones sharing the most bands are compared;
+# whatever the size of the memory, a lookup reads at most BAND_COUNT *
+# MAX_BUCKET_CANDIDATES band rows and MAX_CANDIDATES signatures
+MAX_BUCKET_CANDIDATES = 16
+MAX_CANDIDATES = 8
+# tokens that are copied unchanged into a translation, and so can be substituted:
+# URLs, e-mail addresses, numbers, versions and dates, hashes and code identifiers
+VARIABLE_TOKEN = re.compile(
+    r"https?://\S*[^\s.,;:!?)\]'\"]"
+    r"|[\w.+-]+@[\w-]+(?:\.[\w-]+)+"
+    r"|(?<![0-9A-Za-z_])[vV]?\d+(?:[.,:/-]\d+)*(?![0-9A-Za-z_])"
+    r"|(?<![0-9A-Za-z_])(?=[0-9a-f]*\d)[0-9a-f]{7,40}(?![0-9A-Za-z_])"
+    r"|(?<![0-9A-Za-z_])[A-Za-z][A-Za-z0-9]*(?:_[A-Za-z0-9]+)+(?![0-9A-Za-z_])"
+    r"|(?<![0-9A-Za-z_])[a-z]+[A-Z][A-Za-z0-9]*(?![0-9A-Za-z_])"
+)
+VARIABLE_PLACEHOLDER = "\x00"
+WORD = re.compile(r"\S+")
+WORD_PUNCTUATION = "\"'()[]{}<>.,;:!?"
+# CJK characters one by one, other scripts word by word
+SHINGLE_TOKEN = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff]|[^\W_]+|\x00")
+TOKEN_HASHES_MAX_ENTRIES = 100_000
+MASK64 = (1 << 64) - 1
+EMPTY_BIN = MASK64
+FNV_PRIME = 0x100000001B3
+BAND_QUERY = " UNION ALL ".join(
+    [
+        "SELECT * FROM (SELECT segment_id FROM bands WHERE band_key = ?"
+        f" ORDER BY segment_id DESC LIMIT {MAX_BUCKET_CANDIDATES})"
+    ]
+    * BAND_COUNT
+)
+
+
+def may_be_variable(word: str) -> bool:
+    # most words are letters only with at most a leading capital, and skip the regex
+    letters = word.strip(WORD_PUNCTUATION)
+    if letters.isalpha():
+        rest = letters[1:]
+        return rest != rest.lower() and not letters.isupper()
+    return True
+
+
+def variable_tokens(text: str) -> list[str]:
+    return [
+        token
+        for word in text.split()
+        if may_be_variable(word)
+        for token in VARIABLE_TOKEN.findall(word)
+    ]
+
+
+def template(text: str) -> str:
+    # the normalized text with every variable token replaced by one placeholder
+    return " ".join(
+        (
+            VARIABLE_TOKEN.sub(VARIABLE_PLACEHOLDER, word)
+            if may_be_variable(word)
+            else word
+        )
+        for word in text.split()
+    )
+
+
+def token_hash(token: str) -> int:
+    # crc32 is stable across runs, and pages repeat most of their words
+    value = _token_hashes.get(token)
+    if value is None:
+        if len(_token_hashes) >= TOKEN_HASHES_MAX_ENTRIES:
+            _token_hashes.clear()
+        value = _token_hashes[token] = zlib.crc32(token.encode("utf8"))
+    return value
+
+
+def signature(template: str) -> tuple[int, ...] | None:
+    # None for text too short to compare by its shingles
+    tokens = SHINGLE_TOKEN.findall(template.lower())
+    if len(tokens) < 2:
+        return None
+    hashes = [token_hash(token) for token in tokens]
+    bins = [EMPTY_BIN] * SIGNATURE_SIZE
+    # the shingles are pairs of adjacent tokens, a repeated one changes no minimum
+    for a, b in zip(hashes, hashes[1:]):
+        value = (((a << 32) | b) * 0x9E3779B97F4A7C15) & MASK64
+        index = (value >> 40) % SIGNATURE_SIZE
+        if value < bins[index]:
+            bins[index] = value
+    # an empty bin borrows from the next filled one, offset by the distance
+    filled = [index for index, value in enumerate(bins) if value != EMPTY_BIN]
+    for index in range(SIGNATURE_SIZE):
+        if bins[index] == EMPTY_BIN:
+            source = filled[bisect_right(filled, index) % len(filled)]
+            distance = (source - index) % SIGNATURE_SIZE
+            bins[index] = (bins[source] + distance * 0x2545F4914F6CDD1D) & MASK64
+    return tuple(bins)
+
+
+def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    return sum(x == y for x, y in zip(a, b)) / SIGNATURE_SIZE
+
+
+def band_keys(scope: str, signature: tuple[int, ...]) -> list[int]:
+    # the scope keeps segments of other languages and backends out of the candidates
+    scope_hash = zlib.crc32(scope.encode("utf8"))
+    keys = []
+    for band in range(BAND_COUNT):
+        key = scope_hash ^ (band << 32)
+        for value in signature[band * BAND_ROWS : (band + 1) * BAND_ROWS]:
+            key = ((key ^ value) * FNV_PRIME) & MASK64
+        # sqlite integers are signed
+        keys.append(key - (1 << 64) if key >> 63 else key)
+    return keys
+
+
+def template_key(scope: str, template: str) -> int:
+    digest = hashlib.blake2b(
+        f"{scope}\x00{template}".encode("utf8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def substitute(source: str, translated_text: str, text: str) -> str | None:
+    # 'translated_text' of 'source' with the variable tokens of 'text' in place of
+    # those of 'source', or None when they can't all be found in the translation
+    old_values = variable_tokens(source)
+    new_values = variable_tokens(text)
+    if len(old_values) != len(new_values):
+        return None
+    replacements: dict[str, str] = {}
+    for old, new in zip(old_values, new_values):
+        if replacements.setdefault(old, new) != new:
+            return None
+    if not replacements:
+        return translated_text
+
+    found = Counter()
+
+    def replace_token(match: re.Match) -> str:
+        token = match.group()
+        if token in replacements:
+            found[token] += 1
+            return replacements[token]
+        return token
+
+    def replace_word(match: re.Match) -> str:
+        word = match.group()
+        if may_be_variable(word):
+            return VARIABLE_TOKEN.sub(replace_token, word)
+        return word
+
+    # the translation keeps its line breaks
+    reused_text = WORD.sub(replace_word, translated_text)
+    if found != Counter(old_values):
+        return None
+    return reused_text
+
+
+@dataclass
+class MemoryMatch:
+    source: str
+    translated_text: str
+    similarity: float
+    # the translation with the looked up text's variable tokens, when it can be used as is
+    reused_text: str | None = None
+
+
+def segment_size(
+    source: str, translated_text: str, signature: tuple[int, ...] | None
+) -> int:
+    size = len(source.encode("utf8")) + len(translated_text.encode("utf8"))
+    return size + (SIGNATURE_BYTES if signature is not None else 0)
+
+
+class TranslationMemory:
+    # lookup() runs on the thread that calls it, while add_many() and clear() may
+    # run on any thread and go through their own connection, one call at a time;
+    # the file is in WAL mode, so lookups read the last commit without waiting
+    _connection: sqlite3.Connection
+    _write_connection: sqlite3.Connection
+    _write_lock: threading.Lock
+    _max_bytes: int
+    _total_bytes: int
+    _segment_count: int
+
+    def __init__(self, path: str, max_bytes: int = MEMORY_MAX_BYTES):
+        self._max_bytes = max_bytes
+        self._write_lock = threading.Lock()
+        self._write_connection = sqlite3.connect(path, check_same_thread=False)
+        self._write_connection.execute("PRAGMA journal_mode=WAL")
+        self._write_connection.execute("PRAGMA synchronous=NORMAL")
+        (version,) = self._write_connection.execute("PRAGMA user_version").fetchone()
+        if version != MEMORY_SCHEMA_VERSION:
+            self._write_connection.execute("DROP TABLE IF EXISTS segments")
+            self._write_connection.execute("DROP TABLE IF EXISTS bands")
+            self._write_connection.execute(
+                f"PRAGMA user_version={MEMORY_SCHEMA_VERSION}"
+            )
+        self._write_connection.execute(
+            "CREATE TABLE IF NOT EXISTS segments ("
+            " id INTEGER PRIMARY KEY,"
+            " scope TEXT NOT NULL,"
+            " template_key INTEGER NOT NULL,"
+            " source TEXT NOT NULL,"
+            " translated_text TEXT NOT NULL,"
+            " signature BLOB,"
+            " size INTEGER NOT NULL)"
+        )
+        self._write_connection.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS segments_template_key"
+            " ON segments (template_key)"
+        )
+        self._write_connection.execute(
+            "CREATE TABLE IF NOT EXISTS bands ("
+            " band_key INTEGER NOT NULL,"
+            " segment_id INTEGER NOT NULL,"
+            " PRIMARY KEY (band_key, segment_id)) WITHOUT ROWID"
+        )
+        self._write_connection.commit()
+        row = self._write_connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM segments"
+        ).fetchone()
+        self._segment_count, self._total_bytes = row
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        # lookups read a few pages all over the file, mapping it saves their copies
+        self._connection.execute(f"PRAGMA mmap_size={MEMORY_MMAP_BYTES}")
+
+    def lookup(self, text: str, scope: str) -> MemoryMatch | None:
+        text_template = template(text)
+        row = self._connection.execute(
+            "SELECT source, translated_text FROM segments WHERE template_key = ?",
+            (template_key(scope, text_template),),
+        ).fetchone()
+        if row is not None:
+            reused_text = substitute(row[0], row[1], text)
+            if reused_text is not None:
+                return MemoryMatch(row[0], row[1], 1.0, reused_text)
+
+        text_signature = signature(text_template)
+        if text_signature is None:
+            return None
+        rows = self._connection.execute(
+            BAND_QUERY, band_keys(scope, text_signature)
+        ).fetchall()
+        if not rows:
+            return None
+        candidates = [
+            segment_id
+            for segment_id, _count in Counter(
+                segment_id for (segment_id,) in rows
+            ).most_common(MAX_CANDIDATES)
+        ]
+        rows = self._connection.execute(
+            "SELECT id, signature FROM segments"
+            f" WHERE id IN ({', '.join('?' * len(candidates))})",
+            candidates,
+        ).fetchall()
+        best_id, best_similarity = None, REFERENCE_SIMILARITY
+        for segment_id, packed in rows:
+            score = similarity(text_signature, unpack_signature(packed))
+            if score >= best_similarity:
+                best_id, best_similarity = segment_id, score
+        if best_id is None:
+            return None
+        # only the best candidate's text is read
+        source, translated_text = self._connection.execute(
+            "SELECT source, translated_text FROM segments WHERE id = ?", (best_id,)
+        ).fetchone()
+        return MemoryMatch(source, translated_text, best_similarity)
+
+    def add(self, text: str, translated_text: str, scope: str):
+        self.add_many([(text, translated_text)], scope)
+
+    def add_many(self, entries: Iterable[tuple[str, str]], scope: str):
+        with self._write_lock:
+            self._add_many(entries, scope)
+
+    def _add_many(self, entries: Iterable[tuple[str, str]], scope: str):
+        connection = self._write_connection
+        for text, translated_text in entries:
+            text_template = template(text)
+            text_signature = signature(text_template)
+            key = template_key(scope, text_template)
+            size = segment_size(text, translated_text, text_signature)
+            row = connection.execute(
+                "SELECT id, size FROM segments WHERE template_key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                # same template, same signature, only the latest translation is kept
+                connection.execute(
+                    "UPDATE segments SET source = ?, translated_text = ?, size = ?"
+                    " WHERE id = ?",
+                    (text, translated_text, size, row[0]),
+                )
+                self._total_bytes += size - row[1]
+                continue
+
+            cursor = connection.execute(
+                "INSERT INTO segments"
+                " (scope, template_key, source, translated_text, signature, size)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    scope,
+                    key,
+                    text,
+                    translated_text,
+                    pack_signature(text_signature),
+                    size,
+                ),
+            )
+            self._segment_count += 1
+            self._total_bytes += size
+            if text_signature is not None:
+                connection.executemany(
+                    "INSERT OR IGNORE INTO bands (band_key, segment_id) VALUES (?, ?)",
+                    [
+                        (band_key, cursor.lastrowid)
+                        for band_key in band_keys(scope, text_signature)
+                    ],
+                )
+        if self._total_bytes > self._max_bytes:
+            self._evict()
+        connection.commit()
+
+    def segment_count(self) -> int:
+        return self._segment_count
+
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def clear(self):
+        with self._write_lock:
+            self._write_connection.execute("DELETE FROM segments")
+            self._write_connection.execute("DELETE FROM bands")
+            self._write_connection.commit()
+            self._segment_count = 0
+            self._total_bytes = 0
+
+    def _evict(self):
+        # drop the oldest segments until we are back under 90% of the budget
+        target = self._max_bytes * 0.9
+        cursor = self._write_connection.execute(
+            "SELECT id, scope, signature, size FROM segments ORDER BY id"
+        )
+        evicted = []
+        bands = []
+        for segment_id, scope, packed, size in cursor:
+            if self._total_bytes <= target:
+                break
+            evicted.append((segment_id,))
+            if packed is not None:
+                bands.extend(
+                    (band_key, segment_id)
+                    for band_key in band_keys(scope, unpack_signature(packed))
+                )
+            self._total_bytes -= size
+        cursor.close()
+        self._write_connection.executemany(
+            "DELETE FROM bands WHERE band_key = ? AND segment_id = ?", bands
+        )
+        self._write_connection.executemany("DELETE FROM segments WHERE id = ?", evicted)
+        self._segment_count -= len(evicted)
+
+
+def pack_signature(signature: tuple[int, ...] | None) -> bytes | None:
+    if signature is None:
+        return None
+    return struct.pack(f"<{SIGNATURE_SIZE}Q", *signature)
+
+
+def unpack_signature(packed: bytes) -> tuple[int, ...]:
+    return struct.unpack(f"<{SIGNATURE_SIZE}Q", packed)
+
+
+_token_hashes: dict[str, int] = {}
+_memory: TranslationMemory | None = None
+
+
+def get_translation_memory() -> TranslationMemory:
+    global _memory
+    if _memory is None:
+        directory = QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.CacheLocation
+        )
+        os.makedirs(directory, exist_ok=True)
+        _memory = TranslationMemory(os.path.join(directory, MEMORY_FILE_NAME))
+    return _memory
@@ -0,0 +1,228 @@
+from __future__ import annotations
+from collections import deque
+from dataclasses import asdict, dataclass, field
+import bisect
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# upper bucket bounds in milliseconds, values above the last go to an overflow bucket
+HISTOGRAM_BOUNDS_MS = [
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 60000
+]  # fmt: skip
+WINDOW_SECONDS = 300
+SLICE_SECONDS = 30
+RECENT_MAX_ENTRIES = 200
+TIMINGS = ("queue_wait", "connect", "ttfb", "request", "total")
+# ttfb split by whether the request had to open a connection or found a warm one
+CONNECTION_TIMINGS = ("ttfb_new_connection", "ttfb_reused_connection")
+
+_connection_timing = threading.local()
+
+
+def reset_connect_time():
+    _connection_timing.connect = 0.0
+
+
+def connect_time() -> float:
+    # seconds spent opening connections on this thread since reset_connect_time()
+    return getattr(_connection_timing, "connect", 0.0)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _connection_timing.connect = connect_time() + time.perf_counter() - start
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    # includes the TLS handshake
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _connection_timing.connect = connect_time() + time.perf_counter() - start
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kw):
+        super().init_poolmanager(*args, **kw)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+class RollingHistogram:
+    # bucket counts per time slice, slices older than the window are dropped
+    _slices: deque[tuple[float, list[int], list[float]]]
+
+    def __init__(self):
+        self._slices = deque()
+
+    def add(self, value_ms: float):
+        now = time.monotonic()
+        self._expire(now)
+        if not self._slices or now - self._slices[-1][0] >= SLICE_SECONDS:
+            self._slices.append((now, [0] * (len(HISTOGRAM_BOUNDS_MS) + 1), [0.0]))
+        _start, counts, total = self._slices[-1]
+        counts[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, value_ms)] += 1
+        total[0] += value_ms
+
+    def _expire(self, now: float):
+        while self._slices and now - self._slices[0][0] >= WINDOW_SECONDS:
+            self._slices.popleft()
+
+    def counts(self) -> list[int]:
+        self._expire(time.monotonic())
+        counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        for _start, slice_counts, _total in self._slices:
+            for i, count in enumerate(slice_counts):
+                counts[i] += count
+        return counts
+
+    def snapshot(self) -> dict:
+        counts = self.counts()
+        count = sum(counts)
+        total = sum(slice_total[0] for _start, _counts, slice_total in self._slices)
+        return {
+            "count": count,
+            "mean_ms": total / count if count else 0.0,
+            "p50_ms": self._percentile(counts, count, 0.50),
+            "p95_ms": self._percentile(counts, count, 0.95),
+            "p99_ms": self._percentile(counts, count, 0.99),
+            "buckets": [
+                {"le_ms": bound, "count": bucket_count}
+                for bound, bucket_count in zip(HISTOGRAM_BOUNDS_MS + [None], counts)
+            ],
+        }
+
+    def _percentile(self, counts: list[int], count: int, fraction: float) -> float:
+        # interpolated linearly inside the bucket that holds the percentile
+        if not count:
+            return 0.0
+        rank = fraction * count
+        seen = 0
+        for i, bucket_count in enumerate(counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = HISTOGRAM_BOUNDS_MS[i - 1] if i else 0
+                if i == len(HISTOGRAM_BOUNDS_MS):
+                    return lower
+                upper = HISTOGRAM_BOUNDS_MS[i]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return HISTOGRAM_BOUNDS_MS[-1]
+
+
+@dataclass
+class TranslationMetricsRecord:
+    # "memory" or "disk" for cache hits, "reuse" for the translation of a similar text
+    # with its numbers, dates and identifiers substituted, "miss" for translations
+    # that were requested
+    cache: str
+    # seconds, all zero for cache hits
+    queue_wait: float = 0.0
+    connect: float = 0.0
+    ttfb: float = 0.0
+    request: float = 0.0
+    total: float = 0.0
+    # as reported in the response's 'usage', for the whole batch
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    batch_size: int = 0
+    retries: int = 0
+    error: str = ""
+    finished_at: float = field(default_factory=time.time)
+
+
+class TranslationMetrics:
+    _histograms: dict[str, RollingHistogram]
+    _counters: dict[str, int]
+    _recent: deque[TranslationMetricsRecord]
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._histograms = {
+            name: RollingHistogram() for name in TIMINGS + CONNECTION_TIMINGS
+        }
+        self._counters = dict.fromkeys(
+            (
+                "memory_hits",
+                "disk_hits",
+                "reuse_hits",
+                "misses",
+                "requests",
+                "retries",
+                "errors",
+                "prompt_tokens",
+                "completion_tokens",
+                "warm_ups",
+                "prefetches",
+                "references",
+            ),
+            0,
+        )
+        self._recent = deque(maxlen=RECENT_MAX_ENTRIES)
+
+    def record(self, record: TranslationMetricsRecord):
+        self._recent.append(record)
+        if record.cache != "miss":
+            self._counters[f"{record.cache}_hits"] += 1
+            return
+
+        self._counters["misses"] += 1
+        self._counters["retries"] += record.retries
+        if record.error:
+            self._counters["errors"] += 1
+        # failed translations may not have got as far as sending a request
+        for name in ("total",) if record.error else TIMINGS:
+            self._histograms[name].add(getattr(record, name) * 1000)
+        if not record.error:
+            name = "ttfb_new_connection" if record.connect else "ttfb_reused_connection"
+            self._histograms[name].add(record.ttfb * 1000)
+
+    def record_request(self, prompt_tokens: int, completion_tokens: int):
+        self._counters["requests"] += 1
+        self._counters["prompt_tokens"] += prompt_tokens
+        self._counters["completion_tokens"] += completion_tokens
+
+    def record_warm_up(self):
+        self._counters["warm_ups"] += 1
+
+    def record_prefetch(self, count: int):
+        self._counters["prefetches"] += count
+
+    def record_reference(self):
+        self._counters["references"] += 1
+
+    def counters(self) -> dict[str, int]:
+        return dict(self._counters)
+
+    def histograms(self) -> dict[str, dict]:
+        return {
+            name: histogram.snapshot() for name, histogram in self._histograms.items()
+        }
+
+    def recent(self) -> list[TranslationMetricsRecord]:
+        return list(self._recent)
+
+    def snapshot(self) -> dict:
+        return {
+            "window_seconds": WINDOW_SECONDS,
+            "counters": self.counters(),
+            "histograms": self.histograms(),
+            "recent": [asdict(record) for record in self._recent],
+        }
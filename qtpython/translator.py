@@ -1,101 +1,190 @@
 from PySide6.QtCore import QObject
 from PySide6.QtCore import Slot
 from PySide6.QtCore import QFile
-from PySide6.QtCore import QThread
 from PySide6.QtCore import Signal
-import json
-import requests
-from settings import get_settings, API_KEY, TARGET_LANG
-import resources.scripts
-
-
-class TranslatorWorker(QThread):
-    result = Signal(str)
-
-    def __init__(self, text: str, api_key: str, target_lang: str):
-        super().__init__()
-        self._text = text
-        self._api_key = api_key
-        self._target_lang = target_lang
-
-    def run(self):
-        languages = {
-            "ko": "한국어",
-            "en": "English",
-            "ja": "日本語",
-            "zh": "中文",
-            "es": "Español",
-            "fr": "Français",
-            "de": "Deutsch",
-        }
-
-        try:
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self._api_key}",
-                },
-                json={
-                    "model": "gpt-4o-mini",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": f"You are a translator. Translate the given text to {languages[self._target_lang]}. Only respond with the translated text, without any additional explanation or context.",
-                        },
-                        {
-                            "role": "user",
-                            "content": self._text,
-                        },
-                    ],
-                },
-                timeout=30,
-            )
-
-            response.raise_for_status()
-            data = response.json()
-            translated_text = data["choices"][0]["message"]["content"].strip()
-
-            self.result.emit(
-                json.dumps({"worker": id(self), "translated_text": translated_text})
-            )
-        except Exception as e:
-            self.result.emit(json.dumps({"worker": id(self), "error": str(e)}))
+from PySide6.QtCore import QTimer
+from functools import cache, partial
+import time
+from settings import (
+    get_settings,
+    is_speculative_translation_enabled,
+    API_KEY,
+    TARGET_LANG,
+)
+from translationengine import (
+    TRANSLATION_TIMEOUT,
+    TranslationWaiter,
+    get_translation_engine,
+)
 
 
 class TranslatorBridge(QObject):
-    translationComplete = Signal(str)
-    _workers: list[TranslatorWorker]
+    # list of result maps, all the results of one event loop iteration together:
+    # {"request": id, "translated_text": text} or {"request": id, "error": message}
+    # when a translation is done, {"request": id, "partial_text": text} while it streams
+    translationResults = Signal(list)
+    # done count, total count and elapsed milliseconds of a whole-page translation
+    page_translation_progress = Signal(int, int, int)
+    # whether translation is enabled for the page, set by its web view
+    _enabled: bool
+    _next_request_id: int
+    _waiters: dict[int, TranslationWaiter]
+    # the latest result of each request since the last flush, in arrival order
+    _pending_results: dict[int, dict]
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._workers = []
-
-    @Slot(str, result=str)  # type: ignore
-    def translate(self, text: str) -> str:
+        self._enabled = False
+        self._next_request_id = 1
+        self._waiters = {}
+        self._pending_results = {}
+
+    def set_enabled(self, enabled: bool):
+        # requests the page sends after translation was disabled are rejected
+        self._enabled = enabled
+        if not enabled:
+            self.cancel_all()
+
+    @Slot(str, result=dict)  # type: ignore
+    def translate(self, text: str) -> dict:
+        if not self._enabled:
+            return {"error": "Translation is disabled"}
         if not text:
-            return json.dumps({"error": "No text provided"})
+            return {"error": "No text provided"}
 
         settings = get_settings()
         api_key = settings.value(API_KEY, "")
         target_lang = settings.value(TARGET_LANG, "ko")
-        if not api_key:
-            return json.dumps({"error": "No API key provided"})
-
-        worker = TranslatorWorker(text, api_key, target_lang)
-        worker.result.connect(self.translationComplete.emit)
-        worker.finished.connect(lambda: self._workers.remove(worker))
-        self._workers.append(worker)
-        worker.start()
-        return json.dumps({"worker": id(worker)})
-
-
-file = QFile(":/qtwebchannel/qwebchannel.js")
-file.open(QFile.OpenModeFlag.ReadOnly)
-qwebchannel_script = bytes(file.readAll().data()).decode("utf8")
-file.close()
-
-file = QFile(":translator.js")
-file.open(QFile.OpenModeFlag.ReadOnly)
-translator_script = bytes(file.readAll().data()).decode("utf8")
-file.close()
+        if (
+            not api_key
+            and get_translation_engine().backend(target_lang).requires_api_key()
+        ):
+            return {"error": "No API key provided"}
+
+        return self._translate(text, api_key, target_lang)
+
+    @Slot(list, list, result=dict)  # type: ignore
+    def translateBatch(self, texts: list[str], priorities: list[int]) -> dict:
+        if not self._enabled:
+            return {"error": "Translation is disabled"}
+        if len(priorities) != len(texts):
+            # every text needs its priority, zip() would drop the rest silently
+            return {"error": "Texts and priorities differ in length"}
+        settings = get_settings()
+        api_key = settings.value(API_KEY, "")
+        target_lang = settings.value(TARGET_LANG, "ko")
+        if (
+            not api_key
+            and get_translation_engine().backend(target_lang).requires_api_key()
+        ):
+            return {"error": "No API key provided"}
+
+        results = []
+        for text, priority in zip(texts, priorities):
+            if text:
+                results.append(
+                    self._translate(text, api_key, target_lang, int(priority))
+                )
+            else:
+                results.append({"error": "No text provided"})
+        return {"results": results}
+
+    @Slot(list)
+    def prefetch(self, texts: list[str]):
+        # text the user is likely to translate next, only cached for now
+        if not self._enabled or not is_speculative_translation_enabled():
+            return
+        settings = get_settings()
+        api_key = settings.value(API_KEY, "")
+        target_lang = settings.value(TARGET_LANG, "ko")
+        engine = get_translation_engine()
+        if not api_key and engine.backend(target_lang).requires_api_key():
+            return
+        for text in texts:
+            if text:
+                engine.prefetch(text, api_key, target_lang)
+
+    @Slot(dict)
+    def reprioritize(self, priorities: dict):
+        # request id to priority, lower values are sent first
+        engine = get_translation_engine()
+        for request_id, priority in priorities.items():
+            waiter = self._waiters.get(int(request_id))
+            if waiter:
+                engine.reprioritize(waiter, int(priority))
+
+    def _translate(
+        self, text: str, api_key: str, target_lang: str, priority: int = 0
+    ) -> dict:
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        waiter = TranslationWaiter(
+            partial(self._complete, request_id),
+            partial(self._progress, request_id),
+            time.monotonic() + TRANSLATION_TIMEOUT,
+            priority,
+        )
+        translated_text = get_translation_engine().translate(
+            text, api_key, target_lang, waiter
+        )
+        if translated_text is not None:
+            return {"translated_text": translated_text}
+        self._waiters[request_id] = waiter
+        return {"request": request_id, "timeout": int(TRANSLATION_TIMEOUT * 1000)}
+
+    @Slot(int, int, int)
+    def reportPageProgress(self, done: int, total: int, elapsed: int):
+        self.page_translation_progress.emit(done, total, elapsed)
+
+    @Slot(int)
+    def cancel(self, request_id: int):
+        waiter = self._waiters.pop(request_id, None)
+        self._pending_results.pop(request_id, None)
+        if waiter:
+            get_translation_engine().cancel(waiter)
+
+    def has_pending(self) -> bool:
+        return bool(self._waiters)
+
+    def cancel_all(self):
+        engine = get_translation_engine()
+        for waiter in self._waiters.values():
+            engine.cancel(waiter)
+        self._waiters.clear()
+        self._pending_results.clear()
+
+    def _complete(self, request_id: int, translated_text: str, error: str):
+        self._waiters.pop(request_id, None)
+        if error:
+            result = {"request": request_id, "error": error}
+        else:
+            result = {"request": request_id, "translated_text": translated_text}
+        self._queue_result(result)
+
+    def _progress(self, request_id: int, partial_text: str):
+        self._queue_result({"request": request_id, "partial_text": partial_text})
+
+    def _queue_result(self, result: dict):
+        if not self._pending_results:
+            QTimer.singleShot(0, self, self._flush_results)
+        self._pending_results[result["request"]] = result
+
+    def _flush_results(self):
+        results = list(self._pending_results.values())
+        self._pending_results.clear()
+        if results:
+            self.translationResults.emit(results)
+
+
+@cache
+def injected_script() -> str:
+    # qwebchannel.js and translator.js, read the first time a page needs them
+    import resources.scripts
+
+    script = ""
+    for path in (":/qtwebchannel/qwebchannel.js", ":translator.js"):
+        file = QFile(path)
+        file.open(QFile.OpenModeFlag.ReadOnly)
+        script += bytes(file.readAll().data()).decode("utf8")
+        file.close()
+    return script